@@ -261,6 +261,9 @@ _FIELD_COMMENTS: dict[str, str] = {
     "scanning.test.targets.min_coverage_fraction": (
         "Minimum fraction of impl lines that must be covered (0.0 to 1.0)"
     ),
+    "scanning.test.targets.coverage_reader": (
+        '"api" (default) | "direct" -- how a .coverage SQLite database is read'
+    ),
     "scanning.journey": "User journey file scanning",
     "scanning.journey.directories": "Directories to scan for journey files",
     "scanning.journey.file_patterns": "Glob patterns for journey files",
@@ -723,6 +723,30 @@ class IgnoreConfig:
 
         return False
 
+    def should_prune_dir(self, path: str | Path, scope: str = "global") -> bool:
+        """Check if everything beneath a directory is ignored.
+
+        True when a pattern matches one of the directory's path components.
+        Every path under such a directory carries that component too, so
+        ``should_ignore`` would reject each of them: a walk can skip the
+        directory without listing it. A pattern that matches only the
+        directory's full path string is not enough, since it need not match
+        the longer paths beneath it.
+
+        Args:
+            path: Directory path to check
+            scope: Context scope ("global", "spec", "code", "test")
+
+        Returns:
+            True if no path under ``path`` can survive ``should_ignore``
+        """
+        parts = Path(path).parts
+        return any(
+            fnmatch.fnmatch(part, pattern)
+            for pattern in self.get_patterns_for_scope(scope)
+            for part in parts
+        )
+
     def get_patterns_for_scope(self, scope: str) -> list[str]:
         """Get all patterns applicable to a scope (global + scope-specific).
 
@@ -472,6 +472,16 @@ class KeywordsSearchConfig(_StrictModel):
     min_length: int = 3
 
 
+class CursorsConfig(_StrictModel):
+    # Open MCP cursors kept per server: opening one more evicts the least
+    # recently used. Cursors idle for longer than ttl seconds are dropped
+    # (0: never), and the oldest are dropped while together they hold more
+    # than max_items items.
+    max_open: int = Field(default=16, ge=1)
+    ttl: int = Field(default=900, ge=0)
+    max_items: int = Field(default=1_000_000, ge=1)
+
+
 class ValidationConfig(_StrictModel):
     hash_mode: str = "normalized-text"
     hash_algorithm: str = "sha256"
@@ -534,6 +544,7 @@ class TestTargetConfig(_StrictModel):
     match: str = "source"  # "source" | "aggregate"
     credit_coverage: str = "off"  # "off" | "tested" | "verified" (lcov_tested dimension)
     min_coverage_fraction: float = 0.0  # [0.0, 1.0]
+    coverage_reader: str = "api"  # "api" | "direct" (.coverage SQLite only)
     # Implements: REQ-d00254-O
     # The origin this target's reporter counts lines from, when the producer
     # departs from the format's convention. Unset means the reporter's own
@@ -554,6 +565,13 @@ class TestTargetConfig(_StrictModel):
             raise ValueError('match must be "source" or "aggregate"')
         return v
 
+    @field_validator("coverage_reader")
+    @classmethod
+    def _check_coverage_reader(cls, v: str) -> str:
+        if v not in ("api", "direct"):
+            raise ValueError('coverage_reader must be "api" or "direct"')
+        return v
+
     @field_validator("credit_coverage")
     @classmethod
     def _check_credit(cls, v: str) -> str:
@@ -605,6 +623,18 @@ class DocsScanningConfig(ScanningKindConfig):
 # Implements: REQ-d00212-C
 class ScanningConfig(_StrictModel):
     skip: list[str] = Field(default_factory=list)
+    # Worker processes for the file parse stage of a build: 1 parses in the
+    # main process, 0 uses one worker per CPU. Above 1, federation associates
+    # are also built concurrently, each in its own process.
+    workers: int = Field(default=1, ge=0)
+    # Keep per-file parse results under .elspais/cache/parse/ and reuse them
+    # for files whose content, path and parser are unchanged. Associate graphs
+    # are kept under .elspais/cache/members/ and reused while the associate's
+    # commit, working tree and configuration are unchanged.
+    cache: bool = False
+    # Write each finished graph to .elspais/cache/graph.snapshot and load it
+    # instead of building while every federated repository is unchanged.
+    snapshot: bool = False
     spec: SpecScanningConfig = Field(default_factory=SpecScanningConfig)
     code: CodeScanningConfig = Field(default_factory=CodeScanningConfig)
     test: TestScanningConfig = Field(default_factory=TestScanningConfig)
@@ -728,6 +758,7 @@ class ElspaisConfig(_StrictModel):
     scanning: ScanningConfig = Field(default_factory=ScanningConfig)
     rules: RulesConfig = Field(default_factory=RulesConfig)
     keywords: KeywordsSearchConfig = Field(default_factory=KeywordsSearchConfig)
+    cursors: CursorsConfig = Field(default_factory=CursorsConfig)
     validation: ValidationConfig = Field(default_factory=ValidationConfig)
     changelog: ChangelogConfig = Field(default_factory=ChangelogConfig)
     output: OutputConfig = Field(default_factory=OutputConfig)
@@ -11,13 +11,16 @@ from __future__ import annotations
 
 from collections import deque
 from collections.abc import Callable, Iterator
-from dataclasses import InitVar, dataclass, field
 from enum import Enum
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
+from elspais.graph.edge_sets import FILE_PLACEMENT_EDGE_KINDS as _PLACEMENT_KINDS
+
 if TYPE_CHECKING:
     from elspais.graph.relations import Edge, EdgeKind
+    from elspais.graph.render import NodeText
 
 
 class NodeKind(Enum):
@@ -172,7 +175,31 @@ def make_step_id(journey_id: str, n: int) -> str:
     return f"{journey_id}/{n}"
 
 
-@dataclass
+# Shared read-only stand-in for an adjacency map a node has not needed yet.
+_EMPTY: Any = MappingProxyType({})
+
+# The content fields render.node_text() reads: a node's keywords, and the
+# label and text an assertion or remainder gives its parent's body.
+_TEXT_FIELDS = frozenset({"keywords", "label", "text"})
+
+
+def _remove_identical(adjacency: dict[GraphNode, list[Edge]], node: GraphNode, edge: Edge) -> bool:
+    """Remove ``edge`` itself (not an equal edge) from ``adjacency[node]``.
+
+    Drops ``node`` from the map once no edge to it remains.
+    """
+    edges = adjacency.get(node)
+    if edges is None:
+        return False
+    for i, e in enumerate(edges):
+        if e is edge:
+            del edges[i]
+            if not edges:
+                del adjacency[node]
+            return True
+    return False
+
+
 class GraphNode:
     """A node in the traceability graph.
 
@@ -187,6 +214,19 @@ class GraphNode:
     Line numbers are accessed via ``get_field("parse_line")`` and
     ``get_field("parse_end_line")``.
 
+    Nodes are slotted and compare by identity, so they are hashable and
+    can key dicts and sets. A graph holds one node per id, so identity
+    is the only equality it needs. Most nodes are leaves (CODE, TEST,
+    RESULT, REMAINDER), so the adjacency maps start as a shared empty
+    mapping and are allocated on first link, the metrics dict on first
+    set_metric(), and the uuid on first read.
+
+    Adjacency is kept in insertion-ordered dicts -- each child mapped to
+    the edges reaching it, each parent to the edges arriving from it -- so
+    membership, linking, unlinking and edge removal cost O(1) however
+    many children or parents a node has. Edges iterate grouped by the
+    node at their other end, in the order those nodes were first linked.
+
     Attributes:
         id: Unique identifier for this node (mutable via set_id()).
         kind: The type of node (requirement, assertion, etc.).
@@ -196,41 +236,103 @@ class GraphNode:
     Use set_id() for ID mutations.
     """
 
+    __slots__ = (
+        "id",
+        "kind",
+        "_uuid",
+        "_label",
+        "_children",
+        "_parents",
+        "_edges_by_kind",
+        "_file",
+        "_text",
+        "_content",
+        "_metrics",
+    )
+
     id: str
     kind: NodeKind
-    label: InitVar[str] = ""  # Constructor parameter, stored in _label
-    uuid: str = field(default_factory=lambda: uuid4().hex)
-
-    # Label stored internally - use get_label()/set_label() or label property
-    _label: str = field(default="", init=False)
-
-    # Internal storage (prefixed) - excluded from constructor
-    _children: list[GraphNode] = field(default_factory=list, init=False)
-    _parents: list[GraphNode] = field(default_factory=list, init=False, repr=False)
-    _outgoing_edges: list[Edge] = field(default_factory=list, init=False, repr=False)
-    _incoming_edges: list[Edge] = field(default_factory=list, init=False, repr=False)
-    _content: dict[str, Any] = field(default_factory=dict, init=False)
-    _metrics: dict[str, Any] = field(default_factory=dict, init=False)
+    _uuid: str | None
+    _label: str
+    # Internal storage - the shared _EMPTY mapping until the first link.
+    # Child -> outgoing edges to it; parent -> incoming edges from it.
+    _children: dict[GraphNode, list[Edge]]
+    _parents: dict[GraphNode, list[Edge]]
+    # Outgoing edges by kind and id(), built by the first
+    # iter_edges_by_kind() call and kept current after it
+    _edges_by_kind: dict[EdgeKind, dict[int, Edge]] | None
+    # The FILE this node's CONTAINS/STRUCTURES/YIELDS placement puts it
+    # in, kept current by every edge change (see _refile())
+    _file: GraphNode | None
+    # render.node_text() answer, or None until asked for after a change
+    # to the node's text or to its STRUCTURES children
+    _text: NodeText | None
+    _content: dict[str, Any]
+    _metrics: dict[str, Any] | None
 
     # Implements: REQ-p00014-C
-    def __post_init__(self, label: str) -> None:
-        """Initialize internal label and default stereotype."""
-        self._label = label
+    def __init__(self, id: str, kind: NodeKind, label: str = "", uuid: str | None = None) -> None:
+        """Initialize the node with its label and default stereotype."""
         from elspais.graph.relations import Stereotype
 
-        self._content.setdefault("stereotype", Stereotype.CONCRETE)
+        self.id = id
+        self.kind = kind
+        self._uuid = uuid
+        self._label = label
+        self._children = _EMPTY
+        self._parents = _EMPTY
+        self._edges_by_kind = None
+        self._file = None
+        self._text = None
+        self._content = {"stereotype": Stereotype.CONCRETE}
+        self._metrics = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The shared empty map cannot be copied or pickled, and the by-kind
+        # cache is keyed by id(), which a copy does not share.
+        state = {name: getattr(self, name) for name in self.__slots__}
+        state["_children"] = state["_children"] or None
+        state["_parents"] = state["_parents"] or None
+        state["_edges_by_kind"] = None
+        state["_text"] = None
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self._text = None
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._children = self._children or _EMPTY
+        self._parents = self._parents or _EMPTY
+
+    def __repr__(self) -> str:
+        return f"GraphNode(id={self.id!r}, kind={self.kind}, label={self._label!r})"
+
+    @property
+    def label(self) -> str:
+        """The node's display label (read-only; use set_label() to change it)."""
+        return self._label
+
+    @property
+    def uuid(self) -> str:
+        """Stable 32-char hex string, drawn on first access."""
+        if self._uuid is None:
+            self._uuid = uuid4().hex
+        return self._uuid
 
     def set_id(self, value: str) -> None:
         """Set the node's unique identifier.
 
-        Use this method for mutations - it allows graph updates
-        without breaking the dataclass contract.
-
         Note: This only changes the node's internal ID. The graph's
         _index must be updated separately by the mutation method.
         """
-        # Dataclass field assignment - directly mutate the id attribute
-        object.__setattr__(self, "id", value)
+        self._text = None
+        self.id = value
+
+    def _forget_text(self) -> None:
+        """Drop the derived text of this node and of the bodies it is part of."""
+        self._text = None
+        for parent in self._parents:
+            parent._text = None
 
     # Label accessors - encapsulated for future hooks (e.g., index updates)
     def get_label(self) -> str:
@@ -243,6 +345,7 @@ class GraphNode:
         Use this method for mutations - it may trigger graph updates
         in the future (e.g., search index, change tracking).
         """
+        self._forget_text()
         self._label = value
 
     # Implements: REQ-d00127-C
@@ -257,11 +360,9 @@ class GraphNode:
         if edge_kinds is None:
             yield from self._children
         else:
-            seen: set[str] = set()
-            for edge in self._outgoing_edges:
-                if edge.kind in edge_kinds and edge.target.id not in seen:
-                    seen.add(edge.target.id)
-                    yield edge.target
+            for child, edges in self._children.items():
+                if any(e.kind in edge_kinds for e in edges):
+                    yield child
 
     def iter_parents(self, edge_kinds: set[EdgeKind] | None = None) -> Iterator[GraphNode]:
         """Iterate over parent nodes.
@@ -273,25 +374,29 @@ class GraphNode:
         if edge_kinds is None:
             yield from self._parents
         else:
-            seen: set[str] = set()
-            for edge in self._incoming_edges:
-                if edge.kind in edge_kinds and edge.source.id not in seen:
-                    seen.add(edge.source.id)
-                    yield edge.source
+            for parent, edges in self._parents.items():
+                if any(e.kind in edge_kinds for e in edges):
+                    yield parent
 
     def iter_outgoing_edges(self) -> Iterator[Edge]:
         """Iterate over outgoing edges."""
-        yield from self._outgoing_edges
+        for edges in self._children.values():
+            yield from edges
 
     def iter_incoming_edges(self) -> Iterator[Edge]:
         """Iterate over incoming edges."""
-        yield from self._incoming_edges
+        for edges in self._parents.values():
+            yield from edges
 
     def iter_edges_by_kind(self, edge_kind: EdgeKind) -> Iterator[Edge]:
         """Iterate outgoing edges of a specific kind."""
-        for e in self._outgoing_edges:
-            if e.kind == edge_kind:
-                yield e
+        if self._edges_by_kind is None:
+            self._edges_by_kind = {}
+            for edge in self.iter_outgoing_edges():
+                self._bucket(edge)
+        bucket = self._edges_by_kind.get(edge_kind)
+        if bucket:
+            yield from list(bucket.values())
 
     # Count and membership checks (avoid materializing lists)
     def child_count(self) -> int:
@@ -327,6 +432,8 @@ class GraphNode:
 
     def set_field(self, key: str, value: Any) -> None:
         """Set a field in content."""
+        if key in _TEXT_FIELDS:
+            self._forget_text()
         self._content[key] = value
 
     def get_all_content(self) -> dict[str, Any]:
@@ -339,10 +446,14 @@ class GraphNode:
 
     def get_metric(self, key: str, default: Any = None) -> Any:
         """Get a metric value."""
+        if self._metrics is None:
+            return default
         return self._metrics.get(key, default)
 
     def set_metric(self, key: str, value: Any) -> None:
         """Set a metric value."""
+        if self._metrics is None:
+            self._metrics = {}
         self._metrics[key] = value
 
     def mark_parse_dirty(self, reason: str) -> None:
@@ -393,25 +504,25 @@ class GraphNode:
         if child not in self._children:
             return False
 
-        # Remove bidirectional node links
-        self._children.remove(child)
-        if self in child._parents:
-            child._parents.remove(self)
-
-        # Remove outgoing edges to this child
-        self._outgoing_edges = [e for e in self._outgoing_edges if e.target is not child]
+        self._text = None
 
-        # Remove incoming edges from this parent on the child
-        child._incoming_edges = [e for e in child._incoming_edges if e.source is not self]
+        # Remove the edges between them from both ends
+        edges = self._children.pop(child)
+        if self in child._parents:
+            del child._parents[self]
+        if self._edges_by_kind is not None:
+            for edge in edges:
+                self._unbucket(edge)
+        if any(edge.kind in _PLACEMENT_KINDS for edge in edges):
+            child._refile()
 
         return True
 
     def remove_edge(self, edge: Edge) -> bool:
         """Remove a single specific edge.
 
-        Removes the edge from both outgoing and incoming lists. If no
-        other edges remain between the two nodes, also removes the
-        parent/child node links.
+        Removes the edge from both ends. If no other edges remain between
+        the two nodes, also removes the parent/child node links.
 
         Args:
             edge: The exact edge object to remove.
@@ -419,23 +530,47 @@ class GraphNode:
         Returns:
             True if the edge was found and removed, False otherwise.
         """
-        if edge not in self._outgoing_edges:
+        child = edge.target
+        if not _remove_identical(self._children, child, edge):
             return False
+        self._text = None
+        _remove_identical(child._parents, self, edge)
+        if self._edges_by_kind is not None:
+            self._unbucket(edge)
+        if edge.kind in _PLACEMENT_KINDS:
+            child._refile()
+        return True
 
-        self._outgoing_edges.remove(edge)
-        if edge in edge.target._incoming_edges:
-            edge.target._incoming_edges.remove(edge)
-
-        # Clean up parent/child links only if no more edges remain
-        child = edge.target
-        has_remaining = any(e.target is child for e in self._outgoing_edges)
-        if not has_remaining:
-            if child in self._children:
-                self._children.remove(child)
-            if self in child._parents:
-                child._parents.remove(self)
+    def set_edge_kind(self, edge: Edge, edge_kind: EdgeKind) -> None:
+        """Change the kind of one of this node's outgoing edges.
 
-        return True
+        Use this rather than assigning ``edge.kind`` so the node's by-kind
+        lookup follows the change.
+        """
+        self._text = None
+        placement = edge.kind in _PLACEMENT_KINDS or edge_kind in _PLACEMENT_KINDS
+        if self._edges_by_kind is not None:
+            self._unbucket(edge)
+            edge.kind = edge_kind
+            self._bucket(edge)
+        else:
+            edge.kind = edge_kind
+        if placement:
+            edge.target._refile()
+
+    def _bucket(self, edge: Edge) -> None:
+        by_kind = self._edges_by_kind
+        assert by_kind is not None
+        bucket = by_kind.get(edge.kind)
+        if bucket is None:
+            bucket = by_kind[edge.kind] = {}
+        bucket[id(edge)] = edge
+
+    def _unbucket(self, edge: Edge) -> None:
+        assert self._edges_by_kind is not None
+        bucket = self._edges_by_kind.get(edge.kind)
+        if bucket is not None:
+            bucket.pop(id(edge), None)
 
     def link(
         self,
@@ -463,18 +598,65 @@ class GraphNode:
             assertion_targets=assertion_targets or [],
         )
 
-        # Add bidirectional node links
-        if child not in self._children:
-            self._children.append(child)
-        if self not in child._parents:
-            child._parents.append(self)
+        self._text = None
 
-        # Track edges
-        self._outgoing_edges.append(edge)
-        child._incoming_edges.append(edge)
+        # Add the edge at both ends, allocating maps on first use
+        if self._children is _EMPTY:
+            self._children = {}
+        edges = self._children.get(child)
+        if edges is None:
+            self._children[child] = [edge]
+        else:
+            edges.append(edge)
+        if child._parents is _EMPTY:
+            child._parents = {}
+        edges = child._parents.get(self)
+        if edges is None:
+            child._parents[self] = [edge]
+        else:
+            edges.append(edge)
+        if self._edges_by_kind is not None:
+            self._bucket(edge)
+        if edge_kind in _PLACEMENT_KINDS and child._file is None:
+            child._refile()
 
         return edge
 
+    def _placement_file(self) -> GraphNode | None:
+        """The FILE this node's incoming placement edges put it in.
+
+        A FILE parent itself wins; otherwise the first placing parent's own
+        FILE, in the order the parents were linked.
+        """
+        inherited = None
+        for parent, edges in self._parents.items():
+            if not any(edge.kind in _PLACEMENT_KINDS for edge in edges):
+                continue
+            if parent.kind == NodeKind.FILE:
+                return parent
+            if inherited is None:
+                inherited = parent._file
+        return inherited
+
+    def _refile(self) -> None:
+        """Recompute ``_file`` here and down the placement edges below.
+
+        Stops at each node whose FILE did not change, since nothing under
+        it can have changed either.
+        """
+        stack: list[GraphNode] = [self]
+        while stack:
+            node = stack.pop()
+            placed = node._placement_file()
+            if placed is node._file:
+                continue
+            node._file = placed
+            if node.kind == NodeKind.FILE:
+                continue
+            for child, edges in node._children.items():
+                if any(edge.kind in _PLACEMENT_KINDS for edge in edges):
+                    stack.append(child)
+
     @property
     def depth(self) -> int:
         """Calculate depth from root (0 for roots).
@@ -589,36 +771,29 @@ class GraphNode:
 
     # Implements: REQ-d00127-D, REQ-d00128-L
     def file_node(self) -> GraphNode | None:
-        """Walk incoming edges upward to find the nearest FILE ancestor.
-
-        Traversal path depends on node position:
-        - Top-level content (REQUIREMENT, file-level REMAINDER):
-          one hop via incoming CONTAINS edge to FILE.
-        - ASSERTION or REMAINDER section: two hops -- incoming
-          STRUCTURES edge to REQUIREMENT, then incoming CONTAINS
-          edge to FILE.
-        - INSTANCE node: returns None (no CONTAINS edge). To find
-          the original file, navigate via INSTANCE edge to the
-          original node, then call file_node() on it.
+        """The FILE this node lives in, or None.
+
+        Placement decides it:
+        - Top-level content (REQUIREMENT, file-level REMAINDER, CODE, TEST):
+          the FILE with a CONTAINS edge to it.
+        - ASSERTION or REMAINDER section: the FILE of the node that
+          STRUCTURES it.
+        - RESULT: the FILE of the TEST that YIELDS it.
+        - INSTANCE node: None (it has no CONTAINS edge). To find the
+          original file, navigate via INSTANCE edge to the original node,
+          then call file_node() on it.
+
+        The answer is stored on the node when its placement edges are
+        linked, unlinked or re-kinded, so this is a field read.
 
         Returns:
-            The nearest FILE ancestor, or None if not found.
+            The owning FILE node, or None if the node is not placed in one.
         """
         # INSTANCE nodes are virtual -- they have no physical file
-        stereotype = self.get_field("stereotype")
+        stereotype = self._content.get("stereotype")
         if stereotype is not None and getattr(stereotype, "value", None) == "instance":
             return None
-        visited: set[str] = set()
-        queue: deque[GraphNode] = deque(self._parents)
-        while queue:
-            node = queue.popleft()
-            if node.id in visited:
-                continue
-            visited.add(node.id)
-            if node.kind == NodeKind.FILE:
-                return node
-            queue.extend(node._parents)
-        return None
+        return self._file
 
     def find(self, predicate: Callable[[GraphNode], bool]) -> Iterator[GraphNode]:
         """Find all descendants matching predicate.
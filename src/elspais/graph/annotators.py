@@ -24,14 +24,13 @@ Usage:
 
 from __future__ import annotations
 
-import functools
 from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from elspais.config.schema import ElspaisConfig
-from elspais.utilities.test_identity import build_test_id_from_nodeid
+from elspais.graph.coverage_data import LineContexts, LineHits
 
 
 def _validate_config(config: dict[str, Any]) -> ElspaisConfig:
@@ -625,7 +624,7 @@ def count_code_coverage(graph: FederatedGraph) -> dict[str, int]:
             total_executable += executable
         line_coverage = node.get_field("line_coverage")
         if line_coverage:
-            total_covered += sum(1 for hit in line_coverage.values() if hit > 0)
+            total_covered += LineHits.of(line_coverage).covered_lines
 
     total_attributed = 0
     for node in graph.nodes_by_kind(NodeKind.REQUIREMENT):
@@ -844,7 +843,7 @@ def _compute_code_tested(
 
     if has_any_coverage:
         # Build file_node cache for coverage lookup
-        file_coverage: dict[str, dict[int, int]] = {}
+        file_coverage: dict[str, LineHits] = {}
         for edge in node.iter_outgoing_edges():
             if edge.kind != EdgeKind.IMPLEMENTS:
                 continue
@@ -859,15 +858,12 @@ def _compute_code_tested(
                 continue
             lc = fn.get_field("line_coverage")
             if lc is not None:
-                file_coverage[rel_path] = lc
+                file_coverage[rel_path] = LineHits.of(lc)
 
         for rel_path, lines in lines_by_file.items():
             lc = file_coverage.get(rel_path)
-            if lc is None:
-                continue
-            for line_no in lines:
-                if lc.get(line_no, 0) > 0:
-                    indirect_count += 1
+            if lc is not None:
+                indirect_count += lc.count_covered(lines)
 
     # Implements: REQ-d00254-G
     # Per-test attribution (coverage.py dynamic contexts, CUR-1568): a line
@@ -878,6 +874,8 @@ def _compute_code_tested(
     # contexts credit direct attribution -- setup/teardown fixture execution
     # is not evidence the *test itself* exercised the line, so those phases
     # are deliberately excluded rather than treated as equivalent to "|run".
+    # LineContexts resolves the contexts to TEST node ids once, at ingestion
+    # (coverage_data.run_context_test_id).
     direct_count = _direct_context_count(node, lines_by_file)
 
     metrics.code_tested = LineCoverage(
@@ -889,33 +887,13 @@ def _compute_code_tested(
     )
 
 
-@functools.lru_cache(maxsize=4096)
-def _normalize_run_context(ctx: str) -> str | None:
-    """Return the canonical TEST node id for a coverage.py context string.
-
-    Returns None when the context should not credit direct attribution:
-    the empty/global context (code executed outside any test), or a
-    "|setup"/"|teardown" fixture-phase context (see CUR-1568 decision above
-    -- only "|run" contexts count). Reuses ``build_test_id_from_nodeid`` (the
-    canonical pytest-nodeid normalizer) rather than re-parsing nodeids here.
-
-    Pure str -> str|None mapping over a small alphabet of context strings
-    (one per test x phase) reused across many lines/requirements in a single
-    annotation pass, so it is memoized with ``lru_cache`` (CUR-1568).
-    """
-    nodeid, sep, phase = ctx.rpartition("|")
-    if not sep or phase != "run" or not nodeid:
-        return None
-    return build_test_id_from_nodeid(nodeid)
-
-
 def _direct_context_count(node: GraphNode, lines_by_file: dict[str, set[int]]) -> int:
     """Count implementation lines directly attributed to a verifying test.
 
     Collects the TEST node ids reachable via this requirement's outgoing
     VERIFIES edges, then checks each implementation line's recorded
-    ``line_contexts`` (set on the FILE node by coverage.json ingestion) for a
-    context that normalizes to one of those TEST ids.
+    ``line_contexts`` (set on the FILE node by coverage ingestion) for a
+    context that names one of those TEST ids.
     """
     from elspais.graph import NodeKind
     from elspais.graph.relations import EdgeKind
@@ -934,7 +912,7 @@ def _direct_context_count(node: GraphNode, lines_by_file: dict[str, set[int]]) -
 
     # Collect line_contexts per file from this requirement's IMPLEMENTS edges
     # (same traversal shape as the line_coverage lookup above).
-    file_contexts: dict[str, dict[int, list[str]]] = {}
+    file_contexts: dict[str, LineContexts] = {}
     for edge in node.iter_outgoing_edges():
         if edge.kind != EdgeKind.IMPLEMENTS:
             continue
@@ -949,7 +927,7 @@ def _direct_context_count(node: GraphNode, lines_by_file: dict[str, set[int]]) -
             continue
         ctxs = fn.get_field("line_contexts")
         if ctxs:
-            file_contexts[rel_path] = ctxs
+            file_contexts[rel_path] = LineContexts.of(ctxs)
 
     if not file_contexts:
         return 0
@@ -957,15 +935,8 @@ def _direct_context_count(node: GraphNode, lines_by_file: dict[str, set[int]]) -
     direct_count = 0
     for rel_path, lines in lines_by_file.items():
         ctxs = file_contexts.get(rel_path)
-        if not ctxs:
-            continue
-        for line_no in lines:
-            line_ctx_ids = {
-                _normalize_run_context(c) for c in ctxs.get(line_no, []) if isinstance(c, str)
-            }
-            line_ctx_ids.discard(None)
-            if line_ctx_ids & verifying_test_ids:
-                direct_count += 1
+        if ctxs:
+            direct_count += ctxs.count_lines_tested_by(lines, verifying_test_ids)
 
     return direct_count
 
@@ -997,6 +968,7 @@ def _block_region_lines(file_node, cache: dict) -> dict:
     result: dict[int, set[int]] = {}
     lc = file_node.get_field("line_coverage")
     if lc:
+        lc = LineHits.of(lc)
         markers = sorted(
             c.get_field("parse_line")
             for c in file_node.iter_children(edge_kinds={EdgeKind.CONTAINS})
@@ -1004,19 +976,18 @@ def _block_region_lines(file_node, cache: dict) -> dict:
             and c.get_field("parse_line")
             and (c.get_field("parse_end_line") in (None, c.get_field("parse_line")))
         )
-        cov = sorted(lc.keys())
         if markers:
             blocks: list[list[int]] = [[markers[0]]]
             for m in markers[1:]:
                 prev = blocks[-1][-1]
-                if any(prev < L < m for L in cov):
+                if lc.executable_in(prev + 1, m):
                     blocks.append([m])
                 else:
                     blocks[-1].append(m)
             for i, blk in enumerate(blocks):
                 last = blk[-1]
                 nxt = blocks[i + 1][0] if i + 1 < len(blocks) else None
-                owned = {L for L in cov if L > last and (nxt is None or L < nxt)}
+                owned = set(lc.executable_in(last + 1, nxt))
                 for m in blk:
                     result[m] = owned
     cache[fid] = result
@@ -1047,7 +1018,7 @@ def _compute_lcov_tested(
 
     direct_lines: dict[str, set[tuple[str, int]]] = {}
     blanket_lines: set[tuple[str, int]] = set()
-    file_cov: dict[str, dict[int, int]] = {}
+    file_cov: dict[str, LineHits] = {}
     file_app: dict[str, str | None] = {}
     file_credit: dict[str, CoverageCreditConfig] = {}
     file_owner: dict[str, str | None] = {}
@@ -1079,7 +1050,7 @@ def _compute_lcov_tested(
         lc = fn.get_field("line_coverage")
         if lc is None:
             continue
-        file_cov.setdefault(rel, lc)
+        file_cov.setdefault(rel, LineHits.of(lc))
         file_app.setdefault(rel, _match_app_dir(rel, credit.app_dirs))
         file_credit.setdefault(rel, credit)
         file_owner.setdefault(rel, owner)
@@ -1103,7 +1074,7 @@ def _compute_lcov_tested(
     def frac(lines: set[tuple[str, int]]) -> float:
         if not lines:
             return 0.0
-        covered = sum(1 for (rel, ln) in lines if file_cov.get(rel, {}).get(ln, 0) > 0)
+        covered = sum(1 for (rel, ln) in lines if rel in file_cov and file_cov[rel].get(ln, 0) > 0)
         return covered / len(lines)
 
     def threshold(lines: set[tuple[str, int]]) -> float:
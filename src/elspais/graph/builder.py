@@ -16,6 +16,7 @@ from dataclasses import asdict, dataclass, field, replace
 from pathlib import Path
 from typing import Any
 
+from elspais.graph.clone import clone_graph
 from elspais.graph.comment_store import update_anchors_on_rename
 from elspais.graph.comments import CommentIndex, CommentThread
 from elspais.graph.edge_sets import (
@@ -34,6 +35,7 @@ from elspais.graph.GraphNode import (
     parse_structural_id,
 )
 from elspais.graph.mutations import MutationEntry, MutationLog
+from elspais.graph.node_index import NodeIndex
 from elspais.graph.parsers import ParsedContent
 from elspais.graph.reference_faults import (
     FaultClass,
@@ -211,7 +213,9 @@ class TraceGraph:
 
     # Internal storage (prefixed) - excluded from constructor
     _roots: list[GraphNode] = field(default_factory=list, init=False)
-    _index: dict[str, GraphNode] = field(default_factory=dict, init=False, repr=False)
+    # Implements: REQ-d00130-E
+    # Keyed by id and bucketed by kind; every write through it keeps both.
+    _index: NodeIndex = field(default_factory=NodeIndex, init=False, repr=False)
 
     # Detection: orphans and broken references (populated at build time)
     _orphaned_ids: set[str] = field(default_factory=set, init=False)
@@ -248,6 +252,13 @@ class TraceGraph:
     _mutation_log: MutationLog = field(default_factory=MutationLog, init=False)
     _deleted_nodes: list[GraphNode] = field(default_factory=list, init=False)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # A plain dict handed in as the index is adopted as a NodeIndex so
+        # the per-kind buckets cannot fall out of step with it.
+        if name == "_index" and not isinstance(value, NodeIndex):
+            value = NodeIndex(value)
+        object.__setattr__(self, name, value)
+
     # Implements: REQ-d00130-A, REQ-d00130-B, REQ-d00130-C, REQ-d00130-D, REQ-d00130-F
     def iter_roots(self, kind: NodeKind | None = None) -> Iterator[GraphNode]:
         """Iterate root nodes, optionally filtered by NodeKind.
@@ -264,9 +275,7 @@ class TraceGraph:
         if kind is None:
             yield from self._roots
         elif kind == NodeKind.FILE:
-            for node in self._index.values():
-                if node.kind == NodeKind.FILE:
-                    yield node
+            yield from self._index.iter_kind(NodeKind.FILE)
         else:
             for node in self._roots:
                 if node.kind == kind:
@@ -345,9 +354,7 @@ class TraceGraph:
         Yields:
             GraphNode instances of the specified kind.
         """
-        for node in self._index.values():
-            if node.kind == kind:
-                yield node
+        yield from self._index.iter_kind(kind)
 
     # Implements: REQ-d00130-E
     def iter_by_kind(self, kind: NodeKind) -> Iterator[GraphNode]:
@@ -362,9 +369,7 @@ class TraceGraph:
         Yields:
             GraphNode instances of the specified kind.
         """
-        for node in self._index.values():
-            if node.kind == kind:
-                yield node
+        yield from self._index.iter_kind(kind)
 
     def node_count(self) -> int:
         """Return total number of nodes in the graph."""
@@ -375,13 +380,13 @@ class TraceGraph:
 
         All nodes, edges, and relationships are cloned. The new graph
         is completely independent - mutations to one do not affect the other.
+        Nodes are copied by ``clone_nodes()``, which shares their immutable
+        values and the coverage payloads; the rest is deep copied.
 
         Returns:
             A new TraceGraph with all data deep copied.
         """
-        import copy
-
-        return copy.deepcopy(self)
+        return clone_graph(self, [*self._index.values(), *self._deleted_nodes])
 
     # ─────────────────────────────────────────────────────────────────────────
     # Detection API: Orphans and Broken References
@@ -906,10 +911,10 @@ class TraceGraph:
             source = self._index.get(source_id)
             target = self._index.get(target_id)
             if source and target:
-                # Find and update the edge (dataclass field, not _kind)
+                # Find and update the edge through its source node
                 for edge in source.iter_incoming_edges():
                     if edge.source.id == target_id:
-                        edge.kind = EdgeKind(old_kind)
+                        edge.source.set_edge_kind(edge, EdgeKind(old_kind))
                         break
                 self._restore_journey_bodies(entry)
 
@@ -1208,7 +1213,7 @@ class TraceGraph:
             node.set_field("text", old_text)
         if old_heading is not None:
             node.set_field("heading", old_heading)
-            node._label = old_heading
+            node.set_label(old_heading)
         parent_id = entry.before_state.get("parent_id")
         if parent_id and parent_id in self._index and "parent_hash" in entry.before_state:
             self._index[parent_id].set_field("hash", entry.before_state["parent_hash"])
@@ -2373,8 +2378,8 @@ class TraceGraph:
             },
         )
 
-        # Update the edge kind directly (dataclass field, not _kind)
-        edge_to_update.kind = new_kind
+        # Update the edge kind through its source node
+        edge_to_update.source.set_edge_kind(edge_to_update, new_kind)
         self._reconcile_journey_bodies(source, self._index.get(target_id))
 
         self._mutation_log.append(entry)
@@ -3206,7 +3211,7 @@ class TraceGraph:
             node.set_field("text", text)
         if heading is not None:
             node.set_field("heading", heading)
-            node._label = heading
+            node.set_label(heading)
 
         new_hash = self._recompute_requirement_hash(parent)
 
@@ -3810,13 +3815,12 @@ class GraphBuilder:
             content: Parsed content from a parser.
             file_node: Optional FILE node to wire CONTAINS edges from.
         """
+        node: GraphNode | None
         if content.content_type == "requirement":
-            self._add_requirement(content)
+            node = self._add_requirement(content)
             # Wire CONTAINS from FILE to REQUIREMENT (top-level)
             if file_node is not None:
-                node = self._nodes.get(content.parsed_data.get("id", ""))
-                if node:
-                    self._wire_contains_edge(file_node, node, content)
+                self._wire_contains_edge(file_node, node, content)
         elif content.content_type == "journey":
             self._add_journey(content)
             if file_node is not None:
@@ -3941,8 +3945,12 @@ class GraphBuilder:
                 )
             )
 
-    def _add_requirement(self, content: ParsedContent) -> None:
-        """Add a requirement node and its assertions."""
+    def _add_requirement(self, content: ParsedContent) -> GraphNode:
+        """Add a requirement node and its assertions, and return the node.
+
+        ``content`` is left as it is: a parse memo hands the same objects to
+        every build, so a duplicate renamed here must still be one next time.
+        """
         data = content.parsed_data
         req_id = data["id"]
 
@@ -3980,7 +3988,7 @@ class GraphBuilder:
                     f"`component.style` pattern so it cannot match a '#' "
                     f"character, or resolve the source-file collision."
                 )
-            data["id"] = synthetic_id
+            data = {**data, "id": synthetic_id}
             req_id = synthetic_id
 
         if is_duplicate_occurrence:
@@ -4267,6 +4275,8 @@ class GraphBuilder:
                 if child_node.kind == NodeKind.ASSERTION:
                     child_node.set_field("stereotype", Stereotype.TEMPLATE)
 
+        return node
+
     def _add_journey(self, content: ParsedContent) -> None:
         """Add a user journey node."""
         data = content.parsed_data
@@ -5436,7 +5446,7 @@ class GraphBuilder:
             _namespace=self._namespace,
         )
         graph._roots = roots
-        graph._index = dict(self._nodes)
+        graph._index = NodeIndex(self._nodes)
         graph._orphaned_ids = orphaned_ids
         graph._broken_references = list(self._broken_references)
         graph._style_findings = list(self._style_findings)
@@ -0,0 +1,149 @@
+# Implements: REQ-d00216-A, REQ-d00216-B, REQ-d00216-C, REQ-d00216-F
+"""Node cloning for TraceGraph.clone() and FederatedGraph.clone().
+
+``copy.deepcopy`` reaches every node through the edge lists of its
+neighbours, paying for recursion and reduce/setstate dispatch per node and
+edge and copying every string-bearing container it meets. A graph's nodes
+are plain slotted records, so they are copied here directly instead: the
+topology and the mutable per-node state are rebuilt, immutable values are
+shared, and the result is recorded in a deepcopy memo so the graph's own
+containers can still be copied by ``copy.deepcopy(graph, memo)`` and pick
+up the cloned nodes wherever they refer to one.
+"""
+
+from __future__ import annotations
+
+import copy
+import gc
+from collections.abc import Iterable
+from enum import Enum
+from typing import Any, TypeVar
+
+from elspais.graph.GraphNode import _EMPTY, GraphNode
+from elspais.graph.relations import Edge
+
+# Content fields the coverage pass stores once and nothing edits in place
+# afterwards. They are the largest payloads on a node, so clones share them.
+SHARED_FIELDS = frozenset({"line_coverage", "executable_lines", "line_contexts"})
+
+_G = TypeVar("_G")
+
+
+_ATOMIC = (str, int, float, Enum, type(None))
+
+
+def _copy_value(value: Any, memo: dict[int, Any]) -> Any:
+    if isinstance(value, _ATOMIC):
+        return value
+    # Nearly every node carries a list of keyword strings; copying those
+    # flat is what keeps the clone well ahead of deepcopy.
+    if type(value) is list and all(isinstance(item, _ATOMIC) for item in value):
+        return value.copy()
+    return copy.deepcopy(value, memo)
+
+
+def _component(nodes: Iterable[GraphNode]) -> list[GraphNode]:
+    """``nodes`` plus every node reachable from them along edges either way.
+
+    Edges can leave a graph (a federation wires members together), and a
+    deep copy follows them, so the clone does too.
+    """
+    seen: set[int] = set()
+    order: list[GraphNode] = []
+    stack = list(nodes)
+    while stack:
+        node = stack.pop()
+        key = id(node)
+        if key in seen:
+            continue
+        seen.add(key)
+        order.append(node)
+        stack.extend(node._children)
+        stack.extend(node._parents)
+    return order
+
+
+def clone_graph(graph: _G, nodes: Iterable[GraphNode]) -> _G:
+    """Deep copy ``graph``, copying ``nodes`` with ``clone_nodes()``.
+
+    Garbage collection is paused for the copy. Every object made here is
+    live, so the collections its allocations would trigger only rescan the
+    growing heap; on a 46k-node graph they cost more than the copy.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        memo: dict[int, Any] = {}
+        clone_nodes(nodes, memo)
+        return copy.deepcopy(graph, memo)
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def clone_nodes(nodes: Iterable[GraphNode], memo: dict[int, Any]) -> None:
+    """Clone ``nodes`` and everything connected to them into ``memo``.
+
+    Each clone gets its own content and metrics dicts and its own edges and
+    adjacency maps; string, number and enum values are shared, as are the
+    ``SHARED_FIELDS`` payloads, and other values are deep-copied. Clones are
+    entered in ``memo`` under ``id(original)``, as are their edges, so a
+    following ``copy.deepcopy(..., memo)`` resolves references to them.
+    """
+    originals = _component(nodes)
+    for node in originals:
+        twin = GraphNode.__new__(GraphNode)
+        twin.id = node.id
+        twin.kind = node.kind
+        twin._uuid = node._uuid
+        twin._label = node._label
+        twin._children = _EMPTY
+        twin._parents = _EMPTY
+        twin._edges_by_kind = None
+        twin._file = None
+        twin._text = None
+        twin._content = {
+            key: value if key in SHARED_FIELDS else _copy_value(value, memo)
+            for key, value in node._content.items()
+        }
+        metrics = node._metrics
+        twin._metrics = (
+            None
+            if metrics is None
+            else {key: _copy_value(value, memo) for key, value in metrics.items()}
+        )
+        memo[id(node)] = twin
+
+    # Outgoing edges first, so every edge has its clone before the parent
+    # side is rebuilt from the same objects in its own order.
+    for node in originals:
+        if not node._children:
+            continue
+        twin = memo[id(node)]
+        children: dict[GraphNode, list[Edge]] = {}
+        for child, edges in node._children.items():
+            twin_child = memo[id(child)]
+            cloned: list[Edge] = []
+            for edge in edges:
+                twin_edge = Edge(
+                    source=twin,
+                    target=twin_child,
+                    kind=edge.kind,
+                    assertion_targets=list(edge.assertion_targets),
+                    metadata={k: _copy_value(v, memo) for k, v in edge.metadata.items()},
+                )
+                memo[id(edge)] = twin_edge
+                cloned.append(twin_edge)
+            children[twin_child] = cloned
+        twin._children = children
+
+    for node in originals:
+        if not node._parents:
+            continue
+        twin = memo[id(node)]
+        twin._parents = {
+            memo[id(parent)]: [memo[id(edge)] for edge in edges]
+            for parent, edges in node._parents.items()
+        }
+        if node._file is not None:
+            twin._file = memo[id(node._file)]
@@ -0,0 +1,278 @@
+# Implements: REQ-d00254-B, REQ-d00254-D, REQ-d00254-G
+"""Compact per-file line coverage stored on FILE nodes.
+
+Coverage ingestion annotates each measured FILE node with its per-line
+hit counts (``line_coverage``) and, when the run recorded them, the test
+contexts that executed each line (``line_contexts``). As plain dicts those
+cost a boxed int per line and a list per line repeating the same context
+strings across every line a test touches -- with coverage.py contexts on,
+the largest thing a daemon holds.
+
+``LineHits`` keeps the hit counts in one array indexed by line number.
+``LineContexts`` keeps a file's distinct context strings once, interned,
+and each line's contexts as indexes into them in CSR form (sorted lines,
+offsets, ids). Both are read-only ``Mapping`` views with the shape the
+dicts had, so anything that reads a line still can, and they add the
+counting queries the coverage annotators need without building per-line
+Python sets. ``LineContexts`` also resolves each line's contexts to the
+TEST node ids they name when it is built, once per ingest through a
+shared ``ContextNormalizer``, so attribution never re-parses a context.
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from collections.abc import Set as AbstractSet
+from typing import Any
+
+from elspais.utilities.test_identity import build_test_id_from_nodeid
+
+# Hit count stored for a line the file has no statement on.
+_NOT_EXECUTABLE = -1
+# LCOV counts are unbounded; the array holds a signed 32-bit int.
+_MAX_HITS = 2**31 - 1
+
+
+class LineHits(Mapping[int, int]):
+    """Per-line hit counts for one file: executable line -> times executed.
+
+    Iterates executable lines in ascending order. Lines outside the map
+    (comments, blank lines, lines past the end) are not keys.
+    """
+
+    __slots__ = ("_hits", "_count", "_covered")
+
+    def __init__(self, hits: Mapping[int, int] | None = None) -> None:
+        hits = hits or {}
+        table = array("i", [_NOT_EXECUTABLE]) * (max(hits, default=-1) + 1)
+        covered = 0
+        for line, count in hits.items():
+            count = min(max(int(count), 0), _MAX_HITS)
+            table[line] = count
+            if count:
+                covered += 1
+        self._hits = table
+        self._count = len(hits)
+        self._covered = covered
+
+    @classmethod
+    def of(cls, value: Mapping[int, int]) -> LineHits:
+        """``value`` itself if it is already a LineHits, else one built from it."""
+        return value if isinstance(value, LineHits) else cls(value)
+
+    def __getitem__(self, line: int) -> int:
+        count: int | None = self.get(line)
+        if count is None:
+            raise KeyError(line)
+        return count
+
+    def get(self, line: int, default: Any = None) -> Any:
+        if 0 <= line < len(self._hits):
+            count = self._hits[line]
+            if count != _NOT_EXECUTABLE:
+                return count
+        return default
+
+    def __contains__(self, line: object) -> bool:
+        return isinstance(line, int) and self.get(line) is not None
+
+    def __iter__(self) -> Iterator[int]:
+        return (line for line, count in enumerate(self._hits) if count != _NOT_EXECUTABLE)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __repr__(self) -> str:
+        return f"LineHits({dict(self)!r})"
+
+    @property
+    def covered_lines(self) -> int:
+        """Number of executable lines executed at least once."""
+        return self._covered
+
+    def count_covered(self, lines: Iterable[int]) -> int:
+        """How many of ``lines`` were executed at least once."""
+        hits = self._hits
+        size = len(hits)
+        return sum(1 for line in lines if 0 <= line < size and hits[line] > 0)
+
+    def executable_in(self, start: int, stop: int | None = None) -> list[int]:
+        """Executable lines in ``[start, stop)``, ascending; to the end if ``stop`` is None."""
+        hits = self._hits
+        start = max(start, 0)
+        stop = len(hits) if stop is None else min(stop, len(hits))
+        return [line for line in range(start, stop) if hits[line] != _NOT_EXECUTABLE]
+
+
+# Implements: REQ-d00254-G
+def run_context_test_id(ctx: str) -> str | None:
+    """Return the canonical TEST node id for a coverage.py context string.
+
+    Returns None when the context should not credit direct attribution:
+    the empty/global context (code executed outside any test), or a
+    "|setup"/"|teardown" fixture-phase context (CUR-1568 -- only "|run"
+    contexts count). Reuses ``build_test_id_from_nodeid`` (the canonical
+    pytest-nodeid normalizer) rather than re-parsing nodeids here.
+    """
+    nodeid, sep, phase = ctx.rpartition("|")
+    if not sep or phase != "run" or not nodeid:
+        return None
+    return sys.intern(build_test_id_from_nodeid(nodeid))
+
+
+class ContextNormalizer:
+    """``run_context_test_id`` remembered across one coverage ingest.
+
+    Each distinct context string is normalized once however many lines and
+    files record it, and equal per-line TEST id sets come back as one
+    shared frozenset. Pass one instance to every ``LineContexts`` an
+    ingest builds.
+    """
+
+    __slots__ = ("_test_ids", "_sets")
+
+    def __init__(self) -> None:
+        self._test_ids: dict[str, str | None] = {}
+        self._sets: dict[frozenset[str], frozenset[str]] = {}
+
+    def __call__(self, ctx: str) -> str | None:
+        if ctx in self._test_ids:
+            return self._test_ids[ctx]
+        test_id = self._test_ids[ctx] = run_context_test_id(ctx)
+        return test_id
+
+    def tests(self, ctxs: Iterable[str]) -> frozenset[str]:
+        """The shared set of TEST ids that ``ctxs`` name."""
+        key = frozenset(test_id for ctx in ctxs if (test_id := self(ctx)) is not None)
+        return self._sets.setdefault(key, key)
+
+
+class LineContexts(Mapping[int, list[str]]):
+    """Per-line test contexts for one file: line -> contexts that executed it.
+
+    Each distinct context string is stored once and interned, so a context
+    recorded in several files is one string object. Reading a line builds
+    its list; the counting queries read the arrays directly.
+
+    Direct attribution wants the TEST ids the contexts name, not the
+    strings, so those are worked out once, when the file is ingested: each
+    line also points at the set of TEST ids its contexts name, and lines
+    run by the same tests share one set.
+    """
+
+    __slots__ = ("_names", "_lines", "_offsets", "_ids", "_test_sets", "_set_ids")
+
+    def __init__(
+        self,
+        contexts: Mapping[int, Iterable[str]] | None = None,
+        normalize: ContextNormalizer | None = None,
+    ) -> None:
+        contexts = contexts or {}
+        normalize = normalize or ContextNormalizer()
+        index: dict[str, int] = {}
+        names: list[str] = []
+        lines = array("I")
+        offsets = array("I", [0])
+        ids = array("I")
+        set_index: dict[frozenset[str], int] = {}
+        test_sets: list[frozenset[str]] = []
+        set_ids = array("I")
+        for line in sorted(contexts):
+            line_names = [ctx for ctx in contexts[line] if isinstance(ctx, str)]
+            for ctx in line_names:
+                i = index.get(ctx)
+                if i is None:
+                    i = index[ctx] = len(names)
+                    names.append(sys.intern(ctx))
+                ids.append(i)
+            lines.append(line)
+            offsets.append(len(ids))
+            tests = normalize.tests(line_names)
+            j = set_index.get(tests)
+            if j is None:
+                j = set_index[tests] = len(test_sets)
+                test_sets.append(tests)
+            set_ids.append(j)
+        self._names = tuple(names)
+        self._lines = lines
+        self._offsets = offsets
+        self._ids = ids
+        self._test_sets = tuple(test_sets)
+        self._set_ids = set_ids
+
+    @classmethod
+    def of(cls, value: Mapping[int, Iterable[str]]) -> LineContexts:
+        """``value`` itself if it is already a LineContexts, else one built from it."""
+        return value if isinstance(value, LineContexts) else cls(value)
+
+    def _position(self, line: int) -> int:
+        pos = bisect_left(self._lines, line)
+        if pos < len(self._lines) and self._lines[pos] == line:
+            return pos
+        return -1
+
+    def __getitem__(self, line: int) -> list[str]:
+        pos = self._position(line)
+        if pos < 0:
+            raise KeyError(line)
+        names = self._names
+        return [names[i] for i in self._ids[self._offsets[pos] : self._offsets[pos + 1]]]
+
+    def __contains__(self, line: object) -> bool:
+        return isinstance(line, int) and self._position(line) >= 0
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._lines)
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def __repr__(self) -> str:
+        return f"LineContexts({dict(self)!r})"
+
+    @property
+    def contexts(self) -> tuple[str, ...]:
+        """The file's distinct context strings."""
+        return self._names
+
+    def tests_at(self, line: int) -> frozenset[str]:
+        """The TEST ids whose ``|run`` contexts executed ``line``; empty if none."""
+        pos = self._position(line)
+        return self._test_sets[self._set_ids[pos]] if pos >= 0 else frozenset()
+
+    def count_lines_matching(self, lines: Iterable[int], accept: Callable[[str], bool]) -> int:
+        """How many of ``lines`` were executed under a context ``accept`` admits.
+
+        ``accept`` is asked once per distinct context, not once per line.
+        """
+        wanted = bytes(1 if accept(name) else 0 for name in self._names)
+        if not any(wanted):
+            return 0
+        ids = self._ids
+        offsets = self._offsets
+        count = 0
+        for line in lines:
+            pos = self._position(line)
+            if pos >= 0 and any(wanted[i] for i in ids[offsets[pos] : offsets[pos + 1]]):
+                count += 1
+        return count
+
+    def count_lines_tested_by(self, lines: Iterable[int], test_ids: AbstractSet[str]) -> int:
+        """How many of ``lines`` were executed by one of ``test_ids``.
+
+        Intersects each distinct per-line TEST id set with ``test_ids``
+        once, then counts lines by index.
+        """
+        hit = bytes(0 if tests.isdisjoint(test_ids) else 1 for tests in self._test_sets)
+        if not any(hit):
+            return 0
+        set_ids = self._set_ids
+        count = 0
+        for line in lines:
+            pos = self._position(line)
+            if pos >= 0 and hit[set_ids[pos]]:
+                count += 1
+        return count
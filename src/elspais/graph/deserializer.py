@@ -7,12 +7,22 @@ various sources (files, stdin, CLI args) into parsed content.
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 from elspais.graph.parsers import ParseContext, ParsedContent, ParserRegistry
+from elspais.utilities.file_walk import FileManifest, walk_files
+
+if TYPE_CHECKING:
+    from elspais.config import IgnoreConfig
+    from elspais.graph.parse_cache import ParseCache, ParseMemo
+
+# Files handed to an executor worker per round trip. Large enough to amortize
+# pickling the dispatcher, small enough to keep every worker busy at the tail.
+_DISPATCH_CHUNKSIZE = 16
 
 
 @dataclass
@@ -84,6 +94,8 @@ class DomainFile:
         recursive: bool = False,
         skip_dirs: list[str] | None = None,
         skip_files: list[str] | None = None,
+        ignore_config: IgnoreConfig | None = None,
+        ignore_scope: str = "global",
     ) -> None:
         """Initialize file deserializer.
 
@@ -93,12 +105,18 @@ class DomainFile:
             recursive: Whether to search recursively.
             skip_dirs: Directory names to skip (e.g., ["roadmap", "reference"]).
             skip_files: File names to skip (e.g., ["README.md", "INDEX.md"]).
+            ignore_config: Optional ``[ignore]`` configuration. Paths it
+                ignores under ``ignore_scope`` are never read, and a
+                recursive walk does not descend into directories it prunes.
+            ignore_scope: Scope passed to ``ignore_config`` ("spec", "code", ...).
         """
         self.path = Path(path)
         self.patterns = patterns or ["*.md"]
         self.recursive = recursive
         self.skip_dirs = skip_dirs or []
         self.skip_files = skip_files or []
+        self.ignore_config = ignore_config
+        self.ignore_scope = ignore_scope
 
     def _should_skip(self, file_path: Path) -> bool:
         """Check if a file should be skipped based on skip_dirs and skip_files.
@@ -134,17 +152,21 @@ class DomainFile:
 
         return False
 
-    # Implements: REQ-o00072-A
-    def iterate_sources(self) -> Iterator[tuple[DomainContext, str]]:
-        """Iterate over file sources.
+    def iterate_paths(self) -> Iterator[Path]:
+        """Iterate over the file paths this deserializer would read.
+
+        The order is the order ``iterate_sources`` reads them in.
 
         Yields:
-            Tuples of (DomainContext, file_content).
+            Path of each matching file.
         """
         if self.path.is_file():
-            if not self._should_skip(self.path):
-                yield self._read_file(self.path)
+            if not self._should_skip(self.path) and not self._is_ignored(self.path):
+                yield self.path
         elif self.path.is_dir():
+            if self.recursive and not any("**" in pattern for pattern in self.patterns):
+                yield from self._walk_paths()
+                return
             for pattern in self.patterns:
                 if self.recursive:
                     file_iter = self.path.rglob(pattern)
@@ -152,8 +174,74 @@ class DomainFile:
                     file_iter = self.path.glob(pattern)
 
                 for file_path in sorted(file_iter):
-                    if file_path.is_file() and not self._should_skip(file_path):
-                        yield self._read_file(file_path)
+                    if (
+                        not self._should_skip(file_path)
+                        and not self._is_ignored(file_path)
+                        and file_path.is_file()
+                    ):
+                        yield file_path
+
+    def _is_ignored(self, file_path: Path) -> bool:
+        """Check a file against ``ignore_config``."""
+        return self.ignore_config is not None and self.ignore_config.should_ignore(
+            file_path, scope=self.ignore_scope
+        )
+
+    def _should_prune(self, dir_path: Path) -> bool:
+        """Check if nothing under ``dir_path`` can be yielded.
+
+        Mirrors ``_should_skip`` and ``IgnoreConfig.should_ignore`` for a
+        directory: a skipped or ignored directory contributes no files, so
+        the walk need not list it.
+        """
+        rel_dir = dir_path.relative_to(self.path)
+        if rel_dir.parts:
+            rel_str = str(rel_dir)
+            for skip in self.skip_dirs:
+                if "/" in skip or "\\" in skip:
+                    if rel_str == skip or rel_str.startswith(skip + "/"):
+                        return True
+                elif skip in rel_dir.parts:
+                    return True
+        return self.ignore_config is not None and self.ignore_config.should_prune_dir(
+            dir_path, scope=self.ignore_scope
+        )
+
+    def manifest(self) -> FileManifest:
+        """Every file under ``path`` that the pruned walk lists.
+
+        Directories ``_should_prune`` rejects are neither listed nor
+        descended into; files are not matched against ``patterns``. Empty
+        when ``path`` is not a directory or is itself pruned.
+        """
+        if not self.path.is_dir() or self._should_prune(self.path):
+            return FileManifest(self.path, [])
+        return walk_files(self.path, prune=self._should_prune)
+
+    def _walk_paths(self) -> Iterator[Path]:
+        """Recursive equivalent of ``rglob`` per pattern, pruning as it walks.
+
+        One ``walk_files`` pass lists the tree, skipping directories
+        ``_should_prune`` rejects, so an ignored tree (vendored dependencies,
+        generated code) is never listed, stat'ed or read, and every pattern
+        is matched against that one listing. Files are yielded per pattern
+        in sorted order, exactly as the ``rglob`` loop yields them.
+        """
+        manifest = self.manifest()
+        for pattern in self.patterns:
+            for entry in manifest.match(pattern):
+                if not self._should_skip(entry.path) and not self._is_ignored(entry.path):
+                    yield entry.path
+
+    # Implements: REQ-o00072-A
+    def iterate_sources(self) -> Iterator[tuple[DomainContext, str]]:
+        """Iterate over file sources.
+
+        Yields:
+            Tuples of (DomainContext, file_content).
+        """
+        for file_path in self.iterate_paths():
+            yield self._read_file(file_path)
 
     def _read_file(self, file_path: Path) -> tuple[DomainContext, str]:
         """Read a file and create context.
@@ -165,12 +253,7 @@ class DomainFile:
             Tuple of (DomainContext, content).
         """
         content = file_path.read_text(encoding="utf-8")
-        ctx = DomainContext(
-            source_type="file",
-            source_id=str(file_path),
-            metadata={"path": file_path},
-        )
-        return ctx, content
+        return _file_context(file_path), content
 
     # Implements: REQ-o00072-A+B
     def deserialize(self, registry: ParserRegistry) -> Iterator[ParsedContentWithContext]:
@@ -207,20 +290,101 @@ class DomainFile:
         self,
         dispatch_fn: Any,
         file_path_key: str = "path",
+        executor: Executor | None = None,
+        cache: ParseCache | None = None,
+        cache_scope: str = "",
+        memo: ParseMemo | None = None,
     ) -> Iterator[ParsedContentWithContext]:
         """Deserialize files using a Lark FileDispatcher method.
 
         Args:
             dispatch_fn: A callable(content, file_path) -> list[ParsedContent].
             file_path_key: Metadata key for source path (default: "path").
+            executor: Optional executor to read and parse files on (see
+                ``dispatch_files``).
+            cache: Optional parse cache (see ``dispatch_files``).
+            cache_scope: The dispatcher's ``cache_scope`` for ``dispatch_fn``.
+            memo: Optional in-process parse memo (see ``dispatch_files``).
 
         Yields:
             ParsedContentWithContext for each parsed region.
         """
-        for ctx, content in self.iterate_sources():
-            source_path = ctx.metadata.get(file_path_key, ctx.source_id)
-            for parsed in dispatch_fn(content, str(source_path)):
-                yield ParsedContentWithContext(
+        for _ctx, parsed_list in dispatch_files(
+            self.iterate_paths(),
+            dispatch_fn,
+            file_path_key,
+            executor=executor,
+            cache=cache,
+            cache_scope=cache_scope,
+            memo=memo,
+        ):
+            yield from parsed_list
+
+
+def _file_context(file_path: Path) -> DomainContext:
+    """Create the DomainContext for a file source."""
+    return DomainContext(
+        source_type="file",
+        source_id=str(file_path),
+        metadata={"path": file_path},
+    )
+
+
+def dispatch_files(
+    file_paths: Iterable[Path],
+    dispatch_fn: Any,
+    file_path_key: str = "path",
+    executor: Executor | None = None,
+    cache: ParseCache | None = None,
+    cache_scope: str = "",
+    memo: ParseMemo | None = None,
+) -> Iterator[tuple[DomainContext, list[ParsedContentWithContext]]]:
+    """Read and parse files, yielding each file's content as one group.
+
+    Args:
+        file_paths: Files to parse, in the order results are wanted.
+        dispatch_fn: A callable(content, file_path) -> list[ParsedContent].
+        file_path_key: Metadata key for source path (default: "path").
+        executor: Optional executor (typically a process pool) to read and
+            parse files on; ``dispatch_fn`` must then be picklable. Groups
+            are still yielded in ``file_paths`` order, so the caller sees
+            exactly the sequence the serial path produces.
+        cache: Optional parse cache. A file whose entry is present is not
+            handed to ``dispatch_fn`` at all.
+        cache_scope: The dispatcher's ``cache_scope`` for ``dispatch_fn``;
+            required with ``cache`` or ``memo``.
+        memo: Optional in-process parse memo, consulted before ``cache``. A
+            file whose stat signature is unchanged since the memo last saw
+            it is not even read.
+
+    Yields:
+        Tuples of (DomainContext, parsed content of that file).
+    """
+    contexts = [_file_context(p) for p in file_paths]
+    source_paths = [str(ctx.metadata.get(file_path_key, ctx.source_id)) for ctx in contexts]
+    results: Iterable[list[ParsedContent]]
+    if cache is not None or memo is not None:
+        results = _cached_results(
+            contexts, source_paths, dispatch_fn, executor, cache, memo, cache_scope
+        )
+    elif executor is None:
+        results = (
+            _read_and_dispatch(dispatch_fn, ctx.source_id, source_path)
+            for ctx, source_path in zip(contexts, source_paths, strict=True)
+        )
+    else:
+        results = executor.map(
+            _read_and_dispatch,
+            [dispatch_fn] * len(contexts),
+            [ctx.source_id for ctx in contexts],
+            source_paths,
+            chunksize=_DISPATCH_CHUNKSIZE,
+        )
+    for ctx, parsed_list in zip(contexts, results, strict=True):
+        yield (
+            ctx,
+            [
+                ParsedContentWithContext(
                     content_type=parsed.content_type,
                     start_line=parsed.start_line,
                     end_line=parsed.end_line,
@@ -228,6 +392,92 @@ class DomainFile:
                     parsed_data=parsed.parsed_data,
                     source_context=ctx,
                 )
+                for parsed in parsed_list
+            ],
+        )
+
+
+def _cached_results(
+    contexts: list[DomainContext],
+    source_paths: list[str],
+    dispatch_fn: Any,
+    executor: Executor | None,
+    cache: ParseCache | None,
+    memo: ParseMemo | None,
+    cache_scope: str,
+) -> Iterator[list[ParsedContent]]:
+    """Per-file parse results, served from ``memo`` or ``cache`` where they can be."""
+
+    def lookup(file_path: str, source_path: str) -> tuple[Any, Any, str | None, str | None]:
+        # (parsed or None, memo signature, cache key, content read)
+        signature = None
+        if memo is not None:
+            parsed, signature = memo.get(cache_scope, file_path)
+            if parsed is not None:
+                return parsed, signature, None, None
+        content = Path(file_path).read_text(encoding="utf-8")
+        key = None
+        if cache is not None:
+            key = cache.key(cache_scope, source_path, content)
+            parsed = cache.get(key)
+            if parsed is not None:
+                if memo is not None:
+                    memo.put(cache_scope, file_path, signature, parsed)
+                return parsed, signature, key, content
+        return None, signature, key, content
+
+    def store(file_path: str, signature: Any, key: str | None, parsed: list) -> None:
+        if cache is not None and key is not None:
+            cache.put(key, parsed)
+        if memo is not None:
+            memo.put(cache_scope, file_path, signature, parsed)
+
+    if executor is None:
+        for ctx, source_path in zip(contexts, source_paths, strict=True):
+            parsed, signature, key, content = lookup(ctx.source_id, source_path)
+            if parsed is None:
+                assert content is not None  # read on every miss
+                parsed = _dispatch(dispatch_fn, content, source_path)
+                store(ctx.source_id, signature, key, parsed)
+            yield parsed
+        return
+
+    # Hits are resolved here; only the misses travel to the pool.
+    results: list[list[ParsedContent] | None] = []
+    misses: list[tuple[int, Any, str | None, str]] = []  # (index, signature, key, content)
+    for i, (ctx, source_path) in enumerate(zip(contexts, source_paths, strict=True)):
+        parsed, signature, key, content = lookup(ctx.source_id, source_path)
+        results.append(parsed)
+        if parsed is None:
+            assert content is not None  # read on every miss
+            misses.append((i, signature, key, content))
+    parsed_misses = executor.map(
+        _dispatch,
+        [dispatch_fn] * len(misses),
+        [content for _i, _sig, _key, content in misses],
+        [source_paths[i] for i, _sig, _key, _content in misses],
+        chunksize=_DISPATCH_CHUNKSIZE,
+    )
+    for (i, signature, key, _content), parsed in zip(misses, parsed_misses, strict=True):
+        store(contexts[i].source_id, signature, key, parsed)
+        results[i] = parsed
+    for parsed in results:
+        assert parsed is not None
+        yield parsed
+
+
+def _dispatch(dispatch_fn: Any, content: str, source_path: str) -> list[ParsedContent]:
+    """Run ``dispatch_fn`` over one file's content (pool task body)."""
+    return list(dispatch_fn(content, source_path))
+
+
+def _read_and_dispatch(dispatch_fn: Any, file_path: str, source_path: str) -> list[ParsedContent]:
+    """Read one file and run ``dispatch_fn`` over it.
+
+    Module-level so a process pool can pickle it by reference.
+    """
+    content = Path(file_path).read_text(encoding="utf-8")
+    return _dispatch(dispatch_fn, content, source_path)
 
 
 class DomainStdio:
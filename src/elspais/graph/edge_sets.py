@@ -17,6 +17,11 @@ STRUCTURAL_EDGE_KINDS: frozenset[EdgeKind] = frozenset({EdgeKind.CONTAINS, EdgeK
 # the parent REQUIREMENT of an ASSERTION without crossing CONTAINS into a FILE.
 ASSERTION_STRUCTURE_EDGES: frozenset[EdgeKind] = frozenset({EdgeKind.STRUCTURES})
 
+# Edges a node inherits its FILE through (GraphNode.file_node()): the
+# structural ones, plus TEST -> RESULT (YIELDS), since a RESULT is filed
+# with the test that yields it.
+FILE_PLACEMENT_EDGE_KINDS: frozenset[EdgeKind] = STRUCTURAL_EDGE_KINDS | {EdgeKind.YIELDS}
+
 # All requirement-traceability edge kinds.
 TRACEABILITY_EDGE_KINDS: frozenset[EdgeKind] = frozenset(
     {
@@ -9,8 +9,13 @@ implementing their own file reading logic.
 
 from __future__ import annotations
 
+import functools
+import json
 import logging
 import os
+import xml.etree.ElementTree as ET
+from collections.abc import Callable, Container, Iterable, Iterator
+from concurrent.futures import Executor, Future
 from dataclasses import dataclass, field
 from glob import glob
 from pathlib import Path
@@ -24,8 +29,9 @@ from elspais.config import (
     get_spec_directories,
 )
 from elspais.config.schema import ElspaisConfig
-from elspais.graph.builder import GraphBuilder
-from elspais.graph.deserializer import DomainFile
+from elspais.graph.builder import GraphBuilder, TraceGraph
+from elspais.graph.coverage_data import ContextNormalizer, LineContexts, LineHits
+from elspais.graph.deserializer import DomainFile, dispatch_files
 from elspais.graph.federated import FederatedGraph
 from elspais.graph.federation_plan import (
     PlannedRepo,
@@ -33,10 +39,19 @@ from elspais.graph.federation_plan import (
     plan_federation,
 )
 from elspais.graph.GraphNode import FileType, GraphNode, NodeKind, make_file_id
+from elspais.graph.member_cache import MemberSnapshotCache, member_cache_dir, snapshot_key
+from elspais.graph.parse_cache import ParseCache, ParseMemo, parse_cache_dir
 from elspais.graph.parsers import ParserRegistry
 from elspais.graph.parsers.journey import JourneyParser
 from elspais.graph.parsers.lark import FileDispatcher
 from elspais.graph.parsers.remainder import RemainderParser
+from elspais.graph.snapshot import (
+    federation_key,
+    graph_snapshot_path,
+    load_snapshot,
+    write_snapshot,
+)
+from elspais.utilities.file_walk import glob_files
 from elspais.utilities.patterns import FederatedIdReader, IdResolver, build_resolver
 
 _log = logging.getLogger(__name__)
@@ -66,6 +81,124 @@ def _resolve_coverage_file_node(graph, source_file, lcov_path, repo_root):
 
 
 # Implements: REQ-d00254-F, REQ-d00254-I
+def _results_reporter(target):
+    """``target``'s reporter spec when it is a known "results"-kind reporter, else None."""
+    from elspais.graph.parsers.results.registry import get_reporter
+
+    try:
+        spec = get_reporter(target.reporter)
+    except KeyError:
+        _log.debug("_ingest_target_results: unknown reporter %r, skipping", target.reporter)
+        return None
+
+    if spec.kind != "results":
+        _log.debug(
+            "_ingest_target_results: reporter %r is kind=%r, not 'results', skipping",
+            target.reporter,
+            spec.kind,
+        )
+        return None
+    return spec
+
+
+def _results_cache_scope(reporter: str) -> str:
+    """The parse-cache scope of a results file read by ``reporter``.
+
+    A reporter's records depend only on the file's path and content, the
+    reporter, and the elspais version (parsers are code).
+    """
+    from elspais import __version__
+
+    return "\0".join(["results", reporter, __version__])
+
+
+# Implements: REQ-d00054-A
+def _read_target_results(
+    target,
+    path: Path,
+    *,
+    cache: ParseCache | None = None,
+    memo: ParseMemo | None = None,
+) -> Iterable[dict] | None:
+    """The reporter records in one of ``target``'s result files.
+
+    CI can leave hundreds of result shards behind, and most are unchanged
+    from one build to the next. A shard whose stat signature matches
+    ``memo`` is neither read nor parsed; one whose content digest matches a
+    ``cache`` entry is read but not parsed. Either way the records are the
+    reporter's own output, before ``_ingest_target_results`` adapts them to
+    the target, so they are shared between builds and never modified.
+
+    A reporter whose parser can read a file itself (``iter_file``) is not
+    handed the file's text: its records are streamed, so a report of any
+    size is never held whole. A stream that hits malformed input ends
+    there, keeping the records before it, and is not cached.
+
+    Returns None when the target's reporter does not produce results.
+    """
+    spec = _results_reporter(target)
+    if spec is None:
+        return None
+    source_path = str(path)
+    scope = _results_cache_scope(target.reporter)
+    signature = None
+    if memo is not None:
+        records, signature = memo.get(scope, source_path)
+        if records is not None:
+            return records
+    parser = spec.parser_factory()
+    iter_file = getattr(parser, "iter_file", None)
+    if iter_file is None:
+        text = path.read_text(encoding="utf-8", errors="replace")
+        key = ParseCache.key(scope, source_path, text) if cache is not None else ""
+        records = cache.get(key) if cache is not None else None
+        if records is None:
+            records = parser.parse(text, source_path)
+            if cache is not None:
+                cache.put(key, records)
+        if memo is not None:
+            memo.put(scope, source_path, signature, records)
+        return records
+
+    key = ParseCache.file_key(scope, source_path, path) if cache is not None else ""
+    records = cache.get(key) if cache is not None else None
+    if records is not None:
+        if memo is not None:
+            memo.put(scope, source_path, signature, records)
+        return records
+    if cache is None and memo is None:
+        return _stream_records(iter_file(path, source_path), source_path, None)
+
+    def store(complete: list[dict]) -> None:
+        if cache is not None:
+            cache.put(key, complete)
+        if memo is not None:
+            memo.put(scope, source_path, signature, complete)
+
+    return _stream_records(iter_file(path, source_path), source_path, store)
+
+
+def _stream_records(
+    records: Iterator[dict],
+    source_path: str,
+    store: Callable[[list[dict]], None] | None,
+) -> Iterator[dict]:
+    """Yield ``records``, handing the complete list to ``store`` at the end."""
+    kept: list[dict] = []
+    try:
+        for rec in records:
+            if store is not None:
+                kept.append(rec)
+            yield rec
+    except ET.ParseError as e:
+        _log.warning(
+            "results file %s is not well-formed (%s); keeping results before it", source_path, e
+        )
+        return
+    if store is not None:
+        store(kept)
+
+
 def _ingest_target_results(
     builder,
     target,
@@ -74,34 +207,26 @@ def _ingest_target_results(
     source_path: str = "",
     *,
     carried: bool = False,
+    records: Iterable[dict] | None = None,
 ) -> int:
     """Parse a target's reporter output and add RESULT ParsedContent.
 
     Each ParsedContent carries real source_file (repo-relative) + match.
-    Returns the count of RESULT records added.
+    Returns the count of RESULT records added. ``records``, when given, are
+    the reporter's already-parsed records for ``results_text`` (see
+    ``_read_target_results``) and are not modified.
 
     Only "results"-kind reporters are handled; coverage-kind reporters are
     skipped (returns 0 immediately).
     """
     from elspais.graph.parsers import ParsedContent
-    from elspais.graph.parsers.results.registry import get_reporter
 
-    try:
-        spec = get_reporter(target.reporter)
-    except KeyError:
-        _log.debug("_ingest_target_results: unknown reporter %r, skipping", target.reporter)
+    spec = _results_reporter(target)
+    if spec is None:
         return 0
 
-    if spec.kind != "results":
-        _log.debug(
-            "_ingest_target_results: reporter %r is kind=%r, not 'results', skipping",
-            target.reporter,
-            spec.kind,
-        )
-        return 0
-
-    parser = spec.parser_factory()
-    records = parser.parse(results_text, source_path)
+    if records is None:
+        records = spec.parser_factory().parse(results_text, source_path)
 
     # Implements: REQ-d00254-O
     # Normalise the producer's line origin to the tool's own numbering, once,
@@ -111,10 +236,17 @@ def _ingest_target_results(
     # artifact and is already 1-based, so it is left alone.
     line_shift = 1 - (target.line_base if target.line_base is not None else spec.line_base)
     if line_shift:
-        for rec in records:
-            for key in ("line", "root_line"):
-                if isinstance(rec.get(key), int):
-                    rec[key] = rec[key] + line_shift
+        records = (
+            {
+                **rec,
+                **{
+                    key: rec[key] + line_shift
+                    for key in ("line", "root_line")
+                    if isinstance(rec.get(key), int)
+                },
+            }
+            for rec in records
+        )
     repo_root_resolved = Path(repo_root).resolve()
     count = 0
     for rec in records:
@@ -189,6 +321,139 @@ def _ingest_target_results(
     return count
 
 
+# Implements: REQ-d00054-A
+def _open_parse_pool(workers: int) -> Executor | None:
+    """Open the process pool for the parse stage, or None to parse serially.
+
+    Args:
+        workers: Worker count from ``[scanning] workers``; 1 (the default)
+            means serial, 0 means one worker per CPU.
+    """
+    if workers == 0:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        return None
+    from concurrent.futures import ProcessPoolExecutor
+
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+# Implements: REQ-d00203-A
+def _member_workers(workers: int, members: int) -> int:
+    """Processes of a ``workers`` budget given to concurrent member builds.
+
+    Members get at most half the budget (but at least one process), so the
+    host's parse pool keeps the rest and the two never exceed ``workers``.
+    """
+    return min(members, max(workers // 2, 1))
+
+
+# Implements: REQ-d00203-A
+def _start_member_builds(
+    plan: list[PlannedRepo],
+    workers: int,
+    build_kwargs: dict[str, Any],
+    *,
+    skip: Container[str] = (),
+) -> dict[str, Future[bytes]] | None:
+    """Start building every loadable associate in ``plan`` in worker processes.
+
+    Members are independent of one another and of the host until the
+    federation wires them together, so with ``workers`` above 1 (or 0, one
+    per CPU) they are built concurrently -- beside the host's own build --
+    and each comes back packed by ``pack_graph()``. They share the budget
+    with the host's parse pool (``_member_workers``). Returns None, building
+    nothing, when that would not run two builds at once. Members named in
+    ``skip`` are left out.
+    """
+    members = [
+        (member.name, member.config, member.repo_root)
+        for member in plan[1:]
+        if member.config is not None and member.name not in skip
+    ]
+    if workers == 0:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or not members:
+        return None
+    from concurrent.futures import ProcessPoolExecutor
+
+    pool = ProcessPoolExecutor(max_workers=_member_workers(workers, len(members)))
+    futures = {
+        name: pool.submit(_build_member_packed, config, member_root, **build_kwargs)
+        for name, config, member_root in members
+    }
+    # No more work is coming: the pool winds down once these are done,
+    # whether or not the host build gets as far as collecting them.
+    pool.shutdown(wait=False)
+    return futures
+
+
+def _build_member_packed(config: dict[str, Any], repo_root: Path, **build_kwargs: Any) -> bytes:
+    """Build one federation member in a worker process, packed for the host.
+
+    Module-level so a process pool can pickle it by reference. The member
+    parses serially: the pool is already one process per member.
+    """
+    from elspais.graph.transfer import pack_graph
+
+    member_fg = build_graph(
+        config=config,
+        repo_root=repo_root,
+        _build_associates=False,
+        workers=1,
+        **build_kwargs,
+    )
+    return pack_graph(list(member_fg.iter_repos())[0].graph)
+
+
+def _load_member_snapshots(
+    plan: list[PlannedRepo],
+    resolvers: list[IdResolver],
+    *,
+    scan_code: bool,
+    scan_tests: bool,
+    store: MemberSnapshotCache | None,
+    memo: ParseMemo | None,
+) -> tuple[dict[str, str], dict[str, TraceGraph]]:
+    """Key every loadable associate in ``plan`` and load those with a snapshot.
+
+    Returns:
+        ``(keys, graphs)``: the snapshot key of each member that can be
+        snapshotted, and the graph of each one whose snapshot was found in
+        ``memo`` or ``store``. An unreadable snapshot is left out, so that
+        member is built again.
+    """
+    from elspais.graph.transfer import unpack_graph
+
+    keys: dict[str, str] = {}
+    graphs: dict[str, TraceGraph] = {}
+    for member in plan[1:]:
+        if member.config is None:
+            continue
+        key = snapshot_key(
+            member.repo_root,
+            member.config,
+            resolvers,
+            scan_code=scan_code,
+            scan_tests=scan_tests,
+        )
+        if key is None:
+            continue
+        keys[member.name] = key
+        packed = memo.get_member(key) if memo is not None else None
+        if packed is None and store is not None:
+            packed = store.get(key)
+            if packed is not None and memo is not None:
+                memo.put_member(key, packed)
+        if packed is None:
+            continue
+        try:
+            graphs[member.name] = unpack_graph(packed)
+        except Exception as e:  # corrupt or foreign snapshot: rebuild instead
+            _log.debug("member %r: unreadable snapshot (%s)", member.name, e)
+    return keys, graphs
+
+
 def _validate_config(config: dict[str, Any]) -> ElspaisConfig:
     """Validate a config dict into ElspaisConfig (see config.validate_config)."""
     from elspais.config import validate_config
@@ -302,7 +567,6 @@ def _run_prescan_command(
     Returns:
         Dict mapping file path -> list of function entries, or None on failure.
     """
-    import json
     import subprocess
     import sys
 
@@ -553,6 +817,8 @@ def build_graph(
     captured_results: dict[str, str] | None = None,
     fresh_targets: set[str] | None = None,
     federation_resolvers: list[IdResolver] | None = None,
+    workers: int | None = None,
+    parse_memo: ParseMemo | None = None,
 ) -> FederatedGraph:
     """Build a FederatedGraph from spec directories.
 
@@ -564,6 +830,8 @@ def build_graph(
     - Graph construction
     - Code and test directory scanning (configurable)
     - Multi-repo federation via [associates] config
+    - Graph snapshots via [scanning] snapshot, loaded instead of building
+      while every repository is unchanged since the snapshot was written
 
     Args:
         config: Pre-loaded config dict (optional).
@@ -587,6 +855,14 @@ def build_graph(
             its own configuration; sharing the set is what lets a member's
             code and tests name the identifiers its siblings own. Resolved
             here from the declarations when not supplied.
+        workers: Worker processes for the file parse stage, overriding
+            ``[scanning] workers``. 1 parses serially, 0 uses one worker per
+            CPU. The graph is identical either way. Above 1, a federation's
+            associates are also built concurrently, each in its own process,
+            unless ``parse_memo`` is given.
+        parse_memo: Parse results retained by a long-lived caller from its
+            previous build. Files whose stat signature is unchanged are
+            neither read nor parsed again; the memo is updated in place.
 
     Returns:
         FederatedGraph wrapping one or more TraceGraph instances.
@@ -594,6 +870,15 @@ def build_graph(
     Priority:
         spec_dirs > config > config_path > defaults
     """
+    # A build from a repository's own configuration alone is what a graph
+    # snapshot can stand in for; overrides and member builds are not.
+    snapshot_eligible = (
+        _build_associates
+        and spec_dirs is None
+        and captured_results is None
+        and federation_resolvers is None
+    )
+
     # Default repo_root
     if repo_root is None:
         repo_root = Path.cwd()
@@ -629,6 +914,73 @@ def build_graph(
             federation_resolvers.extend(
                 build_resolver(member.config) for member in plan[1:] if member.config is not None
             )
+    # Implements: REQ-d00054-A
+    # A tree unchanged since the last build answers from that build's
+    # snapshot, before any file is read. A caller whose parse memo is
+    # already warm builds as usual: the memo would learn nothing from a
+    # snapshot, and its next prune would empty it. Nor is the build it
+    # makes written back -- keying and packing the whole federation on
+    # every daemon rebuild costs more than the next process start saves.
+    snapshot_id = None
+    if (
+        snapshot_eligible
+        and typed_config.scanning.snapshot
+        and not parse_memo
+        and isinstance(config, dict)
+    ):
+        snapshot_id = federation_key(
+            repo_root,
+            config,
+            plan[1:] if plan is not None else (),
+            federation_resolvers,
+            scan_code=scan_code,
+            scan_tests=scan_tests,
+            strict=strict,
+            fresh_targets=fresh_targets,
+        )
+        if snapshot_id is not None:
+            snapshot = load_snapshot(graph_snapshot_path(repo_root), snapshot_id)
+            if snapshot is not None:
+                return snapshot
+
+    # Members whose repository is unchanged since an earlier build are
+    # loaded from their snapshot instead, and are not built at all.
+    member_store = (
+        MemberSnapshotCache(member_cache_dir(repo_root)) if typed_config.scanning.cache else None
+    )
+    member_keys: dict[str, str] = {}
+    member_snapshots: dict[str, TraceGraph] = {}
+    if plan is not None and (member_store is not None or parse_memo is not None):
+        member_keys, member_snapshots = _load_member_snapshots(
+            plan,
+            federation_resolvers,
+            scan_code=scan_code,
+            scan_tests=scan_tests,
+            store=member_store,
+            memo=parse_memo,
+        )
+    # Implements: REQ-d00203-A
+    # With parse workers configured, associates build in their own processes
+    # while this repository is scanned below. A caller holding a parse memo
+    # keeps the serial path: the memo lives in this process.
+    parse_workers = typed_config.scanning.workers if workers is None else workers
+    if parse_workers == 0:
+        parse_workers = os.cpu_count() or 1
+    member_builds = None
+    if plan is not None and parse_memo is None:
+        member_builds = _start_member_builds(
+            plan,
+            parse_workers,
+            {
+                "scan_code": scan_code,
+                "scan_tests": scan_tests,
+                "federation_resolvers": federation_resolvers,
+            },
+            skip=member_snapshots,
+        )
+        if member_builds:
+            # The member pool and the parse pool share one budget.
+            parse_workers -= _member_workers(parse_workers, len(member_builds))
     own_namespace = default_resolver.config.namespace
     member_resolvers = [r for r in federation_resolvers if r.config.namespace != own_namespace]
 
@@ -661,6 +1013,9 @@ def build_graph(
 
     # Track FILE nodes created to avoid duplicates
     file_nodes: dict[str, GraphNode] = {}  # resolved_path -> FILE node
+    # Python test files' imports as read during their parse, for the
+    # TEST->CODE linker (FILE node id -> module paths)
+    test_file_imports: dict[str, list[str]] = {}
 
     def _get_or_create_file_node(
         source_path: Path,
@@ -695,187 +1050,244 @@ def build_graph(
             fn.set_field("file_types", existing_types)
         return file_nodes[resolved]
 
-    for spec_dir in spec_dirs:
-        # Resolve full scan config for this spec dir from its own .elspais.toml
-        dir_config = _resolve_spec_dir_config(spec_dir)
-
-        domain_file = DomainFile(
-            spec_dir,
-            patterns=dir_config.file_patterns,
-            recursive=True,
-            skip_dirs=dir_config.skip_dirs,
-            skip_files=dir_config.skip_files,
-        )
-
-        # Use Lark FileDispatcher for spec file parsing
-        for parsed_content in domain_file.dispatch(dir_config.dispatcher.dispatch_spec):
-            # Check if source should be ignored using [ignore].spec patterns
-            source_path = parsed_content.source_context.metadata.get("path")
-            if source_path and dir_config.ignore_config.should_ignore(source_path, scope="spec"):
-                continue
-            # Implements: REQ-d00128-A
-            # Create FILE node for this spec file
-            file_node = None
-            if source_path:
-                file_node = _get_or_create_file_node(Path(source_path), FileType.SPEC)
-            builder.add_parsed_content(parsed_content, file_node=file_node)
-
-    # 5. Scan code files from [traceability].scan_patterns AND [directories].code
-    if scan_code:
-        scanned_code_files: set[str] = set()
-
-        # 5a. Explicit scan_patterns (existing behavior)
-        scan_patterns = list(typed_config.scanning.code.file_patterns)
-
-        for pattern in scan_patterns:
-            # Resolve glob pattern relative to repo_root
-            matched_files = glob(str(repo_root / pattern), recursive=True)
-            for file_path in matched_files:
-                path = Path(file_path)
-                if path.is_file():
-                    resolved = str(path.resolve())
-                    scanned_code_files.add(resolved)
-                    # Implements: REQ-d00128-A
-                    fn = _get_or_create_file_node(path, FileType.CODE)
-                    domain_file = DomainFile(path)
-                    for parsed_content in domain_file.dispatch(default_dispatcher.dispatch_code):
-                        builder.add_parsed_content(parsed_content, file_node=fn)
-
-        # 5b. [directories].code with default file patterns
-        code_dirs = get_code_directories(config, repo_root)
-        ignore_dirs = list(typed_config.scanning.skip)
+    # Implements: REQ-d00054-A
+    # Opt-in parallel parse stage. Workers only read and parse; every
+    # result is handed back and fed to the single builder in file order,
+    # so the graph is the one the serial path builds.
+    parse_pool = _open_parse_pool(parse_workers)
+    # Files whose content, path and dispatcher are unchanged since an earlier
+    # build are served from the on-disk parse cache instead of re-parsed.
+    parse_cache = ParseCache(parse_cache_dir(repo_root)) if typed_config.scanning.cache else None
+    try:
+        for spec_dir in spec_dirs:
+            # Resolve full scan config for this spec dir from its own .elspais.toml
+            dir_config = _resolve_spec_dir_config(spec_dir)
 
-        for code_dir in code_dirs:
             domain_file = DomainFile(
-                code_dir,
-                patterns=DEFAULT_CODE_PATTERNS,
+                spec_dir,
+                patterns=dir_config.file_patterns,
                 recursive=True,
-                skip_dirs=ignore_dirs,
+                skip_dirs=dir_config.skip_dirs,
+                skip_files=dir_config.skip_files,
+                # [ignore].spec patterns are applied during the walk, so an
+                # ignored file is never read or parsed
+                ignore_config=dir_config.ignore_config,
+                ignore_scope="spec",
             )
-            # Track files already checked for ignore/dedup in this loop
-            checked_files: set[str] = set()
-            skip_files: set[str] = set()
-            for parsed_content in domain_file.dispatch(default_dispatcher.dispatch_code):
+
+            # Use Lark FileDispatcher for spec file parsing
+            spec_dispatcher = dir_config.dispatcher
+            assert spec_dispatcher is not None  # _resolve_spec_dir_config always sets one
+            for parsed_content in domain_file.dispatch(
+                spec_dispatcher.dispatch_spec,
+                executor=parse_pool,
+                cache=parse_cache,
+                memo=parse_memo,
+                cache_scope=spec_dispatcher.cache_scope("spec"),
+            ):
                 source_path = parsed_content.source_context.metadata.get("path")
-                if source_path:
-                    resolved = str(Path(source_path).resolve())
-                    # Skip files already processed by scan_patterns (step 5a)
-                    if resolved in scanned_code_files:
-                        continue
-                    # Check ignore only once per file
-                    if resolved not in checked_files:
-                        checked_files.add(resolved)
-                        if default_ignore_config.should_ignore(source_path, scope="code"):
-                            skip_files.add(resolved)
-                    if resolved in skip_files:
-                        continue
                 # Implements: REQ-d00128-A
-                fn = None
+                # Create FILE node for this spec file
+                file_node = None
                 if source_path:
-                    fn = _get_or_create_file_node(Path(source_path), FileType.CODE)
-                builder.add_parsed_content(parsed_content, file_node=fn)
-
-    # 6. Scan test directories from testing config
-    if scan_tests:
-        testing_cfg = typed_config.scanning.test
-        if testing_cfg.enabled:
-            test_dirs = list(testing_cfg.directories)
-            test_patterns = list(testing_cfg.file_patterns)
-            test_skip_dirs = list(testing_cfg.skip_dirs)
-
-            # Run external prescan command if configured
-            prescan_command = testing_cfg.prescan_command
-            prescan_data: dict[str, list[dict]] | None = None
-            if prescan_command:
-                prescan_data = _run_prescan_command(
-                    prescan_command, test_dirs, test_patterns, test_skip_dirs, repo_root
-                )
-                # Paths go out on stdin repo-relative, so a conforming command
-                # answers with those, while scanning dispatches absolute paths.
-                # Alias each relative key to its absolute form so records govern
-                # either way (REQ-d00254-N).
-                if prescan_data:
-                    for reported in list(prescan_data):
-                        if not Path(reported).is_absolute():
-                            prescan_data.setdefault(
-                                str(repo_root / reported), prescan_data[reported]
-                            )
+                    file_node = _get_or_create_file_node(Path(source_path), FileType.SPEC)
+                builder.add_parsed_content(parsed_content, file_node=file_node)
+
+        # 5. Scan code files from [traceability].scan_patterns AND [directories].code
+        if scan_code:
+            scanned_code_files: set[str] = set()
+
+            # 5a. Explicit scan_patterns (existing behavior)
+            scan_patterns = list(typed_config.scanning.code.file_patterns)
+
+            # Resolve glob patterns relative to repo_root; patterns sharing
+            # a leading directory share one walk of it
+            pattern_files = glob_files(repo_root, scan_patterns)
+            for ctx, parsed_list in dispatch_files(
+                pattern_files,
+                default_dispatcher.dispatch_code,
+                executor=parse_pool,
+                cache=parse_cache,
+                memo=parse_memo,
+                cache_scope=default_dispatcher.cache_scope("code"),
+            ):
+                path = ctx.metadata["path"]
+                scanned_code_files.add(str(path.resolve()))
+                # Implements: REQ-d00128-A
+                fn = _get_or_create_file_node(path, FileType.CODE)
+                for parsed_content in parsed_list:
+                    builder.add_parsed_content(parsed_content, file_node=fn)
 
-            # Build dispatch function with prescan data
-            def _dispatch_test(content: str, file_path: str) -> list:
-                return default_dispatcher.dispatch_test(
-                    content, file_path, prescan_data=prescan_data
+            # 5b. [directories].code with default file patterns
+            code_dirs = get_code_directories(config, repo_root)
+            ignore_dirs = list(typed_config.scanning.skip)
+
+            for code_dir in code_dirs:
+                domain_file = DomainFile(
+                    code_dir,
+                    patterns=DEFAULT_CODE_PATTERNS,
+                    recursive=True,
+                    skip_dirs=ignore_dirs,
+                    # [ignore].code patterns prune the walk itself: ignored
+                    # trees are never listed, read or parsed
+                    ignore_config=default_ignore_config,
+                    ignore_scope="code",
                 )
+                # Skip files already processed by scan_patterns (step 5a)
+                # before they are read, not after they are parsed
+                code_files = [
+                    path
+                    for path in domain_file.iterate_paths()
+                    if str(path.resolve()) not in scanned_code_files
+                ]
+                for ctx, parsed_list in dispatch_files(
+                    code_files,
+                    default_dispatcher.dispatch_code,
+                    executor=parse_pool,
+                    cache=parse_cache,
+                    memo=parse_memo,
+                    cache_scope=default_dispatcher.cache_scope("code"),
+                ):
+                    if not parsed_list:
+                        continue
+                    # Implements: REQ-d00128-A
+                    fn = _get_or_create_file_node(ctx.metadata["path"], FileType.CODE)
+                    for parsed_content in parsed_list:
+                        builder.add_parsed_content(parsed_content, file_node=fn)
 
-            for dir_pattern in test_dirs:
-                # Resolve glob pattern to get directories
-                matched_dirs = glob(str(repo_root / dir_pattern), recursive=True)
-                for dir_path in matched_dirs:
-                    path = Path(dir_path)
-                    if path.is_dir():
-                        domain_file = DomainFile(
-                            path,
-                            patterns=test_patterns,
-                            recursive=True,
-                            skip_dirs=test_skip_dirs,
-                        )
-                        for parsed_content in domain_file.dispatch(_dispatch_test):
-                            # Implements: REQ-d00128-A
-                            source_path = parsed_content.source_context.metadata.get("path")
-                            fn = None
-                            if source_path:
-                                fn = _get_or_create_file_node(Path(source_path), FileType.TEST)
-                            builder.add_parsed_content(parsed_content, file_node=fn)
-
-            # 6b-target. Ingest results from [[scanning.test.targets]] via reporter registry.
-            # Implements: REQ-d00128-A+H
-            # RemainderParser is NOT registered for RESULT file types.
-            # When targets is empty (the default) this loop is a no-op.
-            _captured = captured_results or {}
-            resolved_root = repo_root.resolve()
-            for target in typed_config.scanning.test.targets:
-                if not target.reporter:
-                    continue
-                # Implements: REQ-d00254-I
-                carried = fresh_targets is not None and target.name not in fresh_targets
-                # cwd-escape guard: skip targets whose cwd resolves outside the repo root
-                cwd_path = (repo_root / target.cwd) if target.cwd else repo_root
-                try:
-                    cwd_path.resolve().relative_to(resolved_root)
-                except ValueError:
-                    _log.warning(
-                        "target %r: cwd %r escapes repo root -- skipping",
-                        target.name,
-                        target.cwd,
-                    )
-                    continue
-                if target.name in _captured:
-                    _ingest_target_results(
-                        builder, target, _captured[target.name], repo_root, "", carried=carried
+        # 6. Scan test directories from testing config
+        if scan_tests:
+            testing_cfg = typed_config.scanning.test
+            if testing_cfg.enabled:
+                test_dirs = list(testing_cfg.directories)
+                test_patterns = list(testing_cfg.file_patterns)
+                test_skip_dirs = list(testing_cfg.skip_dirs)
+
+                # Run external prescan command if configured
+                prescan_command = testing_cfg.prescan_command
+                prescan_data: dict[str, list[dict]] | None = None
+                if prescan_command:
+                    prescan_data = _run_prescan_command(
+                        prescan_command, test_dirs, test_patterns, test_skip_dirs, repo_root
                     )
-                elif target.results:
-                    matched = glob(str(cwd_path / target.results), recursive=True)
-                    if matched:
-                        for f in matched:
-                            if Path(f).is_file():
-                                # Implements: REQ-d00128-A
-                                _get_or_create_file_node(Path(f), FileType.RESULT)
-                                _ingest_target_results(
-                                    builder,
-                                    target,
-                                    Path(f).read_text(encoding="utf-8", errors="replace"),
-                                    repo_root,
-                                    str(Path(f)),
-                                    carried=carried,
+                    # Paths go out on stdin repo-relative, so a conforming command
+                    # answers with those, while scanning dispatches absolute paths.
+                    # Alias each relative key to its absolute form so records govern
+                    # either way (REQ-d00254-N).
+                    if prescan_data:
+                        for reported in list(prescan_data):
+                            if not Path(reported).is_absolute():
+                                prescan_data.setdefault(
+                                    str(repo_root / reported), prescan_data[reported]
                                 )
+
+                # Build dispatch function with prescan data (a partial, not a
+                # closure, so the parse pool can pickle it)
+                _dispatch_test = functools.partial(
+                    default_dispatcher.dispatch_test, prescan_data=prescan_data
+                )
+                # The prescan command's output is parse input too
+                test_cache_scope = default_dispatcher.cache_scope(
+                    "test", extra=json.dumps(prescan_data, sort_keys=True, default=str)
+                )
+
+                for dir_pattern in test_dirs:
+                    # Resolve glob pattern to get directories
+                    matched_dirs = glob(str(repo_root / dir_pattern), recursive=True)
+                    for dir_path in matched_dirs:
+                        path = Path(dir_path)
+                        if path.is_dir():
+                            domain_file = DomainFile(
+                                path,
+                                patterns=test_patterns,
+                                recursive=True,
+                                skip_dirs=test_skip_dirs,
+                            )
+                            for parsed_content in domain_file.dispatch(
+                                _dispatch_test,
+                                executor=parse_pool,
+                                cache=parse_cache,
+                                memo=parse_memo,
+                                cache_scope=test_cache_scope,
+                            ):
+                                # Implements: REQ-d00128-A
+                                source_path = parsed_content.source_context.metadata.get("path")
+                                fn = None
+                                if source_path:
+                                    fn = _get_or_create_file_node(Path(source_path), FileType.TEST)
+                                if parsed_content.content_type == "python_imports":
+                                    if fn is not None:
+                                        test_file_imports[fn.id] = parsed_content.parsed_data[
+                                            "modules"
+                                        ]
+                                    continue
+                                builder.add_parsed_content(parsed_content, file_node=fn)
+
+                # 6b-target. Ingest results from [[scanning.test.targets]] via reporter registry.
+                # Implements: REQ-d00128-A+H
+                # RemainderParser is NOT registered for RESULT file types.
+                # When targets is empty (the default) this loop is a no-op.
+                _captured = captured_results or {}
+                resolved_root = repo_root.resolve()
+                for target in typed_config.scanning.test.targets:
+                    if not target.reporter:
+                        continue
+                    # Implements: REQ-d00254-I
+                    carried = fresh_targets is not None and target.name not in fresh_targets
+                    # cwd-escape guard: skip targets whose cwd resolves outside the repo root
+                    cwd_path = (repo_root / target.cwd) if target.cwd else repo_root
+                    try:
+                        cwd_path.resolve().relative_to(resolved_root)
+                    except ValueError:
+                        _log.warning(
+                            "target %r: cwd %r escapes repo root -- skipping",
+                            target.name,
+                            target.cwd,
+                        )
+                        continue
+                    if target.name in _captured:
+                        _ingest_target_results(
+                            builder, target, _captured[target.name], repo_root, "", carried=carried
+                        )
+                    elif target.results:
+                        matched = glob(str(cwd_path / target.results), recursive=True)
+                        if matched:
+                            for f in matched:
+                                if Path(f).is_file():
+                                    # Implements: REQ-d00128-A
+                                    _get_or_create_file_node(Path(f), FileType.RESULT)
+                                    # Unchanged shards are replayed from the
+                                    # memo or the parse cache, not re-parsed.
+                                    _ingest_target_results(
+                                        builder,
+                                        target,
+                                        "",
+                                        repo_root,
+                                        str(Path(f)),
+                                        carried=carried,
+                                        records=_read_target_results(
+                                            target,
+                                            Path(f),
+                                            cache=parse_cache,
+                                            memo=parse_memo,
+                                        ),
+                                    )
+                        else:
+                            _log.debug(
+                                "target %r: no files matched %r", target.name, target.results
+                            )
                     else:
-                        _log.debug("target %r: no files matched %r", target.name, target.results)
-                else:
-                    _log.debug(
-                        "target %r: stdout reporter with no captured output and no results"
-                        " glob -- skipping",
-                        target.name,
-                    )
+                        _log.debug(
+                            "target %r: stdout reporter with no captured output and no results"
+                            " glob -- skipping",
+                            target.name,
+                        )
+
+    finally:
+        if parse_pool is not None:
+            parse_pool.shutdown()
+    if parse_cache is not None and parse_cache.writes:
+        parse_cache.prune()
 
     graph = builder.build()
 
@@ -889,6 +1301,8 @@ def build_graph(
         lcov_parser = LcovParser()
         cov_json_parser = CoverageJsonParser()
         cov_sqlite_parser = CoverageSqliteParser()
+        # One per ingest: each context string is resolved to its TEST id once.
+        normalize_contexts = ContextNormalizer()
         _resolved_root = repo_root.resolve()
         for target in typed_config.scanning.test.targets:
             if not target.coverage:
@@ -924,6 +1338,7 @@ def build_graph(
                 cov_content = ""
             else:
                 cov_content = cov_path.read_text(encoding="utf-8")
+            parsed_cov: Iterable[tuple[str, dict]]
             if cov_parser is cov_sqlite_parser:
                 # Contexts are the suite-scaled part of the data (every test
                 # context string per executed line). Only materialize them
@@ -936,17 +1351,24 @@ def build_graph(
                         is not None
                     )
 
-                parsed_cov = cov_parser.parse(cov_content, str(cov_path), wanted_files=_wanted)
+                if target.coverage_reader == "direct":
+                    parsed_cov = cov_sqlite_parser.iter_direct(str(cov_path), wanted_files=_wanted)
+                else:
+                    parsed_cov = cov_sqlite_parser.parse(
+                        cov_content, str(cov_path), wanted_files=_wanted
+                    ).items()
             else:
-                parsed_cov = cov_parser.parse(cov_content, str(cov_path))
-            for source_file, data in parsed_cov.items():
+                parsed_cov = cov_parser.parse(cov_content, str(cov_path)).items()
+            for source_file, data in parsed_cov:
                 cov_node = _resolve_coverage_file_node(graph, source_file, cov_path, repo_root)
                 if cov_node is None:
                     continue
-                cov_node.set_field("line_coverage", data["line_coverage"])
+                cov_node.set_field("line_coverage", LineHits(data["line_coverage"]))
                 cov_node.set_field("executable_lines", data["executable_lines"])
                 if data.get("contexts"):
-                    cov_node.set_field("line_contexts", data["contexts"])
+                    cov_node.set_field(
+                        "line_contexts", LineContexts(data["contexts"], normalize_contexts)
+                    )
 
     # Link TEST nodes to CODE nodes via import analysis.
     # This creates TEST→CODE edges that enable transitive coverage:
@@ -956,7 +1378,7 @@ def build_graph(
 
         # Get source roots from config (default: ["src", ""])
         source_roots = typed_config.scanning.code.source_roots
-        link_tests_to_code(graph, repo_root, source_roots)
+        link_tests_to_code(graph, repo_root, source_roots, file_imports=test_file_imports)
 
     # Annotate keywords on all nodes so keyword search tools work
     # Annotate coverage metrics so all consumers (MCP, HTML, Flask) get coverage data
@@ -1041,20 +1463,41 @@ def build_graph(
                     )
                     continue
 
-                # The plan already resolved this member's own declarations,
-                # so each graph is built for itself alone.
-                member_fg = build_graph(
-                    config=member.config,
-                    repo_root=member.repo_root,
-                    scan_code=scan_code,
-                    scan_tests=scan_tests,
-                    _build_associates=False,
-                    federation_resolvers=federation_resolvers,
-                )
+                member_graph = member_snapshots.get(member.name)
+                if member_graph is None:
+                    # The plan already resolved this member's own
+                    # declarations, so each graph is built for itself alone.
+                    from elspais.graph.transfer import pack_graph, unpack_graph
+
+                    packed = None
+                    if member_builds is not None:
+                        packed = member_builds[member.name].result()
+                        member_graph = unpack_graph(packed)
+                    else:
+                        member_fg = build_graph(
+                            config=member.config,
+                            repo_root=member.repo_root,
+                            scan_code=scan_code,
+                            scan_tests=scan_tests,
+                            _build_associates=False,
+                            federation_resolvers=federation_resolvers,
+                            workers=workers,
+                            parse_memo=parse_memo,
+                        )
+                        member_graph = list(member_fg.iter_repos())[0].graph
+                    key = member_keys.get(member.name)
+                    if key is not None:
+                        # Packed before the federation wires anything into it.
+                        if packed is None:
+                            packed = pack_graph(member_graph)
+                        if parse_memo is not None:
+                            parse_memo.put_member(key, packed)
+                        if member_store is not None:
+                            member_store.put(key, packed)
                 entries.append(
                     RepoEntry(
                         name=member.name,
-                        graph=list(member_fg.iter_repos())[0].graph,
+                        graph=member_graph,
                         config=member.config,
                         repo_root=member.repo_root,
                         git_origin=member.git_origin,
@@ -1068,6 +1511,8 @@ def build_graph(
             federated = FederatedGraph(entries, root_repo=host_name)
             # Implements: REQ-d00254-I
             federated.render_fresh_targets = fresh_targets
+            if snapshot_id is not None:
+                write_snapshot(graph_snapshot_path(repo_root), snapshot_id, federated)
             return federated
 
     # Reached by a host with no associates to federate -- nothing will
@@ -1078,6 +1523,8 @@ def build_graph(
     federated = FederatedGraph.from_single(graph, config, repo_root)
     # Implements: REQ-d00254-I
     federated.render_fresh_targets = fresh_targets
+    if snapshot_id is not None:
+        write_snapshot(graph_snapshot_path(repo_root), snapshot_id, federated)
     return federated
 
 
@@ -8,12 +8,12 @@ delegating to the appropriate sub-graph based on node ownership.
 
 from __future__ import annotations
 
-import copy
 from collections.abc import Callable, Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from elspais.graph.clone import clone_graph
 from elspais.graph.GraphNode import (
     FileType,
     GraphNode,
@@ -1408,9 +1408,18 @@ class FederatedGraph:
     def clone(self) -> FederatedGraph:
         """Create a deep copy of this federated graph.
 
-        # Strategy: special — deep copy all sub-graphs independently
-        """
-        return copy.deepcopy(self)
+        # Strategy: special — clone every member's nodes into one memo, so
+        # cross-graph edges land on the cloned nodes, then deep copy the rest
+        """
+        return clone_graph(
+            self,
+            [
+                node
+                for entry in self._repos.values()
+                if entry.graph is not None
+                for node in (*entry.graph._index.values(), *entry.graph._deleted_nodes)
+            ],
+        )
 
     # ─────────────────────────────────────────────────────────────────────────
     # Cross-Graph Edge Wiring
@@ -141,14 +141,19 @@ def suggest_links(
         return []
 
     all_suggestions: list[LinkSuggestion] = []
+    # Parametrized variants of one test, among others, build the same
+    # query; each distinct query is searched once.
+    found: dict[str, list[dict[str, Any]]] = {}
 
     for test_node in unlinked:
         query = _extract_search_terms(test_node)
         if not query:
             continue
 
-        result = discover_fn(graph, query, scope_id="", limit=10)
-        assertions = result.get("assertions", [])
+        assertions = found.get(query)
+        if assertions is None:
+            result = discover_fn(graph, query, scope_id="", limit=10)
+            assertions = found[query] = result.get("assertions", [])
 
         _tfn = test_node.file_node()
         test_file = (_tfn.get_field("relative_path") or "") if _tfn else ""
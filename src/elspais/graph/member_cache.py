@@ -0,0 +1,212 @@
+# Implements: REQ-d00203-A
+"""Snapshots of federation member graphs, keyed by repository state.
+
+An associate is usually a pinned library repository that changes far less
+often than the repository it is federated into, yet every build of the
+host built every member again. A member's graph is a function of its
+checked-out tree, its configuration, the federation's identifier
+configurations, the scan switches and the elspais version, so a build
+packed with ``pack_graph()`` can stand in for the next one while all of
+those are unchanged.
+
+The tree is identified the way git sees it: the HEAD commit, plus the
+stat signature of every path ``git status`` reports as modified or
+untracked. What git ignores can still be build input -- generated
+sources, vendored specs, test result and coverage files -- so every file
+the member's build walk lists (``scan_inputs.scanned_signatures``) and
+every file its test targets read are signed as well. A member that is
+not the root of a git repository is never snapshotted.
+
+Snapshots live under the host's ``.elspais/cache/members/``, one file per
+key, and a long-lived caller also keeps them in its ``ParseMemo``. As with
+the parse cache, an unreadable entry is a miss and deleting the directory
+is always safe.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import subprocess
+from collections.abc import Iterable
+from glob import glob
+from pathlib import Path
+from typing import Any
+
+from elspais.graph.scan_inputs import scanned_signatures
+
+_log = logging.getLogger(__name__)
+
+
+def member_cache_dir(repo_root: Path) -> Path:
+    """The directory the member snapshots of ``repo_root``'s federation live in."""
+    return repo_root / ".elspais" / "cache" / "members"
+
+
+def _git(repo_root: Path, *args: str) -> str | None:
+    from elspais.utilities.git import _clean_git_env
+
+    try:
+        result = subprocess.run(
+            ["git", *args],
+            cwd=repo_root,
+            capture_output=True,
+            text=True,
+            env=_clean_git_env(),
+            check=False,
+        )
+    except OSError:
+        return None
+    return result.stdout if result.returncode == 0 else None
+
+
+def _signature(path: Path) -> str:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return "-"
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+def _target_inputs(config: dict[str, Any], repo_root: Path) -> list[Path]:
+    """The result and coverage files ``config``'s test targets read."""
+    targets = config.get("scanning", {}).get("test", {}).get("targets") or []
+    inputs: list[Path] = []
+    for target in targets:
+        cwd_path = repo_root / target.get("cwd", "")
+        if target.get("results"):
+            inputs.extend(
+                Path(f) for f in sorted(glob(str(cwd_path / target["results"]), recursive=True))
+            )
+        if target.get("coverage"):
+            inputs.append(cwd_path / target["coverage"])
+    return inputs
+
+
+def snapshot_key(
+    repo_root: Path,
+    config: dict[str, Any],
+    resolvers: Iterable[Any],
+    *,
+    scan_code: bool,
+    scan_tests: bool,
+) -> str | None:
+    """The snapshot key for the member at ``repo_root`` as it is now.
+
+    Args:
+        repo_root: The member's repository root.
+        config: The member's configuration.
+        resolvers: The federation's identifier resolvers; a member's
+            references are classified against all of them.
+        scan_code: Passed to the member's build.
+        scan_tests: Passed to the member's build.
+
+    Returns:
+        The key, or None when ``repo_root`` is not the root of a git
+        repository with a commit checked out.
+    """
+    from elspais import __version__
+
+    head = _git(repo_root, "rev-parse", "--show-toplevel", "HEAD")
+    if head is None:
+        return None
+    toplevel, _, commit = head.strip().partition("\n")
+    if not commit or Path(toplevel).resolve() != repo_root.resolve():
+        return None
+    # The member's .elspais/ state -- its caches, and the daemon's log,
+    # record and port file -- changes with every build and daemon run.
+    status = _git(
+        repo_root,
+        "status",
+        "--porcelain=v1",
+        "-z",
+        "--untracked-files=all",
+        "--",
+        ".",
+        ":(exclude).elspais/",
+    )
+    if status is None:
+        return None
+
+    h = hashlib.sha256()
+
+    def _add(part: str) -> None:
+        h.update(part.encode("utf-8", errors="surrogatepass"))
+        h.update(b"\0")
+
+    for part in (
+        __version__,
+        str(repo_root.resolve()),
+        commit,
+        f"code={scan_code},tests={scan_tests}",
+        json.dumps(config, sort_keys=True, default=str),
+        *(repr(r.config) for r in resolvers),
+    ):
+        _add(part)
+    # Each entry is "XY path", NUL-terminated; a rename or copy is followed
+    # by its origin path as one more, unprefixed entry.
+    entries = iter(status.split("\0"))
+    for entry in entries:
+        if not entry:
+            continue
+        _add(entry)
+        _add(_signature(repo_root / entry[3:]))
+        if entry[0] in "RC":
+            _add(next(entries, ""))
+    for path in _target_inputs(config, repo_root):
+        _add(str(path))
+        _add(_signature(path))
+    # git status misses what it ignores, and a build can scan exactly that
+    # (generated sources, vendored specs): sign every file the build lists.
+    scanned = scanned_signatures(config, repo_root, scan_code=scan_code, scan_tests=scan_tests)
+    for path_str in sorted(scanned):
+        mtime_ns, size, _inode = scanned[path_str]
+        _add(path_str)
+        _add(f"{mtime_ns}:{size}")
+    return h.hexdigest()
+
+
+class MemberSnapshotCache:
+    """On-disk store of packed member graphs.
+
+    Args:
+        cache_dir: Directory to keep snapshots in (created on first write).
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.graph"
+
+    def get(self, key: str) -> bytes | None:
+        """The packed graph stored under ``key``, or None on a miss."""
+        try:
+            data = self._path(key).read_bytes()
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store ``data`` under ``key``. Failures are logged and ignored."""
+        path = self._path(key)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        except OSError as e:
+            _log.debug("member cache: cannot write %s (%s)", path, e)
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+
+
+__all__ = ["MemberSnapshotCache", "member_cache_dir", "snapshot_key"]
@@ -0,0 +1,94 @@
+# Implements: REQ-d00130-E
+"""NodeIndex - id -> node map that also indexes its nodes by kind.
+
+``TraceGraph._index`` is read and written directly by the builder and by
+every mutation and undo path. Keeping the per-kind buckets inside the map
+itself means each of those writes maintains them without knowing they
+exist, so ``nodes_by_kind()`` costs the number of matching nodes instead
+of a scan of the whole graph.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from elspais.graph.GraphNode import GraphNode, NodeKind
+
+_MISSING: Any = object()
+
+
+class NodeIndex(dict[str, GraphNode]):
+    """A ``dict[str, GraphNode]`` with an ordered bucket per NodeKind.
+
+    Each bucket maps id -> node and keeps the map's own insertion order,
+    so iterating a kind yields the nodes ``values()`` would, in the same
+    order. A node's kind is fixed once it is indexed; changing an id goes
+    through ``pop()`` and re-insertion like any other key change.
+    """
+
+    __slots__ = ("_by_kind",)
+
+    def __init__(self, items: Iterable[tuple[str, GraphNode]] | dict[str, GraphNode] = ()) -> None:
+        super().__init__()
+        self._by_kind: dict[NodeKind, dict[str, GraphNode]] = {}
+        self.update(items)
+
+    def iter_kind(self, kind: NodeKind) -> Iterator[GraphNode]:
+        """Iterate the nodes of one kind in index order."""
+        bucket = self._by_kind.get(kind)
+        if bucket:
+            yield from bucket.values()
+
+    def count_kind(self, kind: NodeKind) -> int:
+        """Number of nodes of one kind."""
+        return len(self._by_kind.get(kind, ()))
+
+    def __setitem__(self, key: str, node: GraphNode) -> None:
+        old = dict.get(self, key)
+        if old is not None and old.kind is not node.kind:
+            self._by_kind[old.kind].pop(key, None)
+        dict.__setitem__(self, key, node)
+        self._by_kind.setdefault(node.kind, {})[key] = node
+
+    def __delitem__(self, key: str) -> None:
+        node = dict.pop(self, key)
+        self._by_kind[node.kind].pop(key, None)
+
+    def pop(self, key: str, default: Any = _MISSING) -> Any:
+        if key not in self:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        node = dict.pop(self, key)
+        self._by_kind[node.kind].pop(key, None)
+        return node
+
+    def popitem(self) -> tuple[str, GraphNode]:
+        key, node = dict.popitem(self)
+        self._by_kind[node.kind].pop(key, None)
+        return key, node
+
+    def setdefault(self, key: str, default: GraphNode) -> GraphNode:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, other: Any = (), /, **kwargs: GraphNode) -> None:
+        items = other.items() if hasattr(other, "items") else other
+        for key, node in items:
+            self[key] = node
+        for key, node in kwargs.items():
+            self[key] = node
+
+    def clear(self) -> None:
+        dict.clear(self)
+        self._by_kind.clear()
+
+    def copy(self) -> NodeIndex:
+        return NodeIndex(self)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Rebuild through __init__ so copy/pickle restore the buckets
+        # from the entries rather than from a separately-copied state.
+        return (NodeIndex, (list(self.items()),))
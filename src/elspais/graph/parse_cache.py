@@ -0,0 +1,274 @@
+# Implements: REQ-d00054-A
+"""On-disk cache of per-file parse results.
+
+A spec, code or test file's ``ParsedContent`` list is a pure function of
+its path, its content and the dispatcher that read it (grammar, identifier
+configuration, elspais version -- see ``FileDispatcher.cache_scope``). The
+cache stores that list under a key over all of them, so a rebuild over a
+tree where few files changed runs the Lark parse only for those few.
+
+Entries live under ``.elspais/cache/parse/``, one pickle per key. A missing,
+unreadable or corrupt entry is a miss, never an error: the cache can only
+save work, not change an answer. Every edit leaves its file's previous
+entry behind, so a build that stored anything prunes the cache back to
+``max_bytes``, least recently used entries first. Deleting the directory
+is always safe.
+
+``ParseMemo`` is the in-process counterpart a long-lived server holds
+across rebuilds. It is validated by each file's stat signature rather than
+its content, so an unchanged file is not even read: a rebuild after one
+edit re-reads and re-parses that one file.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+import time
+from pathlib import Path
+from typing import Any
+
+_log = logging.getLogger(__name__)
+
+# A file modified this recently before it was read may be modified again
+# within the filesystem's timestamp granularity without its signature
+# changing, so its memo entry is never trusted (git's "racily clean" rule).
+_RACY_WINDOW_NS = 2_000_000_000
+
+# Default ceiling on the size of one repository's parse cache.
+DEFAULT_MAX_BYTES = 256 << 20
+
+_Signature = tuple[int, int, int]
+# A file's ``ParsedContent`` list, or a results file's reporter records.
+_Parsed = list[Any]
+
+
+def parse_cache_dir(repo_root: Path) -> Path:
+    """The directory the parse cache for ``repo_root`` lives in."""
+    return repo_root / ".elspais" / "cache" / "parse"
+
+
+class ParseCache:
+    """Content-addressed store of ``ParsedContent`` lists and reporter records.
+
+    Args:
+        cache_dir: Directory to keep entries in (created on first write).
+        max_bytes: Size ``prune()`` trims the cache back to.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    @staticmethod
+    def key(scope: str, source_path: str, content: str) -> str:
+        """The entry key for one file's parse.
+
+        Args:
+            scope: The dispatcher's ``cache_scope`` for this kind of file.
+            source_path: The path the dispatcher is told the content came
+                from -- it is recorded in what the parse returns.
+            content: The file's text.
+        """
+        h = hashlib.sha256()
+        for part in (scope, source_path, content):
+            h.update(part.encode("utf-8", errors="surrogatepass"))
+            h.update(b"\0")
+        return h.hexdigest()
+
+    @staticmethod
+    def file_key(scope: str, source_path: str, file_path: Path) -> str:
+        """The entry key for a file's parse, hashing its bytes in chunks.
+
+        For files parsed straight from disk, which are never held whole as
+        text. Keys differ from ``key()``'s for the same content.
+
+        Raises:
+            OSError: The file cannot be read.
+        """
+        h = hashlib.sha256()
+        for part in (scope, source_path):
+            h.update(part.encode("utf-8", errors="surrogatepass"))
+            h.update(b"\0")
+        with open(file_path, "rb") as fh:
+            for chunk in iter(lambda: fh.read(1 << 20), b""):
+                h.update(chunk)
+        h.update(b"\1")
+        return h.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.pickle"
+
+    def get(self, key: str) -> _Parsed | None:
+        """The cached parse for ``key``, or None on a miss.
+
+        A hit is marked as used now, which is the order ``prune()`` evicts in.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as fh:
+                parsed: _Parsed = pickle.load(fh)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception as e:  # corrupt or foreign entry: re-parse instead
+            _log.debug("parse cache: unreadable entry %s (%s)", key, e)
+            self.misses += 1
+            return None
+        self.hits += 1
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return parsed
+
+    def put(self, key: str, parsed: _Parsed) -> None:
+        """Store ``parsed`` under ``key``. Failures are logged and ignored."""
+        path = self._path(key)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "wb") as fh:
+                pickle.dump(parsed, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+            self.writes += 1
+        except OSError as e:
+            _log.debug("parse cache: cannot write %s (%s)", path, e)
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+
+    def prune(self) -> int:
+        """Drop the least recently used entries beyond ``max_bytes``; return how many."""
+        entries: list[tuple[int, int, str]] = []
+        total = 0
+        try:
+            buckets = [e.path for e in os.scandir(self.cache_dir) if e.is_dir()]
+        except OSError:
+            return 0
+        for bucket in buckets:
+            try:
+                with os.scandir(bucket) as it:
+                    for entry in it:
+                        if entry.name.endswith(".pickle"):
+                            st = entry.stat()
+                            entries.append((st.st_mtime_ns, st.st_size, entry.path))
+                            total += st.st_size
+            except OSError:
+                continue
+        removed = 0
+        entries.sort()
+        for _used, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
+
+
+class ParseMemo:
+    """Parse results kept in memory from one build to the next.
+
+    Entries are keyed by (dispatcher scope, file) and carry the file's
+    ``(st_mtime_ns, st_size, st_ino)`` as read before it was parsed. A
+    lookup whose signature still matches is served without opening the
+    file; anything else is a miss and the file is read and parsed again.
+
+    It also keeps packed federation member graphs by snapshot key (see
+    ``elspais.graph.member_cache``), so a rebuild whose associates are
+    unchanged builds only the host.
+
+    Entries for files that disappear would otherwise live as long as the
+    process, so ``prune()`` drops every entry not looked up since the
+    previous prune. The holder calls it after each complete build.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[str, str], tuple[_Signature | None, _Parsed]] = {}
+        self._used: set[tuple[str, str]] = set()
+        self._members: dict[str, bytes] = {}
+        self._members_used: set[str] = set()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def signature(file_path: str) -> _Signature | None:
+        """The stat signature of ``file_path``, or None when it cannot be trusted."""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        if time.time_ns() - st.st_mtime_ns < _RACY_WINDOW_NS:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def get(self, scope: str, file_path: str) -> tuple[_Parsed | None, _Signature | None]:
+        """Look up ``file_path``'s parse under ``scope``.
+
+        Returns:
+            ``(parsed, signature)``. ``parsed`` is None on a miss; the
+            signature is the one to ``put`` with after re-parsing, taken
+            before the file is read so a concurrent edit is never masked.
+        """
+        key = (scope, file_path)
+        self._used.add(key)
+        signature = self.signature(file_path)
+        entry = self._entries.get(key)
+        if signature is not None and entry is not None and entry[0] == signature:
+            self.hits += 1
+            return entry[1], signature
+        self.misses += 1
+        return None, signature
+
+    def put(
+        self,
+        scope: str,
+        file_path: str,
+        signature: _Signature | None,
+        parsed: _Parsed,
+    ) -> None:
+        """Remember ``parsed`` for ``file_path`` as of ``signature``."""
+        key = (scope, file_path)
+        self._used.add(key)
+        if signature is None:
+            self._entries.pop(key, None)
+        else:
+            self._entries[key] = (signature, parsed)
+
+    def get_member(self, key: str) -> bytes | None:
+        """The packed member graph kept under snapshot ``key``, or None."""
+        self._members_used.add(key)
+        return self._members.get(key)
+
+    def put_member(self, key: str, data: bytes) -> None:
+        """Keep the packed member graph ``data`` under snapshot ``key``."""
+        self._members_used.add(key)
+        self._members[key] = data
+
+    def prune(self) -> int:
+        """Drop entries not looked up since the last prune; return how many."""
+        stale = [k for k in self._entries if k not in self._used]
+        for key in stale:
+            del self._entries[key]
+        self._used = set()
+        stale_members = [k for k in self._members if k not in self._members_used]
+        for member_key in stale_members:
+            del self._members[member_key]
+        self._members_used = set()
+        return len(stale) + len(stale_members)
+
+
+__all__ = ["ParseCache", "ParseMemo", "parse_cache_dir"]
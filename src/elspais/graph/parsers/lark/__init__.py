@@ -27,6 +27,7 @@ from lark import Lark
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    from elspais.graph.parsers.prescan import PythonSourceAnalysis
     from elspais.utilities.patterns import IdResolver
 
 # Directory containing .lark grammar files
@@ -128,6 +129,35 @@ class GrammarFactory:
         """SHA-256 hash of the fully-substituted grammar text."""
         return hashlib.sha256(text.encode()).hexdigest()
 
+    def _requirement_grammar(self) -> str:
+        """The fully-substituted requirement grammar text."""
+        return self._substitute(self._read_grammar("requirement.lark"), self._build_tokens())
+
+    def _reference_grammar(self) -> str:
+        """The fully-substituted reference grammar text."""
+        return self._substitute(
+            self._read_grammar("reference.lark"), self._build_tokens(federated=True)
+        )
+
+    def requirement_grammar_hash(self) -> str:
+        """Hash of the requirement grammar this factory compiles."""
+        return self._grammar_hash(self._requirement_grammar())
+
+    def reference_grammar_hash(self) -> str:
+        """Hash of the reference grammar this factory compiles."""
+        return self._grammar_hash(self._reference_grammar())
+
+    def reference_screen(self) -> re.Pattern[str]:
+        """A regex that finds every line the reference grammar can claim.
+
+        Each reference terminal needs a *Traceability* keyword, a member's
+        namespace followed by a separator, or a ``JNY-`` prefix on its
+        line. Content this pattern does not match anywhere therefore lexes
+        entirely as ordinary text, and can be read without the parser.
+        """
+        tokens = self._build_tokens(federated=True)
+        return re.compile(rf"(?:{tokens['__KEYWORDS__']})|(?:{tokens['__NAMESPACE__']})[-_]|JNY-")
+
     def get_requirement_parser(self) -> Lark:
         """Compile (or retrieve cached) requirement grammar parser.
 
@@ -136,8 +166,7 @@ class GrammarFactory:
         so metadata field terminals are only tried inside a requirement
         preamble -- the same text outside a requirement is lexed as TEXT.
         """
-        tokens = self._build_tokens()
-        full_grammar = self._substitute(self._read_grammar("requirement.lark"), tokens)
+        full_grammar = self._requirement_grammar()
 
         key = self._grammar_hash(full_grammar)
         if key not in self._cache:
@@ -151,8 +180,7 @@ class GrammarFactory:
 
     def get_reference_parser(self) -> Lark:
         """Compile (or retrieve cached) reference grammar parser."""
-        tokens = self._build_tokens(federated=True)
-        full_grammar = self._substitute(self._read_grammar("reference.lark"), tokens)
+        full_grammar = self._reference_grammar()
 
         key = self._grammar_hash(full_grammar)
         if key not in self._cache:
@@ -194,10 +222,43 @@ class FileDispatcher:
         from elspais.utilities.patterns import FederatedIdReader
 
         self._resolver = resolver
+        self._member_resolvers = tuple(member_resolvers)
         self._reader = FederatedIdReader(resolver, member_resolvers)
         self._factory = GrammarFactory(resolver, member_resolvers)
         self._req_parser: Lark | None = None
         self._ref_parser: Lark | None = None
+        self._ref_screen: re.Pattern[str] | None = None
+
+    def __getstate__(self) -> dict:
+        # Compiled parsers don't pickle; a worker process recompiles them on
+        # first use (and GrammarFactory caches them there per grammar hash).
+        state = self.__dict__.copy()
+        state["_req_parser"] = None
+        state["_ref_parser"] = None
+        return state
+
+    def cache_scope(self, kind: str, extra: str = "") -> str:
+        """Everything besides a file's path and content that its parse depends on.
+
+        Two parses agree when the grammar text, the identifier configuration
+        of every resolver involved (normalization reads more than the grammar
+        does), the elspais version (transformers are code) and ``extra`` all
+        agree. Used to key the on-disk parse cache.
+
+        Args:
+            kind: ``"spec"``, ``"code"`` or ``"test"`` -- the dispatch method.
+            extra: Further input the caller feeds that dispatch (e.g. the
+                prescan command's output for test files).
+        """
+        from elspais import __version__
+
+        if kind == "spec":
+            grammar = self._factory.requirement_grammar_hash()
+        else:
+            grammar = self._factory.reference_grammar_hash()
+        configs = [repr(r.config) for r in (self._resolver, *self._member_resolvers)]
+        text = "\0".join([kind, grammar, __version__, *configs, extra])
+        return hashlib.sha256(text.encode()).hexdigest()
 
     def _get_req_parser(self) -> Lark:
         if self._req_parser is None:
@@ -209,6 +270,18 @@ class FileDispatcher:
             self._ref_parser = self._factory.get_reference_parser()
         return self._ref_parser
 
+    def _may_reference(self, content: str) -> bool:
+        """Whether any line of ``content`` can lex as other than ordinary text.
+
+        Most code and test files name no requirement at all. For those the
+        reference parse, transform and string-literal scan are skipped:
+        ``ReferenceTransformer.transform_text`` returns exactly what they
+        would have.
+        """
+        if self._ref_screen is None:
+            self._ref_screen = self._factory.reference_screen()
+        return self._ref_screen.search(content) is not None
+
     @staticmethod
     def _neutralize_fenced_blocks(content: str) -> str:
         """Replace content inside fenced code blocks with neutral text.
@@ -247,7 +320,9 @@ class FileDispatcher:
         return fenced
 
     @staticmethod
-    def _quoted_line_numbers(content: str, file_path: str) -> set[int]:
+    def _quoted_line_numbers(
+        content: str, file_path: str, literal_lines: set[int] | None = None
+    ) -> set[int]:
         """Line numbers a *Traceability* keyword must not bind on (REQ-d00269-E).
 
         Markdown fences are recognised in every source; a Python string
@@ -255,12 +330,17 @@ class FileDispatcher:
         has a parser here to ask. Other languages keep fence-only
         behaviour -- guessing at string literals with a regex would be
         exactly the shape-based reasoning this design refuses elsewhere.
+
+        ``literal_lines`` are the string-literal lines already read from the
+        file's syntax tree, when the caller has parsed it.
         """
         quoted = FileDispatcher._fenced_line_numbers(content)
         if file_path.endswith(".py"):
-            from elspais.graph.parsers.prescan import ast_string_literal_lines
+            if literal_lines is None:
+                from elspais.graph.parsers.prescan import ast_string_literal_lines
 
-            quoted |= ast_string_literal_lines(content)
+                literal_lines = ast_string_literal_lines(content)
+            quoted |= literal_lines
         return quoted
 
     def dispatch_spec(
@@ -296,6 +376,12 @@ class FileDispatcher:
         if not content.endswith("\n"):
             content += "\n"
 
+        if not self._may_reference(content):
+            transformer = ReferenceTransformer(
+                self._resolver, "code_ref", source_id=file_path, reader=self._reader
+            )
+            return transformer.transform_text(content)
+
         # Build line context if not provided
         if line_context is None:
             from elspais.graph.parsers.prescan import build_line_context, detect_language
@@ -330,7 +416,7 @@ class FileDispatcher:
             read_reference_list,
         )
         from elspais.graph.parsers.prescan import (
-            ast_prescan,
+            analyze_python_source,
             dart_prescan,
             external_prescan,
             text_prescan,
@@ -346,22 +432,37 @@ class FileDispatcher:
         is_python = file_path.endswith(".py")
         is_dart = file_path.endswith(".dart")
 
+        # A Python file is parsed once; its structure, string literals and
+        # imports all come from that one tree
+        analysis = analyze_python_source(content, lines) if is_python else None
+
         # Implements: REQ-d00254-N
         if prescan_data and file_path in prescan_data:
             line_context, all_test_funcs, first_def_line = external_prescan(
                 prescan_data[file_path], lines
             )
-        elif is_python:
-            source = "\n".join(text for _, text in lines)
-            try:
-                line_context, all_test_funcs, first_def_line = ast_prescan(source, lines)
-            except SyntaxError:
-                line_context, all_test_funcs, first_def_line = text_prescan(lines)
+        elif analysis is not None:
+            line_context = analysis.line_context
+            all_test_funcs = analysis.all_test_funcs
+            first_def_line = analysis.first_def_line
         elif is_dart:
             line_context, all_test_funcs, first_def_line = dart_prescan(lines)
         else:
             line_context, all_test_funcs, first_def_line = text_prescan(lines)
 
+        if not self._may_reference(content):
+            # No reference and hence no file-level default: only the test
+            # functions and the file's text remain
+            transformer = ReferenceTransformer(
+                self._resolver,
+                "test_ref",
+                line_context=line_context,
+                all_test_funcs=all_test_funcs,
+                source_id=file_path,
+                reader=self._reader,
+            )
+            return transformer.transform_text(content) + _imports_content(analysis)
+
         # Extract file-level default verifies from the parse tree
         parser = self._get_ref_parser()
         tree = parser.parse(content)
@@ -374,7 +475,9 @@ class FileDispatcher:
         # region must not become a default verifies any more than it may
         # bind directly, or the exclusion below would be undone by this
         # earlier pass reading the same line first.
-        quoted_lines = self._quoted_line_numbers(content, file_path)
+        quoted_lines = self._quoted_line_numbers(
+            content, file_path, analysis.string_literal_lines if analysis else None
+        )
 
         # A file-level default list is read like any other reference list,
         # continuation included (REQ-d00269-H): a bare instance built only
@@ -441,9 +544,32 @@ class FileDispatcher:
         )
         results = transformer.transform(tree)
         results.extend(_fault_and_style_content(transformer))
+        results.extend(_imports_content(analysis))
         return results
 
 
+def _imports_content(analysis: PythonSourceAnalysis | None) -> list:
+    """Carry a Python test file's imports out of the parse.
+
+    ``link_tests_to_code`` needs them after the build; a ``python_imports``
+    entry creates no node, and lets it read them from the parse rather than
+    read the file again. Files importing nothing carry no entry.
+    """
+    from elspais.graph.parsers import ParsedContent
+
+    if analysis is None or not analysis.imports:
+        return []
+    return [
+        ParsedContent(
+            content_type="python_imports",
+            start_line=1,
+            end_line=1,
+            raw_text="",
+            parsed_data={"modules": list(analysis.imports)},
+        )
+    ]
+
+
 # Implements: REQ-d00269-H, REQ-d00272-G, REQ-d00272-N, REQ-d00272-O
 def _fault_and_style_content(transformer) -> list:
     """Turn a transformer's faults, style findings and undeclared
@@ -389,25 +389,7 @@ class ReferenceTransformer:
             i += 1
 
         # For test files: emit unlinked test functions (third pass)
-        if self.content_type == "test_ref":
-            for func_line, func_name, class_name in self.all_test_funcs:
-                if func_line not in emitted_func_lines:
-                    verifies = list(self.file_default_verifies)
-                    results.append(
-                        ParsedContent(
-                            content_type="test_ref",
-                            start_line=func_line,
-                            end_line=func_line,
-                            raw_text="",
-                            parsed_data={
-                                "verifies": verifies,
-                                "function_name": func_name,
-                                "class_name": class_name,
-                                "function_line": func_line,
-                                "file_default_verifies": self.file_default_verifies,
-                            },
-                        )
-                    )
+        self._emit_unlinked_tests(emitted_func_lines, results)
 
         # Emit remainder blocks for unclaimed lines.
         # Fine-grained grouping ensures each remainder is contiguous, which
@@ -416,6 +398,48 @@ class ReferenceTransformer:
 
         return results
 
+    def transform_text(self, content: str) -> list[ParsedContent]:
+        """Transform content in which every line lexes as ordinary text.
+
+        Equivalent to ``transform`` over the parse of ``content`` when no
+        line of it can match a reference terminal (see
+        ``GrammarFactory.reference_screen``), without the parse: each
+        non-empty line is an ``other_line``, so the result is the unlinked
+        test functions followed by the remainder blocks.
+        """
+        results: list[ParsedContent] = []
+        self._emit_unlinked_tests(set(), results)
+        other_lines = [
+            (number, line) for number, line in enumerate(content.split("\n"), start=1) if line
+        ]
+        self._flush_remainder(other_lines, results)
+        return results
+
+    def _emit_unlinked_tests(
+        self, emitted_func_lines: set[int], results: list[ParsedContent]
+    ) -> None:
+        """Emit a test_ref for each test function no reference claimed."""
+        if self.content_type != "test_ref":
+            return
+        for func_line, func_name, class_name in self.all_test_funcs:
+            if func_line not in emitted_func_lines:
+                verifies = list(self.file_default_verifies)
+                results.append(
+                    ParsedContent(
+                        content_type="test_ref",
+                        start_line=func_line,
+                        end_line=func_line,
+                        raw_text="",
+                        parsed_data={
+                            "verifies": verifies,
+                            "function_name": func_name,
+                            "class_name": class_name,
+                            "function_line": func_line,
+                            "file_default_verifies": self.file_default_verifies,
+                        },
+                    )
+                )
+
     def _flush_remainder(
         self,
         lines: list[tuple[int, str]],
@@ -13,8 +13,11 @@ from __future__ import annotations
 import ast
 import re
 import sys
+from dataclasses import dataclass
 from pathlib import Path
 
+from elspais.utilities.import_analyzer import extract_python_imports
+
 # Language-aware function/class patterns for context tracking
 # Python: def name(
 _PYTHON_FUNC = re.compile(r"^(\s*)(?:async\s+)?def\s+(\w+)\s*\(")
@@ -253,7 +256,7 @@ def build_line_context(
 
 
 # Implements: REQ-d00269-E
-def ast_string_literal_lines(source: str) -> set[int]:
+def ast_string_literal_lines(source: str, tree: ast.Module | None = None) -> set[int]:
     """Every line genuinely interior to a Python string literal.
 
     A keyword written inside a literal names a keyword rather than invoking
@@ -270,11 +273,14 @@ def ast_string_literal_lines(source: str) -> set[int]:
 
     Returns an empty set when the source does not parse: a file the tool
     cannot read is not a file it may make claims about.
+
+    ``tree`` is ``source`` already parsed, when the caller has it.
     """
-    try:
-        tree = ast.parse(source)
-    except SyntaxError:
-        return set()
+    if tree is None:
+        try:
+            tree = ast.parse(source)
+        except SyntaxError:
+            return set()
     lines: set[int] = set()
     for node in ast.walk(tree):
         if isinstance(node, ast.Constant) and isinstance(node.value, str):
@@ -286,6 +292,7 @@ def ast_string_literal_lines(source: str) -> set[int]:
 def ast_prescan(
     source: str,
     lines: list[tuple[int, str]],
+    tree: ast.Module | None = None,
 ) -> tuple[
     dict[int, tuple[str | None, str | None, int, int]],
     list[tuple[int, str, str | None]],
@@ -299,6 +306,7 @@ def ast_prescan(
     Args:
         source: Full source text of the file.
         lines: List of (line_number, content) tuples.
+        tree: ``source`` already parsed, when the caller has it.
 
     Returns:
         Tuple of (line_context, all_test_funcs, first_def_line):
@@ -306,7 +314,8 @@ def ast_prescan(
         - all_test_funcs: List of (func_line, func_name, class_name)
         - first_def_line: Line number of first class/function def (0 if none)
     """
-    tree = ast.parse(source)
+    if tree is None:
+        tree = ast.parse(source)
 
     # Implements: REQ-d00254-O
     # Where a test starts, in the same terms the runner uses. pytest reports a
@@ -406,6 +415,55 @@ def ast_prescan(
     return line_context, all_test_funcs, first_def_line
 
 
+@dataclass
+class PythonSourceAnalysis:
+    """Everything the scanners read from one Python file, from one parse.
+
+    Attributes:
+        line_context: Maps line_number -> (func_name, class_name, func_line,
+            func_end_line), as ``ast_prescan`` returns it.
+        all_test_funcs: List of (func_line, func_name, class_name).
+        first_def_line: Line number of first class/function def (0 if none).
+        string_literal_lines: Lines interior to a string literal, as
+            ``ast_string_literal_lines`` returns them.
+        imports: Module paths the file imports (``extract_python_imports``).
+    """
+
+    line_context: dict[int, tuple[str | None, str | None, int, int]]
+    all_test_funcs: list[tuple[int, str, str | None]]
+    first_def_line: int
+    string_literal_lines: set[int]
+    imports: list[str]
+
+
+def analyze_python_source(source: str, lines: list[tuple[int, str]]) -> PythonSourceAnalysis:
+    """Parse Python source once and derive every per-file fact from the tree.
+
+    A file that does not parse falls back to ``text_prescan`` for its
+    structure and claims no string-literal lines, exactly as
+    ``ast_prescan`` and ``ast_string_literal_lines`` each do on their own.
+
+    Args:
+        source: Full source text of the file.
+        lines: List of (line_number, content) tuples.
+    """
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        line_context, all_test_funcs, first_def_line = text_prescan(lines)
+        literal_lines: set[int] = set()
+    else:
+        line_context, all_test_funcs, first_def_line = ast_prescan(source, lines, tree=tree)
+        literal_lines = ast_string_literal_lines(source, tree=tree)
+    return PythonSourceAnalysis(
+        line_context=line_context,
+        all_test_funcs=all_test_funcs,
+        first_def_line=first_def_line,
+        string_literal_lines=literal_lines,
+        imports=extract_python_imports(source),
+    )
+
+
 def text_prescan(
     lines: list[tuple[int, str]],
 ) -> tuple[
@@ -2,7 +2,8 @@
 
 Reads coverage.py's own data file (the default ``.coverage``, written by
 ``coverage run`` / pytest-cov's ``--cov-context=test``) directly via
-coverage.py's PUBLIC API -- **not** by querying the SQLite schema by hand.
+coverage.py's PUBLIC API -- **not** by querying the SQLite schema by hand
+(``iter_direct()`` below is the opt-in exception).
 Produces the same per-file dict shape as ``CoverageJsonParser`` (see that
 module's docstring) so the factory's coverage-annotation loop needs no
 format-specific handling beyond ``can_parse()`` detection.
@@ -13,6 +14,16 @@ suite produced a ~9.4 GB coverage.json and ~22 GB-RSS graph builds. The same
 context data lives compactly in the ``.coverage`` SQLite database (~5 MB for
 this repo) -- coverage.py already wrote it, we just weren't reading it.
 
+``iter_direct()`` is the opt-in exception (``coverage_reader = "direct"``
+on the target). ``parse()`` asks coverage.py to analyse every measured file,
+re-reading and re-tokenizing each source, and then queries the database
+once per wanted file for its contexts; on a large suite database that
+outlasts the graph build. ``iter_direct()`` instead reads coverage.py's
+schema-7 tables in a few streaming queries, skips files the graph has no
+node for before decoding any of their data, and analyses only the wanted
+sources, remembering each file's statements until it changes. A database
+written under any other schema version is read through ``parse()``.
+
 Does **not** create graph nodes; the factory uses parsed data to annotate
 existing FILE nodes.
 """
@@ -21,8 +32,13 @@ from __future__ import annotations
 
 import logging
 import sqlite3
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
+from typing import Any
+
+from elspais.graph.parse_cache import ParseMemo
 
 _log = logging.getLogger(__name__)
 
@@ -35,6 +51,78 @@ _INSTALL_HINT = (
     "Code Tested renders 'n/a'. Install with: pip install elspais[coverage]"
 )
 
+# The coverage.py data-file schema ``iter_direct()`` reads (coverage 7.x).
+_SCHEMA_VERSION = 7
+
+# Line offsets of the set bits in each byte value. A numbits blob sets bit
+# ``j`` of byte ``i`` for line ``i * 8 + j``.
+_BYTE_BITS = tuple(tuple(j for j in range(8) if byte >> j & 1) for byte in range(256))
+
+# Source path -> (stat signature, sorted statements, {line: first line of its
+# statement} for continuation lines). Kept for the life of the process: a
+# server re-ingests the same database against the same sources on every
+# rebuild, and only an edited file needs analysing again.
+_STATEMENTS: dict[str, tuple[Any, list[int], dict[int, int]]] = {}
+
+
+def _numbits_lines(numbits: bytes) -> Iterator[int]:
+    """The line numbers set in a coverage.py numbits blob."""
+    for i, byte in enumerate(numbits):
+        if byte:
+            base = i * 8
+            for j in _BYTE_BITS[byte]:
+                yield base + j
+
+
+def _source_statements(
+    file_path: str, reporter_for: Callable[[str], Any] | None
+) -> tuple[list[int], dict[int, int]] | None:
+    """The statements coverage.py finds in ``file_path``, memoized per signature.
+
+    Returns None when the source cannot be analysed (moved, deleted, not
+    Python, or coverage.py not importable), as ``parse()`` does.
+    """
+    if reporter_for is None:
+        return None
+    signature = ParseMemo.signature(file_path)
+    cached = _STATEMENTS.get(file_path)
+    if cached is not None and signature is not None and cached[0] == signature:
+        return cached[1], cached[2]
+    try:
+        reporter = reporter_for(file_path)
+        statements = sorted(reporter.lines())
+        statement_set = set(statements)
+        # Recorded lines are mapped to the first line of their statement
+        # before missing lines are worked out, as coverage.py's analysis does.
+        first_lines: dict[int, int] = {}
+        for line in range(1, len(reporter.source().splitlines()) + 1):
+            if line in statement_set:
+                continue
+            translated = reporter.translate_lines((line,))
+            if len(translated) == 1:
+                (first,) = translated
+                if first != line and first in statement_set:
+                    first_lines[line] = first
+    except Exception:  # noqa: BLE001 - any analysis failure degrades, as in parse()
+        _log.debug("coverage-sqlite: cannot analyse %s", file_path, exc_info=True)
+        return None
+    if signature is not None:
+        _STATEMENTS[file_path] = (signature, statements, first_lines)
+    return statements, first_lines
+
+
+def _python_reporter_factory() -> Callable[[str], Any] | None:
+    """A ``path -> FileReporter`` callable, or None without coverage.py."""
+    try:
+        import coverage
+        from coverage.python import PythonFileReporter
+    except ImportError:
+        return None
+    # No data file and no ambient config: only the default exclusion rules,
+    # matching the Coverage object parse() analyses with.
+    cov = coverage.Coverage(data_file=None, config_file=False)
+    return lambda file_path: PythonFileReporter(file_path, coverage=cov)
+
 
 class CoverageSqliteParser:
     """Parser for coverage.py's native `.coverage` SQLite data file.
@@ -140,6 +228,90 @@ class CoverageSqliteParser:
 
         return results
 
+    def iter_direct(
+        self,
+        source_path: str,
+        *,
+        wanted_files: Callable[[str], bool] | None = None,
+    ) -> Iterator[tuple[str, dict]]:
+        """Stream ``(file_path, data)`` pairs straight from the database tables.
+
+        Yields the same per-file dicts as ``parse()``, one file at a time,
+        but only for files ``wanted_files`` accepts: rows for any other file
+        are passed over without being decoded. Executed lines and contexts
+        come from ``line_bits`` (or ``arc``, for a branch-measured run) in
+        one query ordered by file; the ``context`` table is read once.
+        Executable statements still come from coverage.py's analysis of the
+        source -- the database does not record them -- but only for wanted
+        files, and memoized until the file's stat signature changes. Without
+        coverage.py, or for a source that cannot be analysed, a file's
+        executed lines stand in for its statements, as in ``parse()``.
+
+        Falls back to ``parse()`` when the database is not coverage.py
+        schema version 7, and yields nothing when it cannot be read.
+        """
+        try:
+            con = sqlite3.connect(Path(source_path).resolve().as_uri() + "?mode=ro", uri=True)
+        except sqlite3.Error:
+            _log.debug("coverage-sqlite: failed to open %s", source_path, exc_info=True)
+            return
+        try:
+            try:
+                (version,) = con.execute("SELECT version FROM coverage_schema").fetchone()
+                meta = dict(con.execute("SELECT key, value FROM meta"))
+                files = dict(con.execute("SELECT id, path FROM file"))
+                contexts = dict(con.execute("SELECT id, context FROM context"))
+            except (sqlite3.Error, TypeError):
+                _log.debug("coverage-sqlite: unreadable tables in %s", source_path, exc_info=True)
+                version = None
+            if version != _SCHEMA_VERSION:
+                _log.debug("coverage-sqlite: schema %r in %s, using parse()", version, source_path)
+                yield from self.parse("", source_path, wanted_files=wanted_files).items()
+                return
+
+            wanted = {
+                file_id: path
+                for file_id, path in files.items()
+                if wanted_files is None or wanted_files(path)
+            }
+            if not wanted:
+                return
+            if meta.get("has_arcs") == "1":
+                rows = con.execute(
+                    "SELECT file_id, context_id, fromno, tono FROM arc ORDER BY file_id"
+                )
+            else:
+                rows = con.execute(
+                    "SELECT file_id, context_id, numbits FROM line_bits ORDER BY file_id"
+                )
+
+            reporter_for = _python_reporter_factory()
+            for file_id, file_rows in groupby(rows, key=itemgetter(0)):
+                file_path = wanted.pop(file_id, None)
+                if file_path is None:
+                    continue
+                raw_contexts: dict[int, set[str]] = {}
+                for row in file_rows:
+                    ctx = contexts.get(row[1], "")
+                    lines = (
+                        _numbits_lines(row[2])
+                        if len(row) == 3
+                        else (ln for ln in row[2:] if ln > 0)
+                    )
+                    for line in lines:
+                        line_ctxs = raw_contexts.get(line)
+                        if line_ctxs is None:
+                            line_ctxs = raw_contexts[line] = set()
+                        line_ctxs.add(ctx)
+                yield file_path, _file_data(file_path, raw_contexts, reporter_for)
+            # Measured files that recorded no lines at all.
+            for file_path in wanted.values():
+                yield file_path, _file_data(file_path, {}, reporter_for)
+        except sqlite3.Error:
+            _log.debug("coverage-sqlite: failed reading %s", source_path, exc_info=True)
+        finally:
+            con.close()
+
     def can_parse(self, file_path: Path) -> bool:
         """Check if this parser can handle the given file.
 
@@ -162,6 +334,28 @@ class CoverageSqliteParser:
         return magic == _SQLITE_MAGIC
 
 
+def _file_data(
+    file_path: str,
+    raw_contexts: dict[int, set[str]],
+    reporter_for: Callable[[str], Any] | None,
+) -> dict:
+    """One file's ``parse()``-shaped dict from its per-line recorded contexts."""
+    analysed = _source_statements(file_path, reporter_for)
+    first_lines: dict[int, int]
+    if analysed is None:
+        statements, first_lines = sorted(raw_contexts), {}
+    else:
+        statements, first_lines = analysed
+    executed = {first_lines.get(line, line) for line in raw_contexts}
+    line_coverage = {ln: (1 if ln in executed else 0) for ln in statements}
+    return {
+        "line_coverage": line_coverage,
+        "executable_lines": len(statements),
+        "covered_lines": sum(line_coverage.values()),
+        "contexts": {ln: list(ctxs) for ln, ctxs in raw_contexts.items()} or None,
+    }
+
+
 def create_parser() -> CoverageSqliteParser:
     """Factory function to create a CoverageSqliteParser.
 
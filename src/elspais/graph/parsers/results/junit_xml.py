@@ -22,54 +22,165 @@ line at all -- and pytest counts it from zero, at the first line of the
 decorated definition. The reporter declares that origin (REQ-d00254-O) and
 ingestion normalises it, so the ``line`` a result carries downstream is
 counted from one, like every other line in the graph.
+
+Streaming
+---------
+Reports are read with expat, the parser ElementTree's ``iterparse`` sits on,
+holding only the ``<testcase>`` being read. ``iter_file()`` feeds it a
+file a chunk at a time and yields each record as its testcase closes, so a
+nightly report of hundreds of megabytes is never held as text or as an
+element tree. The parser also reports the line each ``<testcase`` open tag
+starts on, which is the record's ``result_line``.
 """
 
 from __future__ import annotations
 
-import re
 import xml.etree.ElementTree as ET
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
-from xml.sax.saxutils import unescape
+from xml.parsers import expat
 
 from elspais.graph.parsers import ParseContext, ParsedContent
 from elspais.utilities.test_identity import build_test_id_from_result
 
-# Pattern to extract a named XML attribute value from a raw text line.
-_ATTR_RE: dict[str, re.Pattern[str]] = {}
+# Child elements that give a testcase its outcome, in precedence order.
+_OUTCOMES = (("failure", "failed"), ("error", "error"), ("skipped", "skipped"))
+_OUTCOME_TAGS = frozenset(tag for tag, _ in _OUTCOMES)
+
+# Bytes read from a results file per parser feed.
+_CHUNK_SIZE = 1 << 16
+
 
-# Attribute values pulled from raw XML text still carry entity escapes;
-# ElementTree-parsed values do not. Unescape before comparing the two.
-_XML_ENTITIES = {"&quot;": '"', "&apos;": "'"}
+class _Testcase:
+    """A ``<testcase>`` being read: its attributes, line and outcome children."""
 
+    __slots__ = ("attrs", "line", "depth", "outcomes", "collecting")
 
-def _attr_value(text: str, attr: str) -> str | None:
-    """Extract the value of *attr* from a raw XML element string."""
-    pat = _ATTR_RE.get(attr)
-    if pat is None:
-        pat = re.compile(rf'\b{attr}="([^"]*)"')
-        _ATTR_RE[attr] = pat
-    m = pat.search(text)
-    return unescape(m.group(1), _XML_ENTITIES) if m else None
+    def __init__(self, attrs: dict[str, str], line: int, depth: int) -> None:
+        self.attrs = attrs
+        self.line = line
+        self.depth = depth
+        # tag -> (message attribute, text before the child's first element)
+        self.outcomes: dict[str, tuple[str | None, list[str]]] = {}
+        self.collecting: list[str] | None = None
 
 
-def _testcase_line_index(content: str) -> dict[tuple[str, str], int]:
-    """Map ``(classname, name)`` to the 1-based line of its ``<testcase``.
+def _iter_testcases(chunks: Iterable[str | bytes], source_path: str) -> Iterator[dict[str, Any]]:
+    """Stream result records out of JUnit XML fed in ``chunks``.
 
-    Works when the XML is pretty-printed so each ``<testcase`` open tag sits
-    on its own line; a minified (single-line) document maps everything to
-    line 1. Only the first occurrence of a duplicate key is kept.
+    Only the ``<testcase>`` being read is held in memory; each record is
+    yielded once its closing tag has been fed. A testcase counts when its
+    parent is a ``<testsuite>``, at any depth under ``<testsuites>`` or any
+    other root. Its ``result_line`` is the line its open tag starts on, as
+    the XML parser reports it.
+
+    Raises:
+        ET.ParseError: The document is not well-formed. Records before the
+            error have already been yielded.
     """
-    index: dict[tuple[str, str], int] = {}
-    for line_no, text in enumerate(content.splitlines(), start=1):
-        if "<testcase" not in text:
-            continue
-        cn = _attr_value(text, "classname")
-        nm = _attr_value(text, "name")
-        if cn is not None and nm is not None:
-            index.setdefault((cn, nm), line_no)
-    return index
+    parser = expat.ParserCreate()
+    parser.buffer_text = True
+    ready: list[dict[str, Any]] = []
+    stack: list[str] = []
+    case: _Testcase | None = None
+
+    def start(tag: str, attrs: dict[str, str]) -> None:
+        nonlocal case
+        if case is None:
+            if tag == "testcase" and stack and stack[-1] == "testsuite":
+                case = _Testcase(attrs, parser.CurrentLineNumber, len(stack))
+        else:
+            # An element's text, as ElementTree keeps it, ends at its first child.
+            case.collecting = None
+            if len(stack) == case.depth + 1 and tag in _OUTCOME_TAGS and tag not in case.outcomes:
+                text: list[str] = []
+                case.outcomes[tag] = (attrs.get("message"), text)
+                case.collecting = text
+        stack.append(tag)
+
+    def end(tag: str) -> None:
+        nonlocal case
+        stack.pop()
+        if case is None:
+            return
+        if len(stack) == case.depth:
+            ready.append(_testcase_record(case, source_path))
+            case = None
+        else:
+            case.collecting = None
+
+    def data(text: str) -> None:
+        if case is not None and case.collecting is not None:
+            case.collecting.append(text)
+
+    parser.StartElementHandler = start
+    parser.EndElementHandler = end
+    parser.CharacterDataHandler = data
+    try:
+        for chunk in chunks:
+            parser.Parse(chunk, False)
+            yield from ready
+            ready.clear()
+        parser.Parse(b"", True)
+    except expat.ExpatError as e:
+        raise ET.ParseError(str(e)) from e
+    yield from ready
+
+
+def _testcase_record(case: _Testcase, source_path: str) -> dict[str, Any]:
+    """The result record for one fully read ``<testcase>``."""
+    attrs = case.attrs
+    name = attrs.get("name", "")
+    classname = attrs.get("classname", "")
+    try:
+        duration = float(attrs.get("time", "0"))
+    except ValueError:
+        duration = 0.0
+
+    status = "passed"
+    message = None
+    for tag, outcome in _OUTCOMES:
+        found = case.outcomes.get(tag)
+        if found is not None:
+            status = outcome
+            message = found[0] or "".join(found[1]) or None
+            break
+
+    # A per-testcase `file` attribute names the test's real source file. It
+    # becomes the result's source path, so the result binds to the scanned
+    # test node by path and line, and the classname-derived test_id is
+    # dropped: a classname is a Python module path and names nothing in a
+    # `.spec.ts` or any other non-Python test file.
+    file_attr = attrs.get("file")
+    result_source = file_attr or source_path
+    line_attr = attrs.get("line")
+    try:
+        line_no = int(line_attr) if line_attr else None
+    except (TypeError, ValueError):
+        line_no = None
+
+    # Generate canonical TEST node ID using test_identity utility
+    test_id = None if file_attr else build_test_id_from_result(classname, name)
+
+    # Results-file provenance: each record points back at the artifact that
+    # recorded it (`result_file` = the results file itself, distinct from
+    # `source_path`, which names the TEST'S source file and is the
+    # RESULT->TEST match key). `result_line` is the `<testcase>` line within
+    # the results file.
+    return {
+        "id": f"{result_source}:{classname}::{name}",
+        "name": name,
+        "classname": classname,
+        "status": status,
+        "duration": duration,
+        "message": message[:200] if message else None,
+        "source_path": result_source,
+        "test_id": test_id,
+        "line": line_no,
+        "result_file": source_path or None,
+        "result_line": case.line,
+    }
 
 
 if TYPE_CHECKING:
@@ -137,89 +248,28 @@ class JUnitXMLParser:
             - status: passed, failed, skipped, or error
             - duration: Test duration in seconds
             - message: Error/failure message (if any)
-        """
-        results: list[dict[str, Any]] = []
 
+            Empty if the content is not well-formed XML.
+        """
         try:
-            root = ET.fromstring(content)
+            return list(_iter_testcases((content,), source_path))
         except ET.ParseError:
-            return results
-
-        # Results-file provenance: each record points back at the artifact
-        # that recorded it (`result_file` = the results file itself, distinct
-        # from `source_path`, which names the TEST'S source file and is the
-        # RESULT->TEST match key). `result_line` is the `<testcase>` line
-        # within the results file (None when the XML is minified).
-        tc_lines = _testcase_line_index(content)
-
-        # Handle both <testsuites> and <testsuite> as root
-        testsuites = root.findall(".//testsuite")
-        if not testsuites and root.tag == "testsuite":
-            testsuites = [root]
-
-        for testsuite in testsuites:
-            for testcase in testsuite.findall("testcase"):
-                name = testcase.get("name", "")
-                classname = testcase.get("classname", "")
-                time_str = testcase.get("time", "0")
-
-                try:
-                    duration = float(time_str)
-                except ValueError:
-                    duration = 0.0
-
-                # Determine status
-                status = "passed"
-                message = None
-
-                failure = testcase.find("failure")
-                error = testcase.find("error")
-                skipped = testcase.find("skipped")
-
-                if failure is not None:
-                    status = "failed"
-                    message = failure.get("message") or failure.text
-                elif error is not None:
-                    status = "error"
-                    message = error.get("message") or error.text
-                elif skipped is not None:
-                    status = "skipped"
-                    message = skipped.get("message") or skipped.text
-
-                # A per-testcase `file` attribute names the test's real source
-                # file. It becomes the result's source path, so the result binds
-                # to the scanned test node by path and line, and the
-                # classname-derived test_id is dropped: a classname is a Python
-                # module path and names nothing in a `.spec.ts` or any other
-                # non-Python test file.
-                file_attr = testcase.get("file")
-                result_source = file_attr or source_path
-                line_attr = testcase.get("line")
-                try:
-                    line_no = int(line_attr) if line_attr else None
-                except (TypeError, ValueError):
-                    line_no = None
-
-                # Generate canonical TEST node ID using test_identity utility
-                test_id = None if file_attr else build_test_id_from_result(classname, name)
-
-                result = {
-                    "id": f"{result_source}:{classname}::{name}",
-                    "name": name,
-                    "classname": classname,
-                    "status": status,
-                    "duration": duration,
-                    "message": message[:200] if message else None,
-                    "source_path": result_source,
-                    "test_id": test_id,
-                    "line": line_no,
-                    "result_file": source_path or None,
-                    "result_line": tc_lines.get((classname, name)),
-                }
-
-                results.append(result)
-
-        return results
+            return []
+
+    def iter_file(self, path: Path, source_path: str) -> Iterator[dict[str, Any]]:
+        """Stream the records of the JUnit XML file at ``path``.
+
+        The same records ``parse()`` returns for the file's content, read a
+        chunk at a time and yielded as each ``<testcase>`` closes, so a
+        report of any size is never held whole -- neither its text nor its
+        element tree.
+
+        Raises:
+            ET.ParseError: The file is not well-formed XML. Records before
+                the error have already been yielded.
+        """
+        with open(path, "rb") as fh:
+            yield from _iter_testcases(iter(lambda: fh.read(_CHUNK_SIZE), b""), source_path)
 
     # Implements: REQ-d00054-A
     def claim_and_parse(
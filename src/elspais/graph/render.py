@@ -105,11 +105,49 @@ def _effective_depth(stored: int | None, min_depth: int) -> int:
     return min(max(stored, min_depth), 6)
 
 
+# Implements: REQ-d00061-B
+@dataclass(frozen=True)
+class NodeText:
+    """Text derived from a node, kept on it until that text changes.
+
+    ``body`` is what reconstruct_body_text() returns; the ``lower_`` fields
+    are what search compares a lowercased query against.
+    """
+
+    body: str
+    lower_id: str
+    lower_title: str
+    lower_body: str
+    lower_keywords: tuple[str, ...]
+
+
+def node_text(node: GraphNode) -> NodeText:
+    """The derived text of ``node``, built on first use after a change.
+
+    The node drops it whenever its id, label or keywords change, when an
+    edge of its own is added or removed, and when a child's label or text
+    changes, so the body is not rebuilt from the children on every read.
+    """
+    text = node._text
+    if text is None:
+        body = _build_body_text(node)
+        keywords = node.get_field("keywords", []) or []
+        text = node._text = NodeText(
+            body=body,
+            lower_id=node.id.lower(),
+            lower_title=(node.get_label() or "").lower(),
+            lower_body=body.lower(),
+            lower_keywords=tuple(kw.lower() for kw in keywords),
+        )
+    return text
+
+
 def reconstruct_body_text(node: GraphNode) -> str:
     """Reconstruct body text from STRUCTURES children in render_order.
 
     Used for full-text hash computation and search. Produces text equivalent
-    to what was previously stored in the body_text field.
+    to what was previously stored in the body_text field. Kept on the node
+    (see node_text()) until the node or its children change.
 
     Args:
         node: A REQUIREMENT node.
@@ -117,6 +155,10 @@ def reconstruct_body_text(node: GraphNode) -> str:
     Returns:
         Concatenated text of all ASSERTION and REMAINDER children.
     """
+    return node_text(node).body
+
+
+def _build_body_text(node: GraphNode) -> str:
     # Collect children with render_order
     children_with_order: list[tuple[float, GraphNode]] = []
     for edge in node.iter_outgoing_edges():
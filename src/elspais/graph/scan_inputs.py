@@ -0,0 +1,117 @@
+# Implements: REQ-d00054-A
+"""The files a repository's build scans, listed without reading them.
+
+``build_graph`` walks each spec, code and test directory through a
+``DomainFile`` that prunes skipped and ``[ignore]``-d trees as it goes.
+``scanned_signatures`` makes the same walks, with the same pruning, and
+returns the stat signature of every file they list. The daemon compares
+two of them to tell whether a rebuild is due, and a member snapshot key
+signs them, so a scanned file that git ignores (generated sources,
+vendored specs) still changes the key.
+
+The repository's own ``.elspais/`` state is left out: it changes with
+every build and daemon run.
+"""
+
+from __future__ import annotations
+
+import os
+from glob import glob
+from pathlib import Path
+from typing import Any
+
+from elspais.config import get_code_directories, get_ignore_config, get_spec_directories
+from elspais.graph.deserializer import DomainFile
+from elspais.utilities.file_walk import glob_files
+
+
+def _scanned_walks(
+    config: dict[str, Any],
+    repo_root: Path,
+    *,
+    scan_code: bool = True,
+    scan_tests: bool = True,
+) -> list[DomainFile]:
+    """The directory walks a build of ``repo_root`` makes, pruned as it prunes them.
+
+    Args:
+        config: The repository's configuration.
+        repo_root: The repository's root.
+        scan_code: Whether the build scans code directories.
+        scan_tests: Whether the build scans test directories.
+    """
+    scanning = config.get("scanning", {})
+    ignore_config = get_ignore_config(config)
+    spec = scanning.get("spec", {})
+    walks = [
+        DomainFile(
+            spec_dir,
+            recursive=True,
+            skip_dirs=list(spec.get("skip_dirs", [])),
+            skip_files=list(spec.get("skip_files", [])),
+            ignore_config=ignore_config,
+            ignore_scope="spec",
+        )
+        for spec_dir in get_spec_directories(None, config, repo_root)
+    ]
+    if scan_code:
+        walks.extend(
+            DomainFile(
+                code_dir,
+                recursive=True,
+                skip_dirs=list(scanning.get("skip", [])),
+                ignore_config=ignore_config,
+                ignore_scope="code",
+            )
+            for code_dir in get_code_directories(config, repo_root)
+        )
+    test = scanning.get("test", {})
+    if scan_tests and test.get("enabled", False):
+        for dir_pattern in test.get("directories", ["tests"]):
+            for dir_path in glob(str(repo_root / dir_pattern), recursive=True):
+                if Path(dir_path).is_dir():
+                    walks.append(
+                        DomainFile(
+                            Path(dir_path),
+                            recursive=True,
+                            skip_dirs=list(test.get("skip_dirs", [])),
+                        )
+                    )
+    return walks
+
+
+def scanned_signatures(
+    config: dict[str, Any],
+    repo_root: Path,
+    *,
+    scan_code: bool = True,
+    scan_tests: bool = True,
+) -> dict[str, tuple[int, int, int]]:
+    """Stat signature of every file a build of ``repo_root`` would list, by path.
+
+    Args:
+        config: The repository's configuration.
+        repo_root: The repository's root.
+        scan_code: Whether the build scans code, including the files
+            ``[scanning.code] file_patterns`` name.
+        scan_tests: Whether the build scans test directories.
+
+    Returns:
+        ``(mtime_ns, size, inode)`` per file, as ``FileEntry.signature``.
+    """
+    signatures: dict[str, tuple[int, int, int]] = {}
+    for walk in _scanned_walks(config, repo_root, scan_code=scan_code, scan_tests=scan_tests):
+        signatures.update(walk.manifest().signatures())
+    if scan_code:
+        patterns = config.get("scanning", {}).get("code", {}).get("file_patterns", [])
+        for path in glob_files(repo_root, patterns):
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            signatures[str(path)] = (st.st_mtime_ns, st.st_size, st.st_ino)
+    state_dir = str(repo_root / ".elspais") + os.sep
+    return {path: sig for path, sig in signatures.items() if not path.startswith(state_dir)}
+
+
+__all__ = ["scanned_signatures"]
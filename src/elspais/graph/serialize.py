@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import csv
 import io
+from collections.abc import Mapping
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
@@ -58,6 +59,19 @@ def serialize_assertion(node: GraphNode, *, extras: dict[str, Any] | None = None
     return base
 
 
+def _json_value(value: Any) -> Any:
+    """A content value as JSON can hold it.
+
+    Enums become their values and the read-only coverage mappings on FILE
+    nodes (``LineHits``, ``LineContexts``) become plain dicts.
+    """
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Mapping) and not isinstance(value, dict):
+        return dict(value)
+    return value
+
+
 def serialize_node(node: GraphNode) -> dict[str, Any]:
     """Serialize a GraphNode to a JSON-compatible dict.
 
@@ -73,9 +87,7 @@ def serialize_node(node: GraphNode) -> dict[str, Any]:
         "kind": node.kind.name,
         "label": node.get_label(),
         "uuid": node.uuid,
-        "content": {
-            k: v.value if isinstance(v, Enum) else v for k, v in node.get_all_content().items()
-        },
+        "content": {k: _json_value(v) for k, v in node.get_all_content().items()},
     }
 
     # Implements: REQ-d00129-D, REQ-d00129-E, REQ-d00129-F
@@ -0,0 +1,171 @@
+# Implements: REQ-d00054-A
+"""A binary snapshot of the last graph a repository built.
+
+Every CLI command that needs a graph, and every daemon start, built it
+from source, although most run against a tree that has not changed since
+the last build. With ``[scanning] snapshot`` on, ``build_graph()`` writes
+the finished ``FederatedGraph`` to ``.elspais/cache/graph.snapshot`` and,
+on the next build, loads it instead when every repository in the
+federation is as it was.
+
+A file holds one snapshot: a header naming the format version and the
+source key, then the graph in the flat table format of
+``elspais.graph.transfer`` -- a node table, an edge table, and everything
+else (content, coverage metrics, indexes) pickled against them. Strings
+are not interned: pickle shares one only where the graph itself holds the
+same object twice. The key is every repository's
+``member_cache.snapshot_key()`` -- its commit, working tree, scanned
+files (git-ignored ones included), test inputs and configuration --
+plus the build's own switches, so a repository that is not a git root
+never snapshots. The body is read through ``mmap`` rather than copied
+into memory first.
+
+Keying runs ``git status`` and walks the scanned directories in every
+repository, and writing packs the whole federation, so a caller with a
+warm parse memo (the daemon, rebuilding) neither loads nor writes a
+snapshot.
+
+As with the parse cache, a missing, stale or unreadable snapshot is a miss
+and deleting it is always safe.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import mmap
+import os
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO, cast
+
+from elspais.graph.member_cache import snapshot_key
+
+if TYPE_CHECKING:
+    from elspais.graph.federated import FederatedGraph
+    from elspais.graph.federation_plan import PlannedRepo
+
+_log = logging.getLogger(__name__)
+
+_MAGIC = b"ELSPAIS-GRAPH"
+# Bumped whenever the body's layout changes, so an older file is a miss.
+FORMAT_VERSION = 2
+_HEADER_SIZE = len(_MAGIC) + 4 + 64 + 1
+
+
+def graph_snapshot_path(repo_root: Path) -> Path:
+    """The file the graph snapshot for ``repo_root`` lives in."""
+    return repo_root / ".elspais" / "cache" / "graph.snapshot"
+
+
+def federation_key(
+    repo_root: Path,
+    config: dict[str, Any],
+    members: Iterable[PlannedRepo],
+    resolvers: Iterable[Any],
+    *,
+    scan_code: bool,
+    scan_tests: bool,
+    strict: bool,
+    fresh_targets: set[str] | None,
+) -> str | None:
+    """The snapshot key for a build of ``repo_root`` as it is now.
+
+    Args:
+        repo_root: The host repository's root.
+        config: The host repository's configuration.
+        members: The federation's associates. One that failed to load is
+            keyed by its error.
+        resolvers: The federation's identifier resolvers.
+        scan_code: Passed to the build.
+        scan_tests: Passed to the build.
+        strict: Passed to the build.
+        fresh_targets: Passed to the build.
+
+    Returns:
+        The key, or None when a repository cannot be keyed.
+    """
+    resolvers = list(resolvers)
+    h = hashlib.sha256()
+    h.update(f"{FORMAT_VERSION}\0{strict}\0{sorted(fresh_targets or ())!r}\0".encode())
+    repos: list[tuple[str, Path, dict[str, Any] | None, str | None]] = [
+        ("", repo_root, config, None),
+        *((m.name, m.repo_root, m.config, m.error) for m in members),
+    ]
+    for name, root, repo_config, error in repos:
+        if repo_config is None:
+            part = f"{name}:{root}:{error}"
+        else:
+            key = snapshot_key(
+                root,
+                repo_config,
+                resolvers,
+                scan_code=scan_code,
+                scan_tests=scan_tests,
+            )
+            if key is None:
+                return None
+            part = f"{name}:{key}"
+        h.update(part.encode("utf-8", errors="surrogatepass"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _header(key: str) -> bytes:
+    return _MAGIC + FORMAT_VERSION.to_bytes(4, "big") + key.encode("ascii") + b"\n"
+
+
+def load_snapshot(path: Path, key: str) -> FederatedGraph | None:
+    """The graph snapshotted at ``path`` under ``key``, or None on a miss."""
+    from elspais.graph.transfer import read_graph
+
+    try:
+        with open(path, "rb") as fh:
+            if fh.read(_HEADER_SIZE) != _header(key):
+                return None
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as body:
+                body.seek(_HEADER_SIZE)
+                graph: FederatedGraph = read_graph(cast(BinaryIO, body))
+                return graph
+    except FileNotFoundError:
+        return None
+    except Exception as e:  # corrupt or foreign file: build instead
+        _log.debug("graph snapshot: unreadable %s (%s)", path, e)
+        return None
+
+
+def write_snapshot(path: Path, key: str, graph: FederatedGraph) -> None:
+    """Snapshot ``graph`` at ``path`` under ``key``. Failures are logged and ignored."""
+    from elspais.graph.transfer import pack_graph
+
+    data = pack_graph(
+        graph,
+        [
+            node
+            for entry in graph.iter_repos()
+            if entry.graph is not None
+            for node in (*entry.graph._index.values(), *entry.graph._deleted_nodes)
+        ],
+    )
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "wb") as fh:
+            fh.write(_header(key))
+            fh.write(data)
+        os.replace(tmp, path)
+    except OSError as e:
+        _log.debug("graph snapshot: cannot write %s (%s)", path, e)
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+__all__ = [
+    "FORMAT_VERSION",
+    "federation_key",
+    "graph_snapshot_path",
+    "load_snapshot",
+    "write_snapshot",
+]
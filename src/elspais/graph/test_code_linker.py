@@ -155,6 +155,7 @@ def link_tests_to_code(
     graph: FederatedGraph,
     repo_root: Path,
     source_roots: list[str] | None = None,
+    file_imports: dict[str, list[str]] | None = None,
 ) -> int:
     """Link TEST nodes to CODE nodes via import analysis.
 
@@ -170,6 +171,9 @@ def link_tests_to_code(
         graph: The TraceGraph to modify (in-place).
         repo_root: Repository root path for resolving imports.
         source_roots: Source root directories (defaults to ["src", ""]).
+        file_imports: Module paths already extracted per test FILE node id
+            (e.g. during the build's parse). A test file found here is not
+            read again; any other is read from disk.
 
     Returns:
         Number of TEST→CODE edges created.
@@ -208,23 +212,25 @@ def link_tests_to_code(
 
         # Cache imports for this test file
         if test_path not in import_cache:
-            abs_path = repo_root / test_path
-            if abs_path.is_file():
+            modules = file_imports.get(_tfn.id) if file_imports else None
+            if modules is None:
+                abs_path = repo_root / test_path
+                if not abs_path.is_file():
+                    import_cache[test_path] = []
+                    continue
                 try:
                     content = abs_path.read_text(encoding="utf-8", errors="replace")
                 except OSError:
                     import_cache[test_path] = []
                     continue
-
                 modules = extract_python_imports(content)
-                resolved_paths: list[str] = []
-                for mod in modules:
-                    src_path = module_to_source_path(mod, repo_root, source_roots)
-                    if src_path:
-                        resolved_paths.append(_normalize_path(str(src_path)))
-                import_cache[test_path] = resolved_paths
-            else:
-                import_cache[test_path] = []
+
+            resolved_paths: list[str] = []
+            for mod in modules:
+                src_path = module_to_source_path(mod, repo_root, source_roots)
+                if src_path:
+                    resolved_paths.append(_normalize_path(str(src_path)))
+            import_cache[test_path] = resolved_paths
 
         imported_paths = import_cache[test_path]
         if not imported_paths:
@@ -0,0 +1,168 @@
+# Implements: REQ-d00203-A
+"""Flat pickling of a TraceGraph, for moving one between processes.
+
+``pickle`` reaches a graph's nodes the way ``copy.deepcopy`` does, through
+the edge maps of their neighbours, and recurses once per hop: a graph of a
+few thousand nodes already exceeds the interpreter's recursion limit. Here
+the nodes and edges are written as two flat tables instead, and every other
+reference to a node or an edge -- the graph's indexes and finding lists,
+node content, edge metadata -- is pickled as its row number and resolved
+against the rebuilt tables on load.
+"""
+
+from __future__ import annotations
+
+import gc
+import io
+import pickle
+from collections.abc import Iterable
+from typing import Any, BinaryIO
+
+from elspais.graph.clone import _component
+from elspais.graph.GraphNode import _EMPTY, GraphNode
+from elspais.graph.relations import Edge
+
+
+class _TablePickler(pickle.Pickler):
+    def __init__(self, file: io.BytesIO, nodes: dict[int, int], edges: dict[int, int]) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._nodes = nodes
+        self._edges = edges
+
+    def persistent_id(self, obj: Any) -> Any:
+        # Called for every object written, so by exact type.
+        cls = type(obj)
+        if cls is GraphNode:
+            return ("n", self._nodes[id(obj)])
+        if cls is Edge:
+            return ("e", self._edges[id(obj)])
+        return None
+
+
+class _TableUnpickler(pickle.Unpickler):
+    def __init__(self, file: BinaryIO, nodes: list[GraphNode], edges: list[Edge]) -> None:
+        super().__init__(file)
+        self._tables: dict[str, list[Any]] = {"n": nodes, "e": edges}
+
+    def persistent_load(self, pid: Any) -> Any:
+        table, row = pid
+        return self._tables[table][row]
+
+
+def pack_graph(graph: Any, nodes: Iterable[GraphNode] | None = None) -> bytes:
+    """``graph`` -- and every node its edges reach -- as bytes ``unpack_graph()`` reads.
+
+    ``nodes`` are where the walk for those nodes starts; a TraceGraph's own
+    are used when it is not given. A FederatedGraph passes its members'.
+
+    Garbage collection is paused throughout, as in ``clone_graph()``: the
+    tables are all live, so the collections they would trigger find nothing.
+    """
+    if nodes is None:
+        nodes = [*graph._index.values(), *graph._deleted_nodes]
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _pack(graph, nodes)
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _pack(graph: Any, start: Iterable[GraphNode]) -> bytes:
+    nodes = _component(start)
+    node_rows = {id(node): row for row, node in enumerate(nodes)}
+    edges: list[Edge] = []
+    for node in nodes:
+        for child_edges in node._children.values():
+            edges.extend(child_edges)
+    edge_rows = {id(edge): row for row, edge in enumerate(edges)}
+
+    # The skeleton is plain data; everything that may refer to a node or an
+    # edge goes in the payload, written against the tables.
+    skeleton = (
+        [
+            (
+                node.id,
+                node.kind,
+                node._uuid,
+                node._label,
+                -1 if node._file is None else node_rows[id(node._file)],
+            )
+            for node in nodes
+        ],
+        [(node_rows[id(e.source)], node_rows[id(e.target)], e.kind) for e in edges],
+    )
+    payload = (
+        [(node._content, node._metrics) for node in nodes],
+        [(edge.assertion_targets, edge.metadata) for edge in edges],
+        # Each parent map in its own order, as rows of the edge table.
+        [
+            [[edge_rows[id(edge)] for edge in incoming] for incoming in node._parents.values()]
+            for node in nodes
+        ],
+        graph,
+    )
+    buf = io.BytesIO()
+    pickle.dump(skeleton, buf, protocol=pickle.HIGHEST_PROTOCOL)
+    _TablePickler(buf, node_rows, edge_rows).dump(payload)
+    return buf.getvalue()
+
+
+def unpack_graph(data: bytes) -> Any:
+    """The graph ``pack_graph()`` wrote into ``data``."""
+    return read_graph(io.BytesIO(data))
+
+
+def read_graph(file: BinaryIO) -> Any:
+    """The graph ``pack_graph()`` wrote, read from the binary ``file``."""
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        node_skeleton, edge_skeleton = pickle.load(file)
+        nodes: list[GraphNode] = []
+        for node_id, kind, uuid, label, _ in node_skeleton:
+            node = GraphNode.__new__(GraphNode)
+            node.id = node_id
+            node.kind = kind
+            node._uuid = uuid
+            node._label = label
+            node._children = _EMPTY
+            node._parents = _EMPTY
+            node._edges_by_kind = None
+            node._text = None
+            nodes.append(node)
+        # Each node's FILE, as a row of the node table (-1 for none)
+        for node, row in zip(nodes, node_skeleton, strict=True):
+            node._file = None if row[4] < 0 else nodes[row[4]]
+        edges = [
+            Edge(source=nodes[src], target=nodes[tgt], kind=kind)
+            for src, tgt, kind in edge_skeleton
+        ]
+        contents, edge_data, parent_rows, graph = _TableUnpickler(file, nodes, edges).load()
+
+        for node, (content, metrics) in zip(nodes, contents, strict=True):
+            node._content = content
+            node._metrics = metrics
+        for edge, (assertion_targets, metadata) in zip(edges, edge_data, strict=True):
+            edge.assertion_targets = assertion_targets
+            edge.metadata = metadata
+        # Edges were tabled in each source's child order, so grouping them
+        # back by source and target restores every child map as it was.
+        for edge in edges:
+            source = edge.source
+            if source._children is _EMPTY:
+                source._children = {}
+            source._children.setdefault(edge.target, []).append(edge)
+        for node, incoming in zip(nodes, parent_rows, strict=True):
+            if incoming:
+                node._parents = {
+                    edges[rows[0]].source: [edges[row] for row in rows] for rows in incoming
+                }
+        return graph
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+__all__ = ["pack_graph", "read_graph", "unpack_graph"]
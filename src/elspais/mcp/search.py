@@ -81,14 +81,39 @@ def score_node(
     or any AND-group has no matching term.
     Otherwise returns the sum of best-match scores per AND-group.
     """
+    return score_fields(SearchFields.of(node), parsed, field)
+
+
+def matches_node(
+    node: GraphNode,
+    parsed: ParsedQuery,
+    field: str = "all",
+) -> bool:
+    """Check if a node matches the parsed query.
+
+    Thin wrapper around score_node().
+    """
+    return score_node(node, parsed, field) > 0.0
+
+
+# Implements: REQ-d00061-L, REQ-d00061-M
+def score_fields(
+    fields: SearchFields,
+    parsed: ParsedQuery,
+    field: str = "all",
+) -> float:
+    """Score a node's extracted search fields against a parsed query.
+
+    The same as score_node(), for a caller that keeps SearchFields.
+    """
     # Exclusion check first
     for term in parsed.excluded:
-        if _term_matches_any_field(node, term, field):
+        if _term_matches_any_field(fields, term, field):
             return 0.0
 
     # Phrase check
     for phrase in parsed.phrases:
-        if not _phrase_matches(node, phrase, field):
+        if not _phrase_matches(fields, phrase, field):
             return 0.0
 
     # Score AND-groups
@@ -98,7 +123,7 @@ def score_node(
 
     total = 0.0
     for or_group in parsed.and_groups:
-        best = _best_or_group_score(node, or_group, field)
+        best = _best_or_group_score(fields, or_group, field)
         if best <= 0.0:
             return 0.0  # AND-group not satisfied
         total += best
@@ -106,44 +131,40 @@ def score_node(
     return total
 
 
-def matches_node(
-    node: GraphNode,
-    parsed: ParsedQuery,
-    field: str = "all",
-) -> bool:
-    """Check if a node matches the parsed query.
-
-    Thin wrapper around score_node().
-    """
-    return score_node(node, parsed, field) > 0.0
-
-
 # ---------------------------------------------------------------------------
 # Field extraction
 # ---------------------------------------------------------------------------
 
 
 # Implements: REQ-d00061-B
-def _get_field_text(node: GraphNode, field_name: str) -> str:
-    """Extract text for a single field from a node."""
-    if field_name == "id":
-        return node.id
-    if field_name == "title":
-        return node.get_label() or ""
-    if field_name == "body":
-        from elspais.graph import NodeKind
-        from elspais.graph.render import reconstruct_body_text
+@dataclass(frozen=True)
+class SearchFields:
+    """The searchable text of one node, lowercased."""
+
+    id: str
+    title: str
+    keywords: tuple[str, ...]
+    body: str
 
-        return reconstruct_body_text(node) if node.kind == NodeKind.REQUIREMENT else ""
-    if field_name == "keywords":
-        keywords = node.get_field("keywords", [])
-        return " ".join(keywords) if keywords else ""
-    return ""
+    @classmethod
+    def of(cls, node: GraphNode) -> SearchFields:
+        """The search fields of ``node``, from its cached ``node_text()``."""
+        from elspais.graph import NodeKind
+        from elspais.graph.render import node_text
 
+        text = node_text(node)
+        return cls(
+            id=text.lower_id,
+            title=text.lower_title,
+            keywords=text.lower_keywords,
+            body=text.lower_body if node.kind == NodeKind.REQUIREMENT else "",
+        )
 
-def _get_keywords_list(node: GraphNode) -> list[str]:
-    """Get the keywords list from a node."""
-    return node.get_field("keywords", []) or []
+    def text(self, field_name: str) -> str:
+        """The text of one field; keywords are joined by spaces."""
+        if field_name == "keywords":
+            return " ".join(self.keywords)
+        return getattr(self, field_name, "")
 
 
 # ---------------------------------------------------------------------------
@@ -379,29 +400,26 @@ def _make_search_term(word: str) -> SearchTerm:
 
 # Implements: REQ-d00061-J
 def _term_matches_any_field(
-    node: GraphNode,
+    fields: SearchFields,
     term: SearchTerm,
     field: str,
 ) -> bool:
     """Check if a term matches any of the specified fields."""
-    fields = _fields_for(field)
-    for f in fields:
+    for f in _fields_for(field):
         if f == "keywords":
-            if _term_matches_keywords(node, term):
+            if _term_matches_keywords(fields, term):
                 return True
         else:
-            text = _get_field_text(node, f).lower()
+            text = fields.text(f)
             if text and term.text in text:
                 return True
     return False
 
 
 # Implements: REQ-d00061-K
-def _term_matches_keywords(node: GraphNode, term: SearchTerm) -> bool:
+def _term_matches_keywords(fields: SearchFields, term: SearchTerm) -> bool:
     """Check if a term matches any keyword."""
-    keywords = _get_keywords_list(node)
-    for kw in keywords:
-        kw_lower = kw.lower()
+    for kw_lower in fields.keywords:
         if term.exact:
             if term.text == kw_lower:
                 return True
@@ -412,18 +430,13 @@ def _term_matches_keywords(node: GraphNode, term: SearchTerm) -> bool:
 
 
 # Implements: REQ-d00061-I
-def _phrase_matches(node: GraphNode, phrase: str, field: str) -> bool:
+def _phrase_matches(fields: SearchFields, phrase: str, field: str) -> bool:
     """Check if an exact phrase matches in any specified field."""
-    fields = _fields_for(field)
     phrase_lower = phrase  # Already lowered during tokenization
-    for f in fields:
-        if f == "keywords":
-            # Phrases don't match against keyword lists individually,
-            # but match against concatenated keywords
-            keywords = _get_keywords_list(node)
-            text = " ".join(kw.lower() for kw in keywords)
-        else:
-            text = _get_field_text(node, f).lower()
+    for f in _fields_for(field):
+        # Phrases don't match against keyword lists individually,
+        # but match against concatenated keywords
+        text = fields.text(f)
         if text and phrase_lower in text:
             return True
     return False
@@ -431,38 +444,33 @@ def _phrase_matches(node: GraphNode, phrase: str, field: str) -> bool:
 
 # Implements: REQ-d00061-G
 def _best_or_group_score(
-    node: GraphNode,
+    fields: SearchFields,
     or_group: tuple[SearchTerm, ...],
     field: str,
 ) -> float:
     """Find the best score among terms in an OR-group."""
     best = 0.0
     for term in or_group:
-        s = _score_term(node, term, field)
+        s = _score_term(fields, term, field)
         if s > best:
             best = s
     return best
 
 
 # Implements: REQ-d00061-L
-def _score_term(node: GraphNode, term: SearchTerm, field: str) -> float:
+def _score_term(fields: SearchFields, term: SearchTerm, field: str) -> float:
     """Score a single term against a node's fields."""
     best = 0.0
-    fields = _fields_for(field)
 
-    for f in fields:
+    for f in _fields_for(field):
         if f == "id":
-            text = node.id.lower()
-            if text and term.text in text:
+            if fields.id and term.text in fields.id:
                 best = max(best, _WEIGHT_ID)
         elif f == "title":
-            text = (node.get_label() or "").lower()
-            if text and term.text in text:
+            if fields.title and term.text in fields.title:
                 best = max(best, _WEIGHT_TITLE)
         elif f == "keywords":
-            keywords = _get_keywords_list(node)
-            for kw in keywords:
-                kw_lower = kw.lower()
+            for kw_lower in fields.keywords:
                 if term.exact:
                     if term.text == kw_lower:
                         best = max(best, _WEIGHT_KEYWORD_EXACT)
@@ -470,8 +478,7 @@ def _score_term(node: GraphNode, term: SearchTerm, field: str) -> float:
                     if term.text in kw_lower:
                         best = max(best, _WEIGHT_KEYWORD_SUBSTRING)
         elif f == "body":
-            text = _get_field_text(node, "body").lower()
-            if text and term.text in text:
+            if fields.body and term.text in fields.body:
                 best = max(best, _WEIGHT_BODY)
 
     return best
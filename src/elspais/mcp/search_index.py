@@ -0,0 +1,423 @@
+# Implements: REQ-d00061-A, REQ-d00061-L
+"""Inverted index over the text the MCP search tools match.
+
+Every search, scoped_search and discover call scored every requirement in
+the graph, rebuilding each body from its STRUCTURES children on the way,
+although an agent issues hundreds of searches between two edits. A
+``SearchIndex`` extracts the search fields of every requirement and
+assertion once, lowercased, and posts each whitespace-separated token of
+each field under the nodes it occurs in.
+
+Matching stays what ``score_node()`` does -- a term matches a field it is
+a substring of -- so a term is looked up against the vocabulary rather
+than as a token: it can only match the nodes posted under a token that
+contains it, because a term without whitespace lies inside one token.
+Each term's scores on the nodes it can match are worked out once, from
+their stored fields with ``score_fields()``, and kept; a query then scores
+a node its best OR term's score summed over the AND-groups, and drops the
+nodes an excluded term matches, without reading any text. A query with a
+phrase is narrowed to the nodes holding every word of it and scored from
+the stored fields. Either way a search returns what it did without the
+index, and visits only the requirements that can match.
+
+A graph's index is kept against its mutation log's revision. When the
+revision has moved, only the requirements the entries appended or undone
+since name -- with their assertions -- are indexed again.
+"""
+
+from __future__ import annotations
+
+import weakref
+from bisect import bisect_right
+from collections.abc import Callable, Collection, Iterable, Iterator
+from typing import Any
+
+from elspais.graph import NodeKind
+from elspais.graph.GraphNode import GraphNode
+from elspais.graph.mutations import MutationEntry
+from elspais.mcp.search import (
+    ParsedQuery,
+    SearchFields,
+    SearchTerm,
+    score_fields,
+    score_node,
+)
+
+_FIELDS = ("id", "title", "keywords", "body")
+# Terms looked up against the vocabulary are remembered, up to this many.
+_MAX_LOOKUPS = 4096
+# Mutation entry state keys whose values are node ids (or lists of them).
+_ID_KEYS = ("id", "parent_id", "parent_ids", "child_ids", "source_id", "target_id")
+
+
+class SearchIndex:
+    """Token postings and search fields for a set of nodes.
+
+    Requirements are expected before assertions, as ``search_index()``
+    passes them.
+
+    Args:
+        nodes: The nodes to index.
+    """
+
+    def __init__(self, nodes: Iterable[GraphNode]) -> None:
+        # By row; a row dropped by refresh() keeps its slot, unposted
+        self._nodes: list[GraphNode] = []
+        self._fields: list[SearchFields] = []
+        self._rows: dict[GraphNode, int] = {}
+        # The id each row's node had when it was indexed, and back
+        self._indexed_ids: list[str] = []
+        self._ids: dict[str, int] = {}
+        # Assertion row -> rows of the requirements it is a child of
+        self._owners: dict[int, list[int]] = {}
+        self._postings: dict[str, dict[str, list[int]]] = {name: {} for name in _FIELDS}
+        self._lookups: dict[tuple[str, str], frozenset[int]] = {}
+        self._term_cache: dict[tuple[str, SearchTerm], dict[int, float]] = {}
+        self._vocabularies: dict[str, _Vocabulary] = {}
+        for node in nodes:
+            self._add(node)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def _add(self, node: GraphNode) -> None:
+        """Index ``node`` in a new row."""
+        row = len(self._fields)
+        self._nodes.append(node)
+        self._fields.append(SearchFields.of(node))
+        self._indexed_ids.append(node.id)
+        self._rows[node] = row
+        self._post(row)
+
+    def _post(self, row: int) -> None:
+        """Post ``row``'s fields, and an assertion's owners, as its node has them."""
+        node = self._nodes[row]
+        self._ids[self._indexed_ids[row]] = row
+        if node.kind == NodeKind.ASSERTION:
+            self._owners[row] = [
+                self._rows[parent]
+                for parent in node.iter_parents()
+                if parent.kind == NodeKind.REQUIREMENT and parent in self._rows
+            ]
+        fields = self._fields[row]
+        for name in _FIELDS:
+            postings = self._postings[name]
+            for token in set(fields.text(name).split()):
+                postings.setdefault(token, []).append(row)
+
+    def _unpost(self, row: int) -> None:
+        """Take ``row`` out of the postings, as ``_post()`` put it in."""
+        if self._ids.get(self._indexed_ids[row]) == row:
+            del self._ids[self._indexed_ids[row]]
+        self._owners.pop(row, None)
+        fields = self._fields[row]
+        for name in _FIELDS:
+            postings = self._postings[name]
+            for token in set(fields.text(name).split()):
+                posted = postings[token]
+                posted.remove(row)
+                if not posted:
+                    del postings[token]
+
+    def refresh(self, ids: Iterable[str], find: Callable[[str], GraphNode | None]) -> None:
+        """Index again the requirements ``ids`` name, as ``find`` now has them.
+
+        An id may name a requirement, or an assertion or section whose
+        requirement is meant, and may be one a node had when it was indexed
+        or one it has now. Each requirement named is indexed again with its
+        assertions; nodes ``find`` no longer reaches are dropped, and new
+        ones are added after the rest. A renamed requirement also moves to
+        the end, as the graph's id index moves it.
+
+        Args:
+            ids: Node ids a change touched.
+            find: The graph's lookup by id.
+        """
+        named: dict[GraphNode, None] = {}
+        for node_id in ids:
+            row = self._ids.get(node_id)
+            if row is not None:
+                named[self._nodes[row]] = None
+            node = find(node_id)
+            if node is not None:
+                named[node] = None
+        requirements: dict[GraphNode, None] = {}
+        assertions: dict[GraphNode, None] = {}
+        for node in named:
+            if node.kind == NodeKind.REQUIREMENT:
+                requirements[node] = None
+            elif node.kind in (NodeKind.ASSERTION, NodeKind.REMAINDER):
+                if node.kind == NodeKind.ASSERTION:
+                    assertions[node] = None
+                for parent in node.iter_parents():
+                    if parent.kind == NodeKind.REQUIREMENT:
+                        requirements[parent] = None
+        for requirement in requirements:
+            for child in requirement.iter_children():
+                if child.kind == NodeKind.ASSERTION:
+                    assertions[child] = None
+        if not requirements and not assertions:
+            return
+        for node in [*requirements, *assertions]:
+            row = self._rows.get(node)
+            live = find(node.id) is node
+            if row is not None:
+                self._unpost(row)
+                if live and self._indexed_ids[row] == node.id:
+                    self._fields[row] = SearchFields.of(node)
+                    self._post(row)
+                    continue
+                del self._rows[node]
+                for owners in self._owners.values():
+                    if row in owners:
+                        owners.remove(row)
+            if live:
+                self._add(node)
+        self._lookups.clear()
+        self._term_cache.clear()
+        self._vocabularies.clear()
+
+    def query(self, parsed: ParsedQuery, field: str = "all") -> IndexedQuery:
+        """``parsed`` evaluated against the postings."""
+        return IndexedQuery(self, parsed, field)
+
+    def scorer(self, parsed: ParsedQuery, field: str = "all") -> Callable[[GraphNode], float]:
+        """A function scoring nodes against ``parsed`` as ``score_node()`` does."""
+        return self.query(parsed, field).score
+
+    def _row_scores(self, parsed: ParsedQuery, field: str) -> dict[int, float] | None:
+        """The score of every row above 0, or None when the postings cannot tell.
+
+        An OR-group scores a row its best term's score and the AND of the
+        groups sums them, as ``score_fields()`` does, from per-term scores
+        kept across queries. Phrases are only narrowed to, not scored.
+        """
+        if parsed.phrases:
+            return None
+        totals: dict[int, float] = {}
+        for i, or_group in enumerate(parsed.and_groups):
+            best: dict[int, float] = {}
+            for term in or_group:
+                scores = self._term_scores(term, field)
+                if scores is None:
+                    return None
+                for row, score in scores.items():
+                    if score > best.get(row, 0.0):
+                        best[row] = score
+            if i == 0:
+                totals = best
+            else:
+                totals = {row: total + best[row] for row, total in totals.items() if row in best}
+        for term in parsed.excluded:
+            scores = self._term_scores(term, field)
+            if scores is None:
+                return None
+            for row in scores:
+                totals.pop(row, None)
+        return totals
+
+    def _term_scores(self, term: SearchTerm, field: str) -> dict[int, float] | None:
+        """The rows ``term`` alone scores above 0, with those scores."""
+        key = (field, term)
+        scores = self._term_cache.get(key)
+        if scores is None:
+            rows = self._term_rows(term.text, field)
+            if rows is None:
+                return None
+            alone = ParsedQuery(and_groups=((term,),), excluded=(), phrases=())
+            scores = {}
+            for row in rows:
+                score = score_fields(self._fields[row], alone, field)
+                if score > 0:
+                    scores[row] = score
+            if len(self._term_cache) >= _MAX_LOOKUPS:
+                self._term_cache.clear()
+            self._term_cache[key] = scores
+        return scores
+
+    def _candidate_rows(self, parsed: ParsedQuery, field: str) -> set[int] | None:
+        """The rows that can score above 0, or None when the postings cannot tell."""
+        if not parsed.and_groups and not parsed.phrases:
+            return set()
+        rows: set[int] | None = None
+
+        def narrow(found: Iterable[int] | None) -> None:
+            nonlocal rows
+            if found is not None:
+                rows = set(found) if rows is None else rows.intersection(found)
+
+        for or_group in parsed.and_groups:
+            found = [self._term_rows(term.text, field) for term in or_group]
+            posted = [term_rows for term_rows in found if term_rows is not None]
+            narrow(set[int]().union(*posted) if len(posted) == len(found) else None)
+        for phrase in parsed.phrases:
+            for word in phrase.split():
+                narrow(self._term_rows(word, field))
+        return rows
+
+    def _all_postings(self) -> dict[str, list[int]]:
+        """Every field's postings, merged."""
+        merged: dict[str, list[int]] = {}
+        for postings in self._postings.values():
+            for token, posted in postings.items():
+                merged.setdefault(token, []).extend(posted)
+        return merged
+
+    def _term_rows(self, text: str, field: str) -> frozenset[int] | None:
+        """The rows with a token containing ``text``, or None for a multi-word text."""
+        if text.split() != [text]:
+            return None
+        key = (field, text)
+        rows = self._lookups.get(key)
+        if rows is None:
+            vocabulary = self._vocabularies.get(field)
+            if vocabulary is None:
+                vocabulary = self._vocabularies[field] = _Vocabulary(
+                    self._postings.get(field, {}) if field != "all" else self._all_postings()
+                )
+            found = vocabulary.rows_containing(text)
+            if len(self._lookups) >= _MAX_LOOKUPS:
+                self._lookups.clear()
+            rows = self._lookups[key] = frozenset(found)
+        return rows
+
+
+class _Vocabulary:
+    """The tokens of some postings, joined by newlines to be searched as one string.
+
+    A term without whitespace can only occur inside a token, so
+    ``str.find()`` over the joined tokens finds every token containing it
+    without a Python-level loop over the tokens that do not.
+    """
+
+    def __init__(self, postings: dict[str, list[int]]) -> None:
+        self._posted = list(postings.values())
+        self._starts: list[int] = []
+        offset = 0
+        for token in postings:
+            self._starts.append(offset)
+            offset += len(token) + 1
+        self._text = "\n".join(postings)
+
+    def rows_containing(self, term: str) -> set[int]:
+        """The rows posted under a token that contains ``term``."""
+        found: set[int] = set()
+        text, starts = self._text, self._starts
+        at = text.find(term)
+        while at >= 0:
+            token = bisect_right(starts, at) - 1
+            found.update(self._posted[token])
+            if token + 1 == len(starts):
+                break
+            at = text.find(term, starts[token + 1])
+        return found
+
+
+class IndexedQuery:
+    """One query evaluated against a ``SearchIndex``.
+
+    Where the postings decide every score -- terms without whitespace, and
+    no phrases -- those scores are all worked out here and ``score()``
+    only looks one up. Otherwise the postings narrow the rows, and the
+    rows left are scored from their stored fields.
+    """
+
+    def __init__(self, index: SearchIndex, parsed: ParsedQuery, field: str) -> None:
+        self._index = index
+        self._parsed = parsed
+        self._field = field
+        self._scores = index._row_scores(parsed, field)
+        self._rows: Collection[int] | None = (
+            self._scores if self._scores is not None else index._candidate_rows(parsed, field)
+        )
+
+    def score(self, node: GraphNode) -> float:
+        """``node``'s score, as ``score_node()`` gives it."""
+        index = self._index
+        row = index._rows.get(node)
+        if row is None:
+            return score_node(node, self._parsed, self._field)
+        if self._scores is not None:
+            return self._scores.get(row, 0.0)
+        if self._rows is not None and row not in self._rows:
+            return 0.0
+        return score_fields(index._fields[row], self._parsed, self._field)
+
+    def requirements(self, *, assertions: bool = False) -> list[GraphNode] | None:
+        """The requirements that may score above 0, in index order.
+
+        With ``assertions``, also those with an assertion child that may.
+        None when the postings cannot narrow the requirements at all.
+        """
+        if self._rows is None:
+            return None
+        index = self._index
+        found: set[int] = set()
+        for row in self._rows:
+            owners = index._owners.get(row)
+            if owners is None:
+                found.add(row)
+            elif assertions:
+                found.update(owners)
+        return [index._nodes[row] for row in sorted(found)]
+
+
+# By graph identity -- a TraceGraph compares by value and cannot be hashed --
+# as (reference to the graph, mutation log revision indexed at, the log's
+# entries then, index).
+_indexes: dict[int, tuple[weakref.ref[Any], int, list[MutationEntry], SearchIndex]] = {}
+
+
+def _forget(ref: weakref.ref[Any], key: int) -> None:
+    cached = _indexes.get(key)
+    if cached is not None and cached[0] is ref:
+        del _indexes[key]
+
+
+def _touched_ids(entries: Iterable[MutationEntry]) -> Iterator[str]:
+    """The node ids ``entries`` name, as target or in their recorded state."""
+    for entry in entries:
+        yield entry.target_id
+        for state in (entry.before_state, entry.after_state):
+            for key in _ID_KEYS:
+                value = state.get(key)
+                if isinstance(value, str):
+                    yield value
+                elif isinstance(value, list):
+                    yield from (item for item in value if isinstance(item, str))
+
+
+def search_index(graph: Any) -> SearchIndex:
+    """The search index of ``graph``'s requirements and assertions, as they are now.
+
+    Edits are expected to go through the graph's mutation methods: the
+    index follows ``graph.mutation_log``, not the nodes themselves.
+    """
+    log, find = graph.mutation_log, graph.find_by_id
+    revision = log.revision
+    key = id(graph)
+    cached = _indexes.get(key)
+    if cached is not None and cached[0]() is graph:
+        ref, indexed_at, seen, index = cached
+        if indexed_at == revision:
+            return index
+        # Past their common start, the entries seen then were undone since
+        # and the entries now were appended since; both name what changed.
+        entries = log.tail(0)
+        kept = 0
+        for before, now in zip(seen, entries, strict=False):
+            if before is not now:
+                break
+            kept += 1
+        index.refresh(_touched_ids([*seen[kept:], *entries[kept:]]), find)
+        _indexes[key] = (ref, revision, entries, index)
+        return index
+    index = SearchIndex(
+        [*graph.nodes_by_kind(NodeKind.REQUIREMENT), *graph.nodes_by_kind(NodeKind.ASSERTION)]
+    )
+    ref = weakref.ref(graph, lambda ref: _forget(ref, key))
+    _indexes[key] = (ref, revision, log.tail(0), index)
+    return index
+
+
+__all__ = ["IndexedQuery", "SearchIndex", "search_index"]
@@ -42,8 +42,12 @@ without creating intermediate data structures (REQ-p00060-B).
 from __future__ import annotations
 
 import functools
+import itertools
 import re
-from collections.abc import Callable, Iterator
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterator, Sequence
 from pathlib import Path
 from typing import Any
 
@@ -93,6 +97,7 @@ from elspais.graph.serialize import (
 )
 from elspais.graph.terms import TermDictionary
 from elspais.mcp.search import ParsedQuery, matches_node, parse_query, score_node
+from elspais.mcp.search_index import search_index
 from elspais.mcp.shared_state import (
     SharedServerState,
     attach_dirty_sentinel,
@@ -1036,15 +1041,59 @@ def _search(
     if parsed.is_empty:
         return []
 
-    scored: list[tuple[float, dict[str, Any]]] = []
-    for node in graph.nodes_by_kind(NodeKind.REQUIREMENT):
-        s = score_node(node, parsed, field)
-        if s > 0:
-            entry = _serialize_requirement_summary(node)
-            entry["score"] = s
-            scored.append((s, entry))
-    scored.sort(key=lambda x: x[0], reverse=True)
-    return [entry for _, entry in scored[:limit]]
+    return _rank_requirements(graph, parsed, field, limit)
+
+
+def _rank_requirements(
+    graph: FederatedGraph,
+    parsed: ParsedQuery,
+    field: str,
+    limit: int,
+    *,
+    include_assertions: bool = False,
+    scope_ids: set[str] | None = None,
+) -> list[dict[str, Any]]:
+    """Score requirements against ``parsed`` and serialize the best ``limit``.
+
+    Shared by the scored paths of search(), scoped_search() and the global
+    discover_assertions(). Only the requirements the search index leaves
+    as candidates are scored, and only those returned are serialized.
+    With ``include_assertions``, a requirement with a matching assertion
+    is a result even when it scores 0 itself. Results are by descending
+    score, ties in graph order.
+    """
+    indexed = search_index(graph).query(parsed, field)
+    candidates = indexed.requirements(assertions=include_assertions)
+    ranked: list[tuple[float, GraphNode]] = []
+    for node in graph.nodes_by_kind(NodeKind.REQUIREMENT) if candidates is None else candidates:
+        if scope_ids is not None and node.id not in scope_ids:
+            continue
+        node_score = indexed.score(node)
+        if node_score > 0 or (
+            include_assertions
+            and any(
+                child.kind == NodeKind.ASSERTION and indexed.score(child) > 0
+                for child in node.iter_children()
+            )
+        ):
+            ranked.append((node_score, node))
+    ranked.sort(key=lambda x: x[0], reverse=True)
+
+    results: list[dict[str, Any]] = []
+    for node_score, node in ranked[:limit]:
+        entry = _serialize_requirement_summary(node)
+        entry["score"] = node_score
+        matched_assertions = _match_assertions(
+            node,
+            include_assertions,
+            parsed=parsed,
+            field=field,
+            score=indexed.score,
+        )
+        if matched_assertions:
+            entry["matched_assertions"] = matched_assertions
+        results.append(entry)
+    return results
 
 
 def _minimize_requirement_set(
@@ -1178,8 +1227,13 @@ def _match_assertions(
     parsed: Any = None,
     compiled_pattern: re.Pattern[str] | None = None,
     field: str = "all",
+    score: Callable[[GraphNode], float] | None = None,
 ) -> list[dict[str, Any]]:
-    """Check assertion children for matches. Returns matched assertion dicts."""
+    """Check assertion children for matches. Returns matched assertion dicts.
+
+    ``score``, when given, scores children against ``parsed`` in place of
+    ``matches_node()`` -- a ``SearchIndex.scorer()``.
+    """
     if not include_assertions:
         return []
     matched: list[dict[str, Any]] = []
@@ -1187,7 +1241,8 @@ def _match_assertions(
         if child.kind != NodeKind.ASSERTION:
             continue
         if parsed is not None:
-            if matches_node(child, parsed, field):
+            hit = score(child) > 0 if score is not None else matches_node(child, parsed, field)
+            if hit:
                 matched.append(_serialize_assertion(child))
         elif compiled_pattern is not None:
             assertion_text = child.get_label() or ""
@@ -1276,30 +1331,15 @@ def _scoped_search(
     if parsed.is_empty:
         return {"results": [], "scope_id": scope_id, "direction": direction}
 
-    scored: list[tuple[float, dict[str, Any]]] = []
-
-    for node in graph.nodes_by_kind(NodeKind.REQUIREMENT):
-        if node.id not in scope_ids:
-            continue
-
-        node_score = score_node(node, parsed, field)
-        matched_assertions = _match_assertions(
-            node,
-            include_assertions,
-            parsed=parsed,
-            field=field,
-        )
-
-        if node_score > 0 or matched_assertions:
-            entry = _serialize_requirement_summary(node)
-            entry["score"] = node_score
-            if matched_assertions:
-                entry["matched_assertions"] = matched_assertions
-            scored.append((node_score, entry))
-
-    scored.sort(key=lambda x: x[0], reverse=True)
     return {
-        "results": [entry for _, entry in scored[:limit]],
+        "results": _rank_requirements(
+            graph,
+            parsed,
+            field,
+            limit,
+            include_assertions=include_assertions,
+            scope_ids=scope_ids,
+        ),
         "scope_id": scope_id,
         "direction": direction,
     }
@@ -1523,24 +1563,7 @@ def _search_with_assertions(
     if parsed is None or parsed.is_empty:
         return []
 
-    scored: list[tuple[float, dict[str, Any]]] = []
-    for node in graph.nodes_by_kind(NodeKind.REQUIREMENT):
-        node_score = score_node(node, parsed, field)
-        matched_assertions = _match_assertions(
-            node,
-            True,
-            parsed=parsed,
-            field=field,
-        )
-        if node_score > 0 or matched_assertions:
-            entry = _serialize_requirement_summary(node)
-            entry["score"] = node_score
-            if matched_assertions:
-                entry["matched_assertions"] = matched_assertions
-            scored.append((node_score, entry))
-
-    scored.sort(key=lambda x: x[0], reverse=True)
-    return [entry for _, entry in scored[:limit]]
+    return _rank_requirements(graph, parsed, field, limit, include_assertions=True)
 
 
 def _get_node(graph: FederatedGraph, node_id: str) -> dict[str, Any]:
@@ -5373,10 +5396,10 @@ def _collect_subtree(
 
     visited: set[str] = {root_id}
     result: list[tuple[Any, int]] = [(root_node, 0)]
-    queue: list[tuple[Any, int]] = [(root_node, 0)]
+    queue: deque[tuple[Any, int]] = deque([(root_node, 0)])
 
     while queue:
-        current, current_depth = queue.pop(0)
+        current, current_depth = queue.popleft()
 
         # Depth limit: don't expand children beyond limit
         if depth > 0 and current_depth >= depth:
@@ -5629,135 +5652,255 @@ def _get_subtree(
 
 
 class CursorState:
-    """Single-cursor state for incremental iteration over query results.
+    """State of one cursor for incremental iteration over query results.
+
+    REQ-d00076-A: Stores query, params, batch_size, items, position.
 
-    REQ-d00076-A: Stores query, params, batch_size, materialized items, position.
+    ``items`` may serialize each item only when it is read (``_CursorItems``).
+    ``graph`` and ``revision`` record what the items were taken from, so a
+    cursor that outlives a mutation or a reload is reported stale instead of
+    serving nodes as they no longer are. ``cursor_id`` is given by the
+    ``CursorRegistry`` the cursor is opened in.
     """
 
-    __slots__ = ("query", "params", "batch_size", "items", "position")
+    __slots__ = (
+        "query",
+        "params",
+        "batch_size",
+        "items",
+        "position",
+        "graph",
+        "revision",
+        "cursor_id",
+    )
 
     def __init__(
         self,
         query: str,
         params: dict[str, Any],
         batch_size: int,
-        items: list[dict[str, Any]],
+        items: Sequence[dict[str, Any]],
+        graph: Any = None,
+        revision: int | None = None,
     ) -> None:
         self.query = query
         self.params = params
         self.batch_size = batch_size
         self.items = items
         self.position: int = 0
+        self.graph = graph
+        self.revision = revision
+        self.cursor_id: str | None = None
+
+    def is_stale(self, graph: Any) -> bool:
+        """Whether ``graph`` is no longer the graph, as it was, the items came from."""
+        if self.graph is None:
+            return False
+        return graph is not self.graph or graph.mutation_log.revision != self.revision
+
+
+class CursorRegistry:
+    """The open cursors of one server, by cursor id.
+
+    Several agents, or several tool chains of one agent, page through
+    their own cursors on one daemon. Each cursor is accounted the items it
+    holds. A cursor idle for longer than ``ttl`` seconds (0: never) is
+    dropped; opening one beyond ``max_open``, or beyond ``max_items`` held
+    by all of them together, drops the least recently used others until
+    the rest fit. The cursor just opened is always kept.
+
+    Args:
+        max_open: Most cursors kept open at once.
+        ttl: Seconds a cursor is kept without being read.
+        max_items: Most items held by all open cursors together.
+        clock: Monotonic time source, in seconds.
+    """
+
+    def __init__(
+        self,
+        max_open: int = 16,
+        ttl: float = 900,
+        max_items: int = 1_000_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_open = max_open
+        self.ttl = ttl
+        self.max_items = max_items
+        self._clock = clock
+        # Least recently used first
+        self._cursors: OrderedDict[str, CursorState] = OrderedDict()
+        self._used: dict[str, float] = {}
+        self._ids = itertools.count(1)
+        # Tools run on worker threads, concurrently with each other
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any] | None) -> CursorRegistry:
+        """A registry with the limits of the ``[cursors]`` config section."""
+        settings = (config or {}).get("cursors") or {}
+        return cls(
+            max_open=settings.get("max_open", 16),
+            ttl=settings.get("ttl", 900),
+            max_items=settings.get("max_items", 1_000_000),
+        )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._cursors)
+
+    def held_items(self) -> int:
+        """The items held by all open cursors together."""
+        with self._lock:
+            return self._held_items()
+
+    def add(self, cursor: CursorState) -> str:
+        """Keep ``cursor`` under a new id, evicting others as the limits require."""
+        with self._lock:
+            now = self._clock()
+            self._expire(now)
+            cursor.cursor_id = cursor_id = f"cursor-{next(self._ids)}"
+            self._cursors[cursor_id] = cursor
+            self._used[cursor_id] = now
+            held = self._held_items()
+            while len(self._cursors) > 1 and (
+                len(self._cursors) > self.max_open or held > self.max_items
+            ):
+                oldest = next(iter(self._cursors))
+                held -= len(self._cursors[oldest].items)
+                self._drop(oldest)
+            return cursor_id
+
+    def get(self, cursor_id: str) -> CursorState | None:
+        """The open cursor ``cursor_id``, marked used; None once closed or evicted."""
+        with self._lock:
+            now = self._clock()
+            self._expire(now)
+            cursor = self._cursors.get(cursor_id)
+            if cursor is not None:
+                self._cursors.move_to_end(cursor_id)
+                self._used[cursor_id] = now
+            return cursor
+
+    def discard(self, cursor_id: str) -> None:
+        """Close ``cursor_id`` if it is open."""
+        with self._lock:
+            if cursor_id in self._cursors:
+                self._drop(cursor_id)
+
+    def _held_items(self) -> int:
+        return sum(len(cursor.items) for cursor in self._cursors.values())
+
+    def _expire(self, now: float) -> None:
+        if self.ttl <= 0:
+            return
+        for cursor_id in [c for c, used in self._used.items() if now - used > self.ttl]:
+            self._drop(cursor_id)
+
+    def _drop(self, cursor_id: str) -> None:
+        del self._cursors[cursor_id]
+        del self._used[cursor_id]
+
 
+class _CursorItems(Sequence[dict[str, Any]]):
+    """Cursor items serialized only when they are read.
 
-def _reshape_for_batch_size(
+    Holds one unit per item, the count is known at open without
+    serializing anything, and a page serializes just its own units.
+    """
+
+    __slots__ = ("_units", "_serialize")
+
+    def __init__(self, units: list[Any], serialize: Callable[[Any], dict[str, Any]]) -> None:
+        self._units = units
+        self._serialize = serialize
+
+    def __len__(self) -> int:
+        return len(self._units)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self._serialize(unit) for unit in self._units[index]]
+        return self._serialize(self._units[index])
+
+
+def _cursor_units(
     nodes: list[tuple[Any, int]],
     batch_size: int,
-    graph: FederatedGraph,
-) -> list[dict[str, Any]]:
-    """Reshape collected nodes based on batch_size semantics.
+) -> list[tuple[Any, int]]:
+    """The (node, depth) of each item collected nodes reshape into.
 
     REQ-o00068-E: batch_size controls item granularity.
-      -1: Assertions as first-class items
+      -1: Assertions as first-class items, after their requirement
        0: Each node is one item (requirements include assertions inline)
        1: Each node is one item + immediate children summaries
 
-    REQ-d00076-G: Reuses existing serializers.
+    An assertion reached by the traversal itself is never an item of its
+    own: it is inlined in, or follows, its requirement.
     """
-    items: list[dict[str, Any]] = []
-
+    units: list[tuple[Any, int]] = []
     for node, depth in nodes:
-        if batch_size == -1:
-            # Assertions as first-class items
-            if node.kind == NodeKind.REQUIREMENT:
-                items.append(
-                    {
-                        "id": node.id,
-                        "kind": "requirement",
-                        "title": node.get_label(),
-                        "level": node.get_field("level"),
-                        "status": node.get_field("status"),
-                        "depth": depth,
-                    }
-                )
-                # Emit each assertion as a separate item
-                for child in node.iter_children():
-                    if child.kind == NodeKind.ASSERTION:
-                        items.append(_serialize_assertion(child))
-            elif node.kind == NodeKind.ASSERTION:
-                # Already emitted inline above when parent was processed;
-                # skip if traversed independently
-                continue
-            else:
-                items.append(_serialize_node_summary(node))
-
-        elif batch_size == 0:
-            # Each node is one item with assertions inline
-            if node.kind == NodeKind.REQUIREMENT:
-                assertions = []
-                for child in node.iter_children():
-                    if child.kind == NodeKind.ASSERTION:
-                        assertions.append(_serialize_assertion(child))
-                items.append(
-                    {
-                        "id": node.id,
-                        "kind": "requirement",
-                        "title": node.get_label(),
-                        "level": node.get_field("level"),
-                        "status": node.get_field("status"),
-                        "depth": depth,
-                        "assertions": assertions,
-                        "coverage": _compute_coverage_summary(node),
-                    }
-                )
-            elif node.kind == NodeKind.ASSERTION:
-                continue  # Inlined in parent
-            else:
-                items.append(_serialize_node_summary(node))
+        if node.kind == NodeKind.ASSERTION:
+            continue
+        units.append((node, depth))
+        if batch_size == -1 and node.kind == NodeKind.REQUIREMENT:
+            for child in node.iter_children():
+                if child.kind == NodeKind.ASSERTION:
+                    units.append((child, depth))
+    return units
 
-        else:
-            # batch_size >= 1: Node + immediate children summaries
-            if node.kind == NodeKind.REQUIREMENT:
-                assertions = []
-                for child in node.iter_children():
-                    if child.kind == NodeKind.ASSERTION:
-                        assertions.append(_serialize_assertion(child))
-                children_summaries = []
-                for child in node.iter_children():
-                    if child.kind == NodeKind.REQUIREMENT:
-                        children_summaries.append(_serialize_requirement_summary(child))
-                items.append(
-                    {
-                        "id": node.id,
-                        "kind": "requirement",
-                        "title": node.get_label(),
-                        "level": node.get_field("level"),
-                        "status": node.get_field("status"),
-                        "depth": depth,
-                        "assertions": assertions,
-                        "coverage": _compute_coverage_summary(node),
-                        "children": children_summaries,
-                    }
-                )
-            elif node.kind == NodeKind.ASSERTION:
-                continue  # Inlined in parent
-            else:
-                items.append(_serialize_node_summary(node))
 
-    return items
+def _serialize_cursor_unit(unit: tuple[Any, int], batch_size: int) -> dict[str, Any]:
+    """Serialize one unit from ``_cursor_units()``.
 
+    REQ-d00076-G: Reuses existing serializers.
+    """
+    node, depth = unit
+    if node.kind == NodeKind.ASSERTION:
+        return _serialize_assertion(node)
+    if node.kind != NodeKind.REQUIREMENT:
+        return _serialize_node_summary(node)
 
-def _materialize_cursor_items(
+    item: dict[str, Any] = {
+        "id": node.id,
+        "kind": "requirement",
+        "title": node.get_label(),
+        "level": node.get_field("level"),
+        "status": node.get_field("status"),
+        "depth": depth,
+    }
+    if batch_size == -1:
+        return item
+    item["assertions"] = [
+        _serialize_assertion(child)
+        for child in node.iter_children()
+        if child.kind == NodeKind.ASSERTION
+    ]
+    item["coverage"] = _compute_coverage_summary(node)
+    if batch_size >= 1:
+        item["children"] = [
+            _serialize_requirement_summary(child)
+            for child in node.iter_children()
+            if child.kind == NodeKind.REQUIREMENT
+        ]
+    return item
+
+
+def _cursor_items(
     query: str,
     params: dict[str, Any],
     batch_size: int,
     graph: FederatedGraph,
-) -> list[dict[str, Any]]:
+) -> Sequence[dict[str, Any]]:
     """Run query and reshape results for cursor iteration.
 
     REQ-d00076-B: Dispatches to existing query helpers.
     REQ-o00068-F: Supports subtree, search, hierarchy, query_nodes,
                   test_coverage, uncovered_assertions, scoped_search.
+
+    A subtree, which is as large as the part of the graph under its root,
+    is only traversed here; its items are serialized as they are read. The
+    other queries are bounded by their own limit and return their results
+    already serialized.
     """
     if query == "subtree":
         root_id = params.get("root_id", "")
@@ -5776,7 +5919,10 @@ def _materialize_cursor_items(
                     return []
 
         collected = _collect_subtree(graph, root_id, depth, kind_set)
-        return _reshape_for_batch_size(collected, batch_size, graph)
+        return _CursorItems(
+            _cursor_units(collected, batch_size),
+            functools.partial(_serialize_cursor_unit, batch_size=batch_size),
+        )
 
     elif query == "search":
         results = _search(
@@ -5862,28 +6008,87 @@ def _materialize_cursor_items(
         return []
 
 
+def _materialize_cursor_items(
+    query: str,
+    params: dict[str, Any],
+    batch_size: int,
+    graph: FederatedGraph,
+) -> list[dict[str, Any]]:
+    """Every item a cursor over ``query`` would yield, serialized now."""
+    return list(_cursor_items(query, params, batch_size, graph))
+
+
+_STALE_CURSOR = "Cursor is stale: the graph changed after open_cursor(). Open a new cursor."
+
+
+def _cursor_registry(state: dict[str, Any]) -> CursorRegistry:
+    """The state's cursor registry, made from its config on first use."""
+    registry: CursorRegistry | None = state.get("cursors")
+    if registry is None:
+        registry = state.setdefault("cursors", CursorRegistry.from_config(state.get("config")))
+    return registry
+
+
+def _forget_cursor(state: dict[str, Any], cursor: CursorState) -> None:
+    if cursor.cursor_id is not None:
+        _cursor_registry(state).discard(cursor.cursor_id)
+    if state.get("cursor") is cursor:
+        state.pop("cursor", None)
+
+
+def _active_cursor(
+    state: dict[str, Any], cursor_id: str | None = None
+) -> CursorState | dict[str, Any]:
+    """The cursor to read, or the error response when there is none.
+
+    Without ``cursor_id``, that is the cursor opened last.
+    """
+    registry = _cursor_registry(state)
+    if cursor_id is not None:
+        cursor = registry.get(cursor_id)
+        if cursor is None:
+            return {
+                "success": False,
+                "error": f"No open cursor '{cursor_id}': it was closed, expired or "
+                "evicted. Use open_cursor() again.",
+            }
+    else:
+        cursor = state.get("cursor")
+        if cursor is None or registry.get(cursor.cursor_id) is None:
+            state.pop("cursor", None)
+            return {"success": False, "error": "No active cursor. Use open_cursor() first."}
+    if cursor.is_stale(state["graph"]):
+        # Its items would be the nodes as they were, or nodes since removed
+        _forget_cursor(state, cursor)
+        return {"success": False, "stale": True, "error": _STALE_CURSOR}
+    return cursor
+
+
 def _open_cursor(
     state: dict[str, Any],
     query: str,
     params: dict[str, Any],
     batch_size: int,
 ) -> dict[str, Any]:
-    """Open a new cursor, auto-closing any previous one.
+    """Open a new cursor alongside any others.
 
-    REQ-o00068-A: Materializes results and returns first item + metadata.
-    REQ-o00068-D: Single active cursor; new cursor discards previous.
-    REQ-d00076-C: Stored in _state["cursor"].
+    REQ-o00068-A: Runs the query and returns first item + metadata.
+    REQ-o00068-D: The new cursor is the one calls without a cursor_id read.
+    REQ-d00076-C: Stored in _state["cursor"] and in _state["cursors"].
     REQ-d00076-D: Returns first item, total count, and query metadata.
     """
     graph = state["graph"]
-    items = _materialize_cursor_items(query, params, batch_size, graph)
+    items = _cursor_items(query, params, batch_size, graph)
 
     cursor = CursorState(
         query=query,
         params=params,
         batch_size=batch_size,
         items=items,
+        graph=graph,
+        revision=graph.mutation_log.revision,
     )
+    cursor_id = _cursor_registry(state).add(cursor)
     state["cursor"] = cursor
 
     first_item = items[0] if items else None
@@ -5892,6 +6097,7 @@ def _open_cursor(
 
     return {
         "success": True,
+        "cursor_id": cursor_id,
         "query": query,
         "batch_size": batch_size,
         "total": len(items),
@@ -5904,15 +6110,16 @@ def _open_cursor(
 def _cursor_next(
     state: dict[str, Any],
     count: int = 1,
+    cursor_id: str | None = None,
 ) -> dict[str, Any]:
     """Advance cursor and return next items.
 
     REQ-o00068-B: Returns next count items, advances position.
     REQ-d00076-E: Returns items at [position:position+count], empty at end.
     """
-    cursor = state.get("cursor")
-    if cursor is None:
-        return {"success": False, "error": "No active cursor. Use open_cursor() first."}
+    cursor = _active_cursor(state, cursor_id)
+    if not isinstance(cursor, CursorState):
+        return cursor
 
     start = cursor.position
     end = min(start + count, len(cursor.items))
@@ -5921,6 +6128,7 @@ def _cursor_next(
 
     return {
         "success": True,
+        "cursor_id": cursor.cursor_id,
         "items": items,
         "count": len(items),
         "position": cursor.position,
@@ -5931,23 +6139,28 @@ def _cursor_next(
 
 def _cursor_info(
     state: dict[str, Any],
+    cursor_id: str | None = None,
 ) -> dict[str, Any]:
     """Return cursor position info without advancing.
 
     REQ-o00068-C: Returns position/total/remaining without advancing.
     REQ-d00076-F: Read-only, returns {position, total, remaining, query, batch_size}.
     """
-    cursor = state.get("cursor")
-    if cursor is None:
-        return {"success": False, "error": "No active cursor. Use open_cursor() first."}
+    cursor = _active_cursor(state, cursor_id)
+    if not isinstance(cursor, CursorState):
+        return cursor
 
+    registry = _cursor_registry(state)
     return {
         "success": True,
+        "cursor_id": cursor.cursor_id,
         "position": cursor.position,
         "total": len(cursor.items),
         "remaining": len(cursor.items) - cursor.position,
         "query": cursor.query,
         "batch_size": cursor.batch_size,
+        "open_cursors": len(registry),
+        "held_items": registry.held_items(),
     }
 
 
@@ -6128,10 +6341,14 @@ tip: current_tip from get_mutation_log() ("" = nothing pending).
   - params: query-specific parameters (e.g. {root_id: "REQ-p00001"})
   - batch_size: -1 (assertions as separate items), 0 (nodes with inline assertions),
     1 (nodes with children summaries)
-  - Returns first item + total/position/remaining metadata
-  - Opening a new cursor auto-closes any previous cursor
-- `cursor_next(count=1)` - Get next items and advance position
-- `cursor_info()` - Check position/total/remaining without advancing
+  - Returns cursor_id, first item + total/position/remaining metadata
+  - Several cursors stay open at once; idle or least recently used ones are
+    evicted past the configured limits
+- `cursor_next(count=1, cursor_id=None)` - Get next items and advance position
+- `cursor_info(cursor_id=None)` - Check position/total/remaining without advancing
+  - Without cursor_id, both read the cursor opened last
+- After any graph mutation, undo or refresh, the cursor is stale: cursor_next()
+  and cursor_info() return an error with `stale: true`; open a new cursor
 
 ## Requirement Levels
 
@@ -6378,8 +6595,8 @@ def create_server(
         and the graph already being served stays live.
 
         Args:
-            full: Accepted for compatibility; every rebuild is full, since no
-                cache is retained between builds.
+            full: Re-parse every file. By default only files changed since
+                the previous rebuild are re-parsed; the graph is the same.
             path: Switch to a different project directory before rebuilding.
             force: If True, discard unsaved mutations and refresh anyway.
             if_tip_mutation_id: The mutation-log tip as you last saw it.
@@ -7873,7 +8090,8 @@ def create_server(
 
         Use when: a query might return many results and you want to process
         them one at a time without loading everything. Use cursor_next() to
-        advance and cursor_info() to check position.
+        advance and cursor_info() to check position, passing the returned
+        cursor_id when other cursors may have been opened since.
 
         Args:
             query: 'subtree', 'search', 'hierarchy', 'query_nodes',
@@ -7938,14 +8156,28 @@ def create_server(
     @mcp.tool()
     def cursor_next(
         count: int = 1,
+        cursor_id: str | None = None,
     ) -> dict[str, Any]:
-        """Get next item(s) from an open cursor. Call after open_cursor()."""
-        return _cursor_next(_state, count=count)
+        """Get next item(s) from an open cursor. Call after open_cursor().
+
+        Args:
+            count: How many items to return.
+            cursor_id: The cursor_id open_cursor() returned; omit for the
+                cursor opened last.
+        """
+        return _cursor_next(_state, count=count, cursor_id=cursor_id)
 
     @mcp.tool()
-    def cursor_info() -> dict[str, Any]:
-        """Check cursor state: current position, total items, and how many remain."""
-        return _cursor_info(_state)
+    def cursor_info(
+        cursor_id: str | None = None,
+    ) -> dict[str, Any]:
+        """Check cursor state: current position, total items, and how many remain.
+
+        Args:
+            cursor_id: The cursor_id open_cursor() returned; omit for the
+                cursor opened last.
+        """
+        return _cursor_info(_state, cursor_id=cursor_id)
 
     # ─────────────────────────────────────────────────────────────────────
     # Optional usage stats (stats key in config / ELSPAIS_STATS env var)
@@ -29,6 +29,8 @@ import time
 from collections.abc import Callable
 from typing import Any
 
+from elspais.graph.parse_cache import ParseMemo
+
 
 # Implements: REQ-o00076-A
 class SharedServerState(dict):
@@ -66,6 +68,12 @@ class SharedServerState(dict):
         # process that did not rebuild the daemon's graph would suppress a
         # restart that is genuinely needed.
         self.post_rebuild_hooks: list[Callable[[], None]] = []
+        # Per-file parse results carried from one rebuild to the next, so a
+        # rebuild after an edit re-reads and re-parses only the files whose
+        # stat signature moved. Builds run outside write_lock, so a lock of
+        # its own keeps two concurrent rebuilds from sharing it.
+        self.parse_memo = ParseMemo()
+        self._parse_memo_lock = threading.Lock()
         # Raised the instant this process decides to stop, before the
         # signal that starts the drain. Every write critical section
         # checks it under the same lock, so a write arriving after the
@@ -468,8 +476,14 @@ def rebuild_shared_graph(state: SharedServerState, full: bool = False) -> dict[s
 
     Args:
         state: The process-wide holder. ``working_dir`` names the repo root.
-        full: Accepted for caller compatibility; no cache is retained between
-            builds, so a full rebuild is what every call already performs.
+        full: Discard the retained per-file parse results first, so every
+            file is read and parsed afresh. Without it, only files whose
+            stat signature changed since the previous rebuild are re-parsed
+            (``state.parse_memo``); the graph itself is always assembled
+            anew from those results, so the two produce the same graph.
+            Splicing only the changed files into the served graph is not
+            implemented: it needs removal support in the builder's
+            pending-link, coverage, keyword and federation passes.
 
     Returns:
         ``{"success", "message", "node_count", "config"}``. ``config`` is the
@@ -483,7 +497,15 @@ def rebuild_shared_graph(state: SharedServerState, full: bool = False) -> dict[s
 
     try:
         new_config = get_config(start_path=working_dir, quiet=True)
-        new_graph = build_graph(config=new_config, repo_root=working_dir)
+        with state._parse_memo_lock:
+            if full:
+                state.parse_memo = ParseMemo()
+            new_graph = build_graph(
+                config=new_config, repo_root=working_dir, parse_memo=state.parse_memo
+            )
+            # Files no build looked at any more (deleted, ignored, moved out
+            # of a scan directory) are dropped so the memo tracks the tree.
+            state.parse_memo.prune()
     except Exception as exc:
         message = str(exc)
         if ".elspais.toml" in message:
@@ -13,6 +13,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from elspais.graph.scan_inputs import scanned_signatures
 from elspais.mcp.shared_state import SharedServerState, rebuild_shared_graph
 
 if TYPE_CHECKING:
@@ -74,7 +75,7 @@ class AppState:
         )
         self.repo_root = repo_root
         self._allowed_roots_override = allowed_roots
-        self._mtimes: dict[str, float] = {}
+        self._mtimes: dict[str, tuple[int, int, int]] = {}
         self._last_stale_check = 0.0
         self.snapshot_mtimes()
         # Change-detection state that lives outside the holder — this object's
@@ -178,28 +179,25 @@ class AppState:
 
     # Implements: REQ-p00004-J
     def snapshot_mtimes(self) -> None:
-        """Record current mtimes of all scanned spec/code/test files.
+        """Record current stat signatures of all scanned spec/code/test files.
 
         Also snapshots the config files (.elspais.toml, .elspais.local.toml)
         so a long-running server notices config edits (REQ-p00004-J).
         """
-        self._mtimes = {}
-        scan_dirs = self._get_scan_dirs()
-        for d in scan_dirs:
-            if not d.is_dir():
-                continue
-            for f in d.rglob("*"):
-                if f.is_file():
-                    try:
-                        self._mtimes[str(f)] = f.stat().st_mtime
-                    except OSError:
-                        pass
+        self._mtimes = self._scan_signatures()
+
+    def _scan_signatures(self) -> dict[str, tuple[int, int, int]]:
+        """Stat signature of every scanned file and config file, by path."""
+        # The walks the build makes, pruned the same way, so ignored trees
+        # (vendored dependencies, generated code) are never listed here either
+        signatures = scanned_signatures(self.config, self.repo_root)
         for f in self._config_files():
-            if f.is_file():
-                try:
-                    self._mtimes[str(f)] = f.stat().st_mtime
-                except OSError:
-                    pass
+            try:
+                st = f.stat()
+            except OSError:
+                continue
+            signatures[str(f)] = (st.st_mtime_ns, st.st_size, st.st_ino)
+        return signatures
 
     # Implements: REQ-p00004-O
     def _refresh_daemon_config_hash(self) -> None:
@@ -228,49 +226,13 @@ class AppState:
             self.repo_root / ".elspais.local.toml",
         ]
 
-    def _get_scan_dirs(self) -> list[Path]:
-        """Return directories that contribute to the graph."""
-        dirs: list[Path] = []
-        spec = self.config.get("scanning", {}).get("spec", {})
-        spec_dirs = spec.get("directories", ["spec"])
-        for d in spec_dirs:
-            dirs.append(self.repo_root / d)
-
-        code = self.config.get("scanning", {}).get("code", {})
-        code_dirs = code.get("directories", [])
-        for d in code_dirs:
-            dirs.append(self.repo_root / d)
-
-        test = self.config.get("scanning", {}).get("test", {})
-        test_dirs = test.get("directories", [])
-        for d in test_dirs:
-            dirs.append(self.repo_root / d)
-
-        return dirs
-
     def is_stale(self) -> bool:
-        """Check if any scanned files changed since last snapshot."""
-        for path_str, old_mtime in self._mtimes.items():
-            try:
-                current = Path(path_str).stat().st_mtime
-                if current != old_mtime:
-                    return True
-            except OSError:
-                return True  # file deleted = stale
+        """Check if any scanned files changed since last snapshot.
 
-        # Check for new files
-        scan_dirs = self._get_scan_dirs()
-        for d in scan_dirs:
-            if not d.is_dir():
-                continue
-            for f in d.rglob("*"):
-                if f.is_file() and str(f) not in self._mtimes:
-                    return True
-        # Config file created after the last snapshot (e.g. new local overrides)
-        for f in self._config_files():
-            if f.is_file() and str(f) not in self._mtimes:
-                return True
-        return False
+        One walk of the scanned directories: a file changed, deleted or
+        created since ``snapshot_mtimes`` makes the two listings differ.
+        """
+        return self._scan_signatures() != self._mtimes
 
     # Implements: REQ-p00015-F, REQ-p00015-B
     def ensure_fresh(self) -> bool:
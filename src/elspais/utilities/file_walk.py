@@ -0,0 +1,217 @@
+# Implements: REQ-d00054-A
+"""Single-pass directory walking for the scanners.
+
+``walk_files`` lists a tree once with ``os.scandir``, dropping directories
+a ``prune`` predicate rejects before descending into them, and records
+each file's stat signature from the same pass. The resulting
+``FileManifest`` answers every file pattern a scanner asks about without
+touching the filesystem again, and two manifests of the same tree compare
+equal exactly when no file under it was added, removed or changed.
+
+Symlinked directories are not descended into, as neither ``Path.rglob``
+nor ``os.walk`` descend into them by default.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from pathlib import Path
+
+_MAGIC_CHARS = frozenset("*?[")
+
+
+@dataclass(frozen=True)
+class FileEntry:
+    """One regular file found by a walk.
+
+    Attributes:
+        path: The file's path (the walk root joined with ``rel``).
+        rel: Path relative to the walk root, "/"-separated.
+        size: ``st_size`` at walk time.
+        mtime_ns: ``st_mtime_ns`` at walk time.
+        inode: ``st_ino`` at walk time.
+    """
+
+    path: Path
+    rel: str
+    size: int
+    mtime_ns: int
+    inode: int
+
+    @property
+    def signature(self) -> tuple[int, int, int]:
+        """``(mtime_ns, size, inode)``: changes whenever the file does."""
+        return (self.mtime_ns, self.size, self.inode)
+
+
+class FileManifest:
+    """The files under one root, as listed by a single walk.
+
+    Args:
+        root: The directory that was walked.
+        entries: Every regular file the walk found.
+    """
+
+    def __init__(self, root: Path, entries: list[FileEntry]) -> None:
+        self.root = root
+        self.entries = entries
+
+    def __iter__(self) -> Iterator[FileEntry]:
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def signatures(self) -> dict[str, tuple[int, int, int]]:
+        """Map each file's path string to its stat signature."""
+        return {str(e.path): e.signature for e in self.entries}
+
+    def match(self, pattern: str) -> list[FileEntry]:
+        """Entries ``root.rglob(pattern)`` yields, sorted by path.
+
+        ``rglob(pattern)`` is ``glob("**/" + pattern)``: the pattern is
+        matched against the trailing components of each relative path.
+        """
+        tail = pattern.replace("\\", "/").strip("/").split("/")
+        n = len(tail)
+        matched = []
+        for entry in self.entries:
+            parts = entry.rel.split("/")
+            if len(parts) >= n and all(
+                fnmatchcase(part, pat) for part, pat in zip(parts[-n:], tail, strict=True)
+            ):
+                matched.append(entry)
+        matched.sort(key=lambda e: e.path)
+        return matched
+
+    def glob(self, pattern: str) -> list[FileEntry]:
+        """Entries ``glob(root / pattern, recursive=True)`` finds, sorted by path.
+
+        ``**`` spans any number of directories. As with ``glob``, a wildcard
+        does not match a name starting with "." unless the pattern
+        component itself starts with ".".
+        """
+        pats = pattern.replace("\\", "/").strip("/").split("/")
+        matched = [e for e in self.entries if _glob_match(e.rel.split("/"), pats)]
+        matched.sort(key=lambda e: e.path)
+        return matched
+
+
+def walk_files(root: Path, prune: Callable[[Path], bool] | None = None) -> FileManifest:
+    """List every regular file under ``root`` in one pass.
+
+    Args:
+        root: Directory to walk. A missing or unreadable root yields an
+            empty manifest.
+        prune: Optional predicate over subdirectory paths; a directory it
+            accepts is not listed, nor is anything beneath it. ``root``
+            itself is not offered to it.
+
+    Returns:
+        A ``FileManifest`` of the files found, in walk order.
+    """
+    entries: list[FileEntry] = []
+    stack: list[tuple[str, str]] = [(str(root), "")]
+    while stack:
+        dir_path, rel_dir = stack.pop()
+        try:
+            it = os.scandir(dir_path)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if prune is None or not prune(Path(entry.path)):
+                            stack.append((entry.path, f"{rel_dir}{entry.name}/"))
+                        continue
+                    if not entry.is_file():
+                        continue
+                    st = entry.stat()
+                except OSError:
+                    continue
+                entries.append(
+                    FileEntry(
+                        path=Path(entry.path),
+                        rel=rel_dir + entry.name,
+                        size=st.st_size,
+                        mtime_ns=st.st_mtime_ns,
+                        inode=st.st_ino,
+                    )
+                )
+    return FileManifest(root, entries)
+
+
+def glob_files(root: Path, patterns: Iterable[str]) -> list[Path]:
+    """Files matching each of ``patterns`` under ``root``, walking each base once.
+
+    Equivalent to ``glob(root / pattern, recursive=True)`` filtered to
+    files, per pattern in order, but each pattern's literal leading
+    directories are walked once for all patterns that share them, and
+    each pattern's matches are sorted.
+
+    Args:
+        root: Directory the patterns are relative to.
+        patterns: Glob patterns, e.g. ``"src/**/*.py"``.
+
+    Returns:
+        Matching file paths; a file matched by two patterns appears twice.
+    """
+    manifests: dict[tuple[str, bool], FileManifest] = {}
+    files: list[Path] = []
+    for pattern in patterns:
+        base_root = root
+        if Path(pattern).is_absolute():
+            base_root = Path(Path(pattern).anchor)
+            pattern = str(Path(pattern).relative_to(base_root))
+        parts = pattern.replace("\\", "/").strip("/").split("/")
+        split = next(
+            (i for i, part in enumerate(parts) if _MAGIC_CHARS.intersection(part)), len(parts)
+        )
+        base = "/".join(parts[:split])
+        rest = parts[split:]
+        if not rest:
+            if (base_root / base).is_file():
+                files.append(base_root / base)
+            continue
+        # Wildcards never enter hidden directories, so unless the pattern
+        # names one explicitly the walk need not list them either
+        hidden = any(part.startswith(".") for part in rest)
+        key = (str(base_root / base), hidden)
+        if key not in manifests:
+            manifests[key] = walk_files(
+                base_root / base,
+                prune=None if hidden else _is_hidden,
+            )
+        files.extend(entry.path for entry in manifests[key].glob("/".join(rest)))
+    return files
+
+
+def _is_hidden(path: Path) -> bool:
+    return path.name.startswith(".")
+
+
+def _glob_match(parts: list[str], pats: list[str]) -> bool:
+    """Match path components against glob components, ``**`` spanning any number."""
+    if not pats:
+        return not parts
+    head = pats[0]
+    if head == "**":
+        for i in range(len(parts) + 1):
+            if i and parts[i - 1].startswith("."):
+                break
+            if _glob_match(parts[i:], pats[1:]):
+                return True
+        return False
+    if not parts:
+        return False
+    name = parts[0]
+    if name.startswith(".") and not head.startswith(".") and _MAGIC_CHARS.intersection(head):
+        return False
+    return fnmatchcase(name, head) and _glob_match(parts[1:], pats[1:])
+
+
+__all__ = ["FileEntry", "FileManifest", "glob_files", "walk_files"]
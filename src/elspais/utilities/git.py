@@ -263,29 +263,28 @@ def _extract_req_locations_from_graph(graph: Any, repo_root: Path | None = None)
         repo_root = getattr(graph, "repo_root", None)
 
     # Implements: REQ-d00129-D
-    for node in graph.all_nodes():
-        if node.kind == NodeKind.REQUIREMENT:
-            fn = node.file_node()
-            if not fn:
-                continue
-            # Use the full canonical node ID as the key.
-            # This avoids hardcoded prefix stripping and works with any
-            # namespace/type pattern configured via [id-patterns].
-            req_id = node.id
-
-            # Get source path from FILE node and make it relative if needed
-            source_path = fn.get_field("relative_path") or ""
-            if repo_root:
-                try:
-                    # If path is absolute, make it relative to repo_root
-                    path_obj = Path(source_path)
-                    if path_obj.is_absolute():
-                        source_path = str(path_obj.relative_to(repo_root))
-                except ValueError:
-                    # Path is not relative to repo_root, keep as-is
-                    pass
-
-            req_locations[req_id] = source_path
+    for node in graph.nodes_by_kind(NodeKind.REQUIREMENT):
+        fn = node.file_node()
+        if not fn:
+            continue
+        # Use the full canonical node ID as the key.
+        # This avoids hardcoded prefix stripping and works with any
+        # namespace/type pattern configured via [id-patterns].
+        req_id = node.id
+
+        # Get source path from FILE node and make it relative if needed
+        source_path = fn.get_field("relative_path") or ""
+        if repo_root:
+            try:
+                # If path is absolute, make it relative to repo_root
+                path_obj = Path(source_path)
+                if path_obj.is_absolute():
+                    source_path = str(path_obj.relative_to(repo_root))
+            except ValueError:
+                # Path is not relative to repo_root, keep as-is
+                pass
+
+        req_locations[req_id] = source_path
 
     return req_locations
 
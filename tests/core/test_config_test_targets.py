@@ -14,6 +14,7 @@ def test_target_defaults():
     assert t.match == "source"
     assert t.credit_coverage == "off"
     assert t.min_coverage_fraction == 0.0
+    assert t.coverage_reader == "api"
 
 
 def test_target_full():
@@ -35,6 +36,7 @@ def test_target_full():
     [
         ("match", "fuzzy"),
         ("credit_coverage", "bogus"),
+        ("coverage_reader", "sql"),
     ],
 )
 def test_target_enum_validation(field, bad):
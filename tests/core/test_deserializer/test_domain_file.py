@@ -163,3 +163,82 @@ class TestDomainFile:
 
         assert not any("prd-fda.md" in s for s in source_paths), "Should exclude regulations/fda/"
         assert any("prd-other.md" in s for s in source_paths), "Should include regulations/other/"
+
+    # Verifies: REQ-d00212-B
+    def test_ignore_config_filters_before_reading(self, temp_spec_dir):
+        """Test that [ignore] patterns drop files before they are read."""
+        from elspais.config import IgnoreConfig
+
+        vendor_dir = temp_spec_dir / "vendor" / "lib"
+        vendor_dir.mkdir(parents=True)
+        # Not valid UTF-8: reading it would raise
+        (vendor_dir / "dep.md").write_bytes(b"\xff\xfe")
+        (temp_spec_dir / "draft-notes.md").write_text("# Draft")
+
+        ignore = IgnoreConfig(
+            global_patterns=[],
+            spec_patterns=["vendor", "draft-*"],
+            code_patterns=[],
+            test_patterns=[],
+        )
+        deserializer = DomainFile(
+            temp_spec_dir,
+            patterns=["*.md"],
+            recursive=True,
+            ignore_config=ignore,
+            ignore_scope="spec",
+        )
+        source_paths = [ctx.source_id for ctx, _ in deserializer.iterate_sources()]
+
+        assert not any("vendor" in s for s in source_paths)
+        assert not any("draft-notes.md" in s for s in source_paths)
+        assert any("prd.md" in s for s in source_paths)
+        assert any("ops.md" in s for s in source_paths)
+
+    # Verifies: REQ-d00212-B
+    def test_ignore_config_prunes_directories(self, temp_spec_dir, monkeypatch):
+        """Test that an ignored directory is never listed by the walk."""
+        import os
+
+        from elspais.config import IgnoreConfig
+
+        (temp_spec_dir / "node_modules" / "pkg").mkdir(parents=True)
+        (temp_spec_dir / "node_modules" / "pkg" / "x.md").write_text("# X")
+
+        listed: list[str] = []
+        real_scandir = os.scandir
+
+        def recording_scandir(path):
+            listed.append(str(path))
+            return real_scandir(path)
+
+        monkeypatch.setattr("elspais.utilities.file_walk.os.scandir", recording_scandir)
+        ignore = IgnoreConfig(
+            global_patterns=["node_modules"],
+            spec_patterns=[],
+            code_patterns=[],
+            test_patterns=[],
+        )
+        deserializer = DomainFile(
+            temp_spec_dir, patterns=["*.md"], recursive=True, ignore_config=ignore
+        )
+        paths = list(deserializer.iterate_paths())
+
+        assert not any("node_modules" in str(p) for p in paths)
+        assert not any("node_modules" in d for d in listed)
+
+    # Verifies: REQ-d00212-B
+    def test_pruned_walk_matches_rglob_order(self, temp_spec_dir):
+        """Test that the pruning walk yields what the rglob loop yields."""
+        (temp_spec_dir / "sub" / "deep").mkdir(parents=True)
+        (temp_spec_dir / "sub" / "a.md").write_text("# A")
+        (temp_spec_dir / "sub" / "deep" / "b.txt").write_text("B")
+        (temp_spec_dir / "c.txt").write_text("C")
+        patterns = ["*.md", "*.txt"]
+
+        deserializer = DomainFile(temp_spec_dir, patterns=patterns, recursive=True)
+        expected = [
+            p for pattern in patterns for p in sorted(temp_spec_dir.rglob(pattern)) if p.is_file()
+        ]
+
+        assert list(deserializer.iterate_paths()) == expected
@@ -30,6 +30,7 @@ EXPECTED_SCHEMA_SECTIONS = {
     "scanning",
     "rules",
     "keywords",
+    "cursors",
     "validation",
     "changelog",
     "terms",
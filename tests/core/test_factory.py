@@ -666,3 +666,64 @@ file_patterns = ["test_*.py"]
         assert NodeKind.TEST in child_kinds, (
             f"Expected TEST child from test function, got kinds: {child_kinds}"
         )
+
+
+def _graph_shape(graph) -> list[tuple]:
+    """Every node with its content and ordered outgoing edges, in index order."""
+    shape = []
+    for entry in graph.iter_repos():
+        for node in entry.graph._index.values():
+            shape.append(
+                (
+                    node.id,
+                    node.kind,
+                    node.label,
+                    sorted((k, repr(v)) for k, v in node._content.items()),
+                    [(e.kind, e.target.id) for e in node.iter_outgoing_edges()],
+                )
+            )
+    return shape
+
+
+class TestParallelParseStage:
+    """Validates REQ-d00054-A: the opt-in parse pool builds the serial graph."""
+
+    def test_REQ_d00054_A_workers_build_identical_graph(self, tmp_path: Path) -> None:
+        config_file = tmp_path / ".elspais.toml"
+        config_file.write_text(
+            """\
+[project]
+name = "test-parallel"
+namespace = "REQ"
+
+[scanning.spec]
+directories = ["spec"]
+
+[scanning.code]
+directories = ["src"]
+file_patterns = ["extra/*.py"]
+
+[scanning.test]
+enabled = true
+directories = ["tests"]
+file_patterns = ["test_*.py"]
+""",
+            encoding="utf-8",
+        )
+        _write_spec(tmp_path / "spec")
+        for i in range(20):
+            _write_code_file(tmp_path / "src" / f"mod_{i}.py")
+        _write_code_file(tmp_path / "extra" / "pattern.py")
+        tests_dir = tmp_path / "tests"
+        tests_dir.mkdir()
+        for i in range(5):
+            (tests_dir / f"test_mod_{i}.py").write_text(
+                "# Verifies: REQ-p00001\ndef test_it():\n    assert True\n",
+                encoding="utf-8",
+            )
+
+        serial = build_graph(config_path=config_file, repo_root=tmp_path, workers=1)
+        parallel = build_graph(config_path=config_file, repo_root=tmp_path, workers=2)
+
+        assert _graph_shape(parallel) == _graph_shape(serial)
+        assert any(n.kind == NodeKind.CODE for n in serial.all_nodes())
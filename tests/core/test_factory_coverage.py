@@ -519,3 +519,61 @@ coverage = ".coverage"
         file_node = graph.find_by_id(make_file_id("REQ", "src/main.py"))
         assert file_node is not None
         assert file_node.get_field("line_contexts") is not None
+
+    # Verifies: REQ-d00254-G
+    def test_coverage_sqlite_direct_reader_annotates_like_api_reader(self, tmp_path: Path) -> None:
+        """`coverage_reader = "direct"` reads the `.coverage` tables itself;
+        the FILE node ends up annotated exactly as the default reader does."""
+        coverage = pytest.importorskip("coverage")
+
+        _write_spec(tmp_path / "spec")
+        code_path = tmp_path / "src" / "main.py"
+        _write_code_file(code_path)
+        cov_path = tmp_path / ".coverage"
+        cov = coverage.Coverage(data_file=str(cov_path), source=[str(tmp_path / "src")])
+        cov.start()
+        try:
+            spec_obj = importlib.util.spec_from_file_location(
+                "factory_coverage_direct_fixture", str(code_path)
+            )
+            mod = importlib.util.module_from_spec(spec_obj)
+            cov.switch_context("tests/test_main.py::test_work|run")
+            spec_obj.loader.exec_module(mod)
+            mod.work()
+        finally:
+            cov.stop()
+        cov.save()
+
+        annotations = {}
+        for reader in ("api", "direct"):
+            config_file = tmp_path / ".elspais.toml"
+            config_file.write_text(
+                f"""\
+[project]
+name = "test-cov-direct"
+namespace = "REQ"
+
+[scanning.spec]
+directories = ["spec"]
+
+[scanning.code]
+directories = ["src"]
+
+[[scanning.test.targets]]
+name = "unit"
+coverage = ".coverage"
+coverage_reader = "{reader}"
+""",
+                encoding="utf-8",
+            )
+            graph = build_graph(config_path=config_file, repo_root=tmp_path, scan_tests=False)
+            file_node = graph.find_by_id(make_file_id("REQ", "src/main.py"))
+            assert file_node is not None
+            annotations[reader] = {
+                field: dict(file_node.get_field(field) or {})
+                for field in ("line_coverage", "line_contexts")
+            }
+            annotations[reader]["executable_lines"] = file_node.get_field("executable_lines")
+
+        assert annotations["direct"] == annotations["api"]
+        assert annotations["direct"]["line_contexts"]
@@ -348,6 +348,57 @@ class TestFederationBuild:
         # The leaf's requirement resolves from the root's entry point.
         assert fed.find_by_id("LEAF-p00001") is not None
 
+    # Verifies: REQ-d00203-A
+    def test_REQ_d00203_A_worker_processes_build_the_same_federation(
+        self, transitive_repos: dict[str, Path]
+    ) -> None:
+        """Members built in worker processes match the serial build."""
+        serial = build_graph(repo_root=transitive_repos["root"], scan_code=False, scan_tests=False)
+        pooled = build_graph(
+            repo_root=transitive_repos["root"],
+            scan_code=False,
+            scan_tests=False,
+            workers=2,
+        )
+
+        def shape(fed):
+            return {
+                entry.name: sorted(
+                    (node.id, sorted(child.id for child in node.iter_children()))
+                    for node in entry.graph.all_nodes()
+                )
+                for entry in fed.iter_repos()
+            }
+
+        assert shape(pooled) == shape(serial)
+        assert pooled.find_by_id("LEAF-p00001") is not None
+
+    # Verifies: REQ-d00203-A
+    def test_REQ_d00203_A_member_and_parse_pools_share_the_worker_budget(
+        self, transitive_repos: dict[str, Path], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Member builds and the host's parse pool never exceed ``workers``."""
+        import concurrent.futures
+
+        opened: list[int] = []
+
+        class _CountingPool(concurrent.futures.ProcessPoolExecutor):
+            def __init__(self, max_workers: int, **kwargs) -> None:
+                opened.append(max_workers)
+                super().__init__(max_workers=max_workers, **kwargs)
+
+        monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", _CountingPool)
+
+        fed = build_graph(
+            repo_root=transitive_repos["root"],
+            scan_code=False,
+            scan_tests=False,
+            workers=4,
+        )
+
+        assert fed.find_by_id("LEAF-p00001") is not None
+        assert opened == [2, 2]
+
 
 # ---------------------------------------------------------------------------
 # Cross-Graph Edge Wiring and ID Conflict Tests
@@ -381,6 +432,41 @@ class TestCrossGraphWiring:
             f"Expected ROOT-d00001 to implement ASSOC-p00001, but parents are: {parent_ids}"
         )
 
+    # Verifies: REQ-d00203-A
+    def test_cross_graph_edge_wired_to_worker_built_member(
+        self, two_repos: dict[str, Path]
+    ) -> None:
+        """An associate built in a worker process is wired like a serial one."""
+        fed = build_graph(
+            repo_root=two_repos["root"],
+            scan_code=False,
+            scan_tests=False,
+            workers=2,
+        )
+
+        dev_node = fed.find_by_id("ROOT-d00001")
+        parents = {p.id: p for p in dev_node.iter_parents()}
+        assert parents["ASSOC-p00001"] is fed.find_by_id("ASSOC-p00001")
+        assert "ASSOC-p00001" not in {br.target_id for br in fed.broken_references()}
+
+    # Verifies: REQ-d00201-G
+    def test_clone_keeps_cross_graph_edges_inside_the_clone(
+        self, two_repos: dict[str, Path]
+    ) -> None:
+        """A cloned federation's cross-repo edges join the cloned members."""
+        fed = build_graph(
+            repo_root=two_repos["root"],
+            scan_code=False,
+            scan_tests=False,
+        )
+
+        cloned = fed.clone()
+
+        dev_node = cloned.find_by_id("ROOT-d00001")
+        parents = {p.id: p for p in dev_node.iter_parents()}
+        assert parents["ASSOC-p00001"] is cloned.find_by_id("ASSOC-p00001")
+        assert parents["ASSOC-p00001"] is not fed.find_by_id("ASSOC-p00001")
+
     def test_cross_graph_broken_ref_resolved(self, two_repos: dict[str, Path]) -> None:
         """After wiring, the broken reference should be resolved."""
         root_dir = two_repos["root"]
@@ -824,3 +910,136 @@ class TestRootRepoReportsItsOrigin:
         assert set(entries) == {"nohost", "norem"}
         assert entries["nohost"].git_origin is None
         assert entries["norem"].git_origin is None
+
+
+class TestMemberSnapshots:
+    """Validates REQ-d00203-A: unchanged associates load from a snapshot.
+
+    A member is keyed by its HEAD commit, the state of its working tree and
+    the configuration it is built with, so a build whose associate has not
+    changed since the last one builds only the host.
+    """
+
+    @staticmethod
+    def _federation(tmp_path: Path) -> tuple[Path, Path]:
+        lib = make_repo(tmp_path, "lib")
+        host = make_repo(tmp_path, "app", associates={"lib": "../lib"})
+        with open(host / ".elspais.toml", "a", encoding="utf-8") as fh:
+            fh.write("\n[scanning]\ncache = true\n")
+        return host, lib
+
+    @staticmethod
+    def _count_builds(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+        import elspais.graph.factory as factory
+
+        built: list[Path] = []
+        real = factory.build_graph
+
+        def _spy(*args, **kwargs):
+            built.append(kwargs.get("repo_root"))
+            return real(*args, **kwargs)
+
+        monkeypatch.setattr(factory, "build_graph", _spy)
+        return built
+
+    # Verifies: REQ-d00203-A
+    def test_REQ_d00203_A_unchanged_member_is_not_rebuilt(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        host, lib = self._federation(tmp_path)
+        build_graph(repo_root=host, scan_code=False, scan_tests=False)
+        assert list((host / ".elspais" / "cache" / "members").iterdir())
+
+        built = self._count_builds(monkeypatch)
+        fed = build_graph(repo_root=host, scan_code=False, scan_tests=False)
+
+        assert lib not in built
+        assert fed.find_by_id("LIB-d00001") is not None
+        assert {e.name for e in fed.iter_repos()} == {"app", "lib"}
+
+    # Verifies: REQ-d00203-A
+    def test_REQ_d00203_A_uncommitted_member_edit_is_rebuilt(self, tmp_path: Path) -> None:
+        host, lib = self._federation(tmp_path)
+        build_graph(repo_root=host, scan_code=False, scan_tests=False)
+
+        spec = lib / "spec" / "reqs.md"
+        spec.write_text(
+            spec.read_text(encoding="utf-8").replace("LIB-d00001", "LIB-d00002"),
+            encoding="utf-8",
+        )
+        fed = build_graph(repo_root=host, scan_code=False, scan_tests=False)
+
+        assert fed.find_by_id("LIB-d00002") is not None
+        assert fed.find_by_id("LIB-d00001") is None
+
+    # Verifies: REQ-d00203-A
+    def test_REQ_d00203_A_git_ignored_scanned_edit_is_rebuilt(self, tmp_path: Path) -> None:
+        """A spec file git ignores is still build input, so editing it rebuilds."""
+        host, lib = self._federation(tmp_path)
+        spec = lib / "spec" / "reqs.md"
+        (lib / "spec" / "generated.md").write_text(
+            spec.read_text(encoding="utf-8").replace("LIB-d00001", "LIB-d00003"),
+            encoding="utf-8",
+        )
+        spec.write_text("# Nothing here\n", encoding="utf-8")
+        (lib / ".gitignore").write_text("spec/generated.md\n", encoding="utf-8")
+        _git(lib, "add", "-A")
+        _git(lib, "commit", "-m", "generate the spec")
+        build_graph(repo_root=host, scan_code=False, scan_tests=False)
+
+        generated = lib / "spec" / "generated.md"
+        generated.write_text(
+            generated.read_text(encoding="utf-8").replace("LIB-d00003", "LIB-d00004"),
+            encoding="utf-8",
+        )
+        fed = build_graph(repo_root=host, scan_code=False, scan_tests=False)
+
+        assert fed.find_by_id("LIB-d00004") is not None
+        assert fed.find_by_id("LIB-d00003") is None
+
+    # Verifies: REQ-d00203-A
+    def test_REQ_d00203_A_parse_memo_keeps_member_snapshots(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A long-lived caller skips unchanged members without the disk cache."""
+        from elspais.graph.parse_cache import ParseMemo
+
+        lib = make_repo(tmp_path, "lib")
+        host = make_repo(tmp_path, "app", associates={"lib": "../lib"})
+        memo = ParseMemo()
+        build_graph(repo_root=host, scan_code=False, scan_tests=False, parse_memo=memo)
+
+        built = self._count_builds(monkeypatch)
+        fed = build_graph(repo_root=host, scan_code=False, scan_tests=False, parse_memo=memo)
+
+        assert lib not in built
+        assert fed.find_by_id("LIB-d00001") is not None
+        assert not (host / ".elspais" / "cache" / "members").exists()
+
+    # Verifies: REQ-d00203-A
+    def test_REQ_d00203_A_member_daemon_state_is_not_an_edit(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A daemon running in the member does not invalidate its snapshot."""
+        host, lib = self._federation(tmp_path)
+        build_graph(repo_root=host, scan_code=False, scan_tests=False)
+
+        (lib / ".elspais").mkdir(exist_ok=True)
+        (lib / ".elspais" / "daemon.log").write_text("started\n", encoding="utf-8")
+        (lib / ".elspais" / "daemon.json").write_text("{}", encoding="utf-8")
+        built = self._count_builds(monkeypatch)
+        build_graph(repo_root=host, scan_code=False, scan_tests=False)
+
+        assert lib not in built
+
+    # Verifies: REQ-d00203-A
+    def test_REQ_d00203_A_member_outside_git_is_not_snapshotted(
+        self, two_repos: dict[str, Path]
+    ) -> None:
+        with open(two_repos["root"] / ".elspais.toml", "a", encoding="utf-8") as fh:
+            fh.write("\n[scanning]\ncache = true\n")
+
+        fed = build_graph(repo_root=two_repos["root"], scan_code=False, scan_tests=False)
+
+        assert fed.find_by_id("ASSOC-p00001") is not None
+        assert not (two_repos["root"] / ".elspais" / "cache" / "members").exists()
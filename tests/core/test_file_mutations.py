@@ -245,6 +245,28 @@ class TestRenameFile:
         # Path field restored
         assert node.get_field("relative_path") == "spec/main.md"
 
+    # Verifies: REQ-o00063-A
+    def test_rename_file_keeps_content_filed(self):
+        """Content stays filed under the renamed FILE, and after undo."""
+        graph = build_two_file_graph()
+        req = graph.find_by_id("REQ-p00001")
+
+        graph.rename_file(make_file_id(NAMESPACE, "spec/main.md"), "spec/renamed.md")
+        assert req.file_node().id == make_file_id(NAMESPACE, "spec/renamed.md")
+
+        graph.undo_last()
+        assert req.file_node().id == make_file_id(NAMESPACE, "spec/main.md")
+
+    # Verifies: REQ-o00063-A
+    def test_clone_files_content_under_the_cloned_file(self):
+        """A cloned graph's content points at the clone's FILE nodes."""
+        graph = build_two_file_graph()
+
+        copy = graph.clone()
+
+        file_id = make_file_id(NAMESPACE, "spec/main.md")
+        assert copy.find_by_id("REQ-p00001").file_node() is copy.find_by_id(file_id)
+
     # Verifies: REQ-o00063-A
     def test_rename_non_file_raises(self):
         """ValueError if node is not a FILE node."""
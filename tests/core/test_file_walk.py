@@ -0,0 +1,82 @@
+# Verifies: REQ-d00054-A
+"""Tests for the single-pass directory walker."""
+
+import os
+from glob import glob
+from pathlib import Path
+
+import pytest
+
+from elspais.utilities.file_walk import glob_files, walk_files
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    for rel in [
+        "a.py",
+        "b.md",
+        "src/c.py",
+        "src/pkg/d.py",
+        "src/pkg/e.txt",
+        "src/.hidden/f.py",
+        "src/.g.py",
+        "vendor/lib/h.py",
+    ]:
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(rel)
+    return tmp_path
+
+
+def _rglob_files(root: Path, pattern: str) -> list[Path]:
+    return sorted(p for p in root.rglob(pattern) if p.is_file())
+
+
+class TestWalkFiles:
+    def test_lists_every_file_with_its_signature(self, tree):
+        manifest = walk_files(tree)
+
+        assert len(manifest) == 8
+        entry = next(e for e in manifest if e.rel == "src/pkg/d.py")
+        st = os.stat(tree / "src" / "pkg" / "d.py")
+        assert entry.path == tree / "src" / "pkg" / "d.py"
+        assert entry.signature == (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def test_prune_skips_directory_listing(self, tree):
+        manifest = walk_files(tree, prune=lambda p: p.name == "vendor")
+
+        assert not any(e.rel.startswith("vendor/") for e in manifest)
+        assert any(e.rel == "src/pkg/d.py" for e in manifest)
+
+    def test_missing_root_is_empty(self, tmp_path):
+        assert len(walk_files(tmp_path / "absent")) == 0
+
+    def test_signatures_change_with_content(self, tree):
+        before = walk_files(tree).signatures()
+        (tree / "src" / "c.py").write_text("changed content")
+
+        assert walk_files(tree).signatures() != before
+
+    @pytest.mark.parametrize("pattern", ["*.py", "*.md", "pkg/*.py", "*"])
+    def test_match_agrees_with_rglob(self, tree, pattern):
+        matched = [e.path for e in walk_files(tree).match(pattern)]
+
+        assert matched == _rglob_files(tree, pattern)
+
+
+class TestGlobFiles:
+    @pytest.mark.parametrize(
+        "pattern",
+        ["src/**/*.py", "**/*.py", "src/*.py", "src/pkg/d.py", "src/.hidden/*.py", "*.md"],
+    )
+    def test_agrees_with_recursive_glob(self, tree, pattern):
+        expected = sorted(
+            Path(p) for p in glob(str(tree / pattern), recursive=True) if Path(p).is_file()
+        )
+
+        assert glob_files(tree, [pattern]) == expected
+
+    def test_patterns_keep_their_order(self, tree):
+        files = glob_files(tree, ["*.md", "src/*.py"])
+
+        assert files == [tree / "b.md", tree / "src" / "c.py"]
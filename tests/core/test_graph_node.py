@@ -256,6 +256,172 @@ class TestUUID:
         node2 = GraphNode(id="REQ-002", kind=NodeKind.REQUIREMENT)
         assert node1.uuid != node2.uuid
 
+    # Verifies: REQ-d00127-A
+    def test_uuid_is_stable(self):
+        """A UUID drawn on first read is returned on every later read."""
+        node = GraphNode(id="REQ-p00001", kind=NodeKind.REQUIREMENT)
+        assert node.uuid == node.uuid
+
+    # Verifies: REQ-d00127-A
+    def test_uuid_can_be_given(self):
+        node = GraphNode(id="REQ-p00001", kind=NodeKind.REQUIREMENT, uuid="ab" * 16)
+        assert node.uuid == "ab" * 16
+
+
+class TestCompactNode:
+    """Tests for the slotted node layout."""
+
+    # Verifies: REQ-d00127-A
+    def test_nodes_compare_by_identity(self):
+        """Nodes with the same fields are distinct, and hashable."""
+        node1 = GraphNode(id="REQ-001", kind=NodeKind.REQUIREMENT)
+        node2 = GraphNode(id="REQ-001", kind=NodeKind.REQUIREMENT)
+        assert node1 != node2
+        assert len({node1, node2, node1}) == 2
+
+    # Verifies: REQ-d00127-A
+    def test_leaf_allocates_no_containers(self):
+        """An unlinked node holds no edge lists, metrics or instance dict."""
+        node = GraphNode(id="code:src/a.py:1", kind=NodeKind.CODE)
+        assert not hasattr(node, "__dict__")
+        assert not node._children and not node._parents
+        assert node._children is GraphNode("x", NodeKind.TEST)._children
+        assert node._metrics is None
+
+    # Verifies: REQ-d00127-A, REQ-d00127-B
+    def test_relink_after_unlink(self):
+        """A node whose last link was severed can be linked again."""
+        parent = GraphNode(id="REQ-001", kind=NodeKind.REQUIREMENT)
+        child = GraphNode(id="REQ-002", kind=NodeKind.REQUIREMENT)
+        parent.link(child, EdgeKind.IMPLEMENTS)
+        parent.unlink(child)
+
+        parent.link(child, EdgeKind.REFINES)
+
+        assert list(parent.iter_children()) == [child]
+        assert [e.kind for e in child.iter_incoming_edges()] == [EdgeKind.REFINES]
+
+    # Verifies: REQ-d00127-B
+    def test_remove_edge_keeps_parallel_edge(self):
+        """Removing one of two edges to a child keeps the child linked."""
+        parent = GraphNode(id="REQ-001", kind=NodeKind.REQUIREMENT)
+        child = GraphNode(id="REQ-002", kind=NodeKind.REQUIREMENT)
+        first = parent.link(child, EdgeKind.IMPLEMENTS)
+        second = parent.link(child, EdgeKind.IMPLEMENTS)
+
+        parent.remove_edge(second)
+
+        assert list(parent.iter_outgoing_edges()) == [first]
+        assert list(parent.iter_outgoing_edges())[0] is first
+        assert parent.has_child(child) and child.has_parent(parent)
+        parent.remove_edge(first)
+        assert not parent.has_child(child) and not child.has_parent(parent)
+
+    # Verifies: REQ-d00127-C
+    def test_set_edge_kind_moves_bucket(self):
+        parent = GraphNode(id="REQ-001", kind=NodeKind.REQUIREMENT)
+        child = GraphNode(id="REQ-002", kind=NodeKind.REQUIREMENT)
+        edge = parent.link(child, EdgeKind.IMPLEMENTS)
+
+        parent.set_edge_kind(edge, EdgeKind.REFINES)
+
+        assert edge.kind == EdgeKind.REFINES
+        assert list(parent.iter_edges_by_kind(EdgeKind.IMPLEMENTS)) == []
+        assert list(parent.iter_edges_by_kind(EdgeKind.REFINES)) == [edge]
+
+    # Verifies: REQ-d00127-B
+    def test_copied_nodes_keep_removable_edges(self):
+        """Edges of a deep-copied node can still be found and removed."""
+        import copy
+
+        parent = GraphNode(id="REQ-001", kind=NodeKind.REQUIREMENT)
+        child = GraphNode(id="REQ-002", kind=NodeKind.REQUIREMENT)
+        parent.link(child, EdgeKind.IMPLEMENTS)
+
+        parent_copy = copy.deepcopy(parent)
+        (edge,) = parent_copy.iter_outgoing_edges()
+        child_copy = edge.target
+
+        assert list(parent_copy.iter_edges_by_kind(EdgeKind.IMPLEMENTS)) == [edge]
+        assert parent_copy.remove_edge(edge) is True
+        assert list(child_copy.iter_incoming_edges()) == []
+        assert list(parent.iter_children()) == [child]
+
+
+class TestFileNode:
+    """Tests for the FILE-ancestor lookup."""
+
+    # Verifies: REQ-d00127-D
+    def test_file_node_through_structures(self):
+        """An assertion finds its requirement's FILE."""
+        file_node = GraphNode(id="file:REQ:spec/a.md", kind=NodeKind.FILE)
+        req = GraphNode(id="REQ-p00001", kind=NodeKind.REQUIREMENT)
+        assertion = GraphNode(id="REQ-p00001-A", kind=NodeKind.ASSERTION)
+        file_node.link(req, EdgeKind.CONTAINS)
+        req.link(assertion, EdgeKind.STRUCTURES)
+
+        assert assertion.file_node() is file_node
+        assert assertion.file_node() is file_node
+
+    # Verifies: REQ-d00127-D
+    def test_file_node_follows_a_move(self):
+        """The FILE found follows the ancestry as it changes."""
+        old_file = GraphNode(id="file:REQ:spec/a.md", kind=NodeKind.FILE)
+        new_file = GraphNode(id="file:REQ:spec/b.md", kind=NodeKind.FILE)
+        req = GraphNode(id="REQ-p00001", kind=NodeKind.REQUIREMENT)
+        assertion = GraphNode(id="REQ-p00001-A", kind=NodeKind.ASSERTION)
+        req.link(assertion, EdgeKind.STRUCTURES)
+        assert assertion.file_node() is None
+
+        old_file.link(req, EdgeKind.CONTAINS)
+        assert assertion.file_node() is old_file
+
+        old_file.unlink(req)
+        new_file.link(req, EdgeKind.CONTAINS)
+        assert assertion.file_node() is new_file
+
+    # Verifies: REQ-d00127-D
+    def test_file_node_of_a_result_is_its_tests_file(self):
+        """A RESULT is filed with the TEST that yields it."""
+        file_node = GraphNode(id="file:REQ:tests/test_a.py", kind=NodeKind.FILE)
+        test = GraphNode(id="test:tests/test_a.py::test_x", kind=NodeKind.TEST)
+        result = GraphNode(id="result:1", kind=NodeKind.RESULT)
+        test.link(result, EdgeKind.YIELDS)
+        file_node.link(test, EdgeKind.CONTAINS)
+
+        assert result.file_node() is file_node
+
+    # Verifies: REQ-d00127-D
+    def test_file_node_follows_edge_kind_and_removal(self):
+        """Re-kinding or removing the CONTAINS edge unfiles the subtree."""
+        file_node = GraphNode(id="file:REQ:spec/a.md", kind=NodeKind.FILE)
+        req = GraphNode(id="REQ-p00001", kind=NodeKind.REQUIREMENT)
+        assertion = GraphNode(id="REQ-p00001-A", kind=NodeKind.ASSERTION)
+        req.link(assertion, EdgeKind.STRUCTURES)
+        edge = file_node.link(req, EdgeKind.CONTAINS)
+
+        file_node.set_edge_kind(edge, EdgeKind.DEFINES)
+        assert assertion.file_node() is None
+        file_node.set_edge_kind(edge, EdgeKind.CONTAINS)
+        assert assertion.file_node() is file_node
+
+        file_node.remove_edge(edge)
+        assert req.file_node() is None
+        assert assertion.file_node() is None
+
+    # Verifies: REQ-d00127-D
+    def test_file_node_ignores_traceability_parents(self):
+        """An IMPLEMENTS parent in another FILE does not re-file a node."""
+        spec = GraphNode(id="file:REQ:spec/a.md", kind=NodeKind.FILE)
+        code_file = GraphNode(id="file:REQ:src/a.py", kind=NodeKind.FILE)
+        req = GraphNode(id="REQ-p00001", kind=NodeKind.REQUIREMENT)
+        code = GraphNode(id="code:src/a.py:1", kind=NodeKind.CODE)
+        spec.link(req, EdgeKind.CONTAINS)
+        req.link(code, EdgeKind.IMPLEMENTS)
+        code_file.link(code, EdgeKind.CONTAINS)
+
+        assert code.file_node() is code_file
+
 
 class TestEdgeOperations:
     """Tests for edge-related operations."""
@@ -0,0 +1,128 @@
+# Verifies: REQ-d00054-A
+"""Tests for the binary graph snapshot ([scanning] snapshot)."""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+import elspais.graph.factory as factory
+from elspais.graph.factory import build_graph
+from elspais.graph.snapshot import graph_snapshot_path
+from tests.federation_repos import make_repo
+
+_SNAPSHOT = "\n[scanning]\nsnapshot = true\n"
+
+
+def _enable(repo: Path) -> None:
+    with open(repo / ".elspais.toml", "a", encoding="utf-8") as fh:
+        fh.write(_SNAPSHOT)
+
+
+def _refuse_scans(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _dispatch(*args, **kwargs):
+        raise AssertionError("the tree was scanned")
+
+    monkeypatch.setattr(factory, "dispatch_files", _dispatch)
+
+
+class TestGraphSnapshot:
+    def test_REQ_d00054_A_unchanged_tree_loads_the_snapshot(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        repo = make_repo(tmp_path, "app")
+        _enable(repo)
+        built = build_graph(repo_root=repo, scan_code=False, scan_tests=False)
+        assert graph_snapshot_path(repo).is_file()
+
+        _refuse_scans(monkeypatch)
+        loaded = build_graph(repo_root=repo, scan_code=False, scan_tests=False)
+
+        node = loaded.find_by_id("APP-d00001")
+        assert node is not None
+        assert node.get_label() == built.find_by_id("APP-d00001").get_label()
+        assert sum(1 for _ in loaded.all_nodes()) == sum(1 for _ in built.all_nodes())
+
+    def test_REQ_d00054_A_edited_tree_is_built_again(self, tmp_path: Path) -> None:
+        repo = make_repo(tmp_path, "app")
+        _enable(repo)
+        build_graph(repo_root=repo, scan_code=False, scan_tests=False)
+
+        spec = repo / "spec" / "reqs.md"
+        spec.write_text(
+            spec.read_text(encoding="utf-8").replace("APP-d00001", "APP-d00002"),
+            encoding="utf-8",
+        )
+        fed = build_graph(repo_root=repo, scan_code=False, scan_tests=False)
+
+        assert fed.find_by_id("APP-d00002") is not None
+        assert fed.find_by_id("APP-d00001") is None
+
+    def test_REQ_d00054_A_different_switches_are_built_again(self, tmp_path: Path) -> None:
+        repo = make_repo(tmp_path, "app")
+        _enable(repo)
+        build_graph(repo_root=repo, scan_code=False, scan_tests=False)
+        key = graph_snapshot_path(repo).read_bytes()[:80]
+
+        build_graph(repo_root=repo, scan_code=True, scan_tests=False)
+
+        assert graph_snapshot_path(repo).read_bytes()[:80] != key
+
+    def test_REQ_d00054_A_edited_associate_is_built_again(self, tmp_path: Path) -> None:
+        lib = make_repo(tmp_path, "lib")
+        host = make_repo(tmp_path, "app", associates={"lib": "../lib"})
+        _enable(host)
+        build_graph(repo_root=host, scan_code=False, scan_tests=False)
+
+        spec = lib / "spec" / "reqs.md"
+        spec.write_text(
+            spec.read_text(encoding="utf-8").replace("LIB-d00001", "LIB-d00002"),
+            encoding="utf-8",
+        )
+        fed = build_graph(repo_root=host, scan_code=False, scan_tests=False)
+
+        assert fed.find_by_id("LIB-d00002") is not None
+        assert {e.name for e in fed.iter_repos()} == {"app", "lib"}
+
+    def test_REQ_d00054_A_unreadable_snapshot_is_a_miss(self, tmp_path: Path) -> None:
+        repo = make_repo(tmp_path, "app")
+        _enable(repo)
+        build_graph(repo_root=repo, scan_code=False, scan_tests=False)
+        path = graph_snapshot_path(repo)
+        data = path.read_bytes()
+        path.write_bytes(data[: len(data) // 2])
+
+        fed = build_graph(repo_root=repo, scan_code=False, scan_tests=False)
+
+        assert fed.find_by_id("APP-d00001") is not None
+        assert path.stat().st_size == len(data)
+
+    def test_REQ_d00054_A_repository_outside_git_is_not_snapshotted(self, tmp_path: Path) -> None:
+        repo = make_repo(tmp_path, "app")
+        _enable(repo)
+        (repo / ".git").rename(tmp_path / "detached.git")
+
+        fed = build_graph(repo_root=repo, scan_code=False, scan_tests=False)
+
+        assert fed.find_by_id("APP-d00001") is not None
+        assert not graph_snapshot_path(repo).exists()
+
+    def test_REQ_d00054_A_warm_parse_memo_does_not_write(self, tmp_path: Path) -> None:
+        from elspais.graph.parse_cache import ParseMemo
+
+        repo = make_repo(tmp_path, "app")
+        _enable(repo)
+        # Files this new fall in the memo's racy window and are not kept.
+        for spec in (repo / "spec").iterdir():
+            os.utime(spec, ns=(time.time_ns() - 60_000_000_000,) * 2)
+        memo = ParseMemo()
+        build_graph(repo_root=repo, scan_code=False, scan_tests=False, parse_memo=memo)
+        assert len(memo)
+        path = graph_snapshot_path(repo)
+        path.unlink()
+
+        fed = build_graph(repo_root=repo, scan_code=False, scan_tests=False, parse_memo=memo)
+
+        assert fed.find_by_id("APP-d00001") is not None
+        assert not path.exists()
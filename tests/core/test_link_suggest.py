@@ -459,6 +459,40 @@ class TestSuggestLinks:
         test_ids = {s.test_id for s in result}
         assert "test:2" not in test_ids
 
+    def test_REQ_d00072_A_suggest_links_searches_each_query_once(self) -> None:
+        graph = _make_graph()
+        for i in range(3):
+            _add_test(
+                graph,
+                f"test:{i}",
+                function_name="test_validate_hash",
+                file_path="tests/test_hash.py",
+            )
+        queries: list[str] = []
+        discover = _make_discover_fn(
+            [
+                {
+                    "id": "REQ-1-A",
+                    "label": "A",
+                    "text": "SHALL hash",
+                    "requirement_id": "REQ-1",
+                    "requirement_title": "Hash",
+                    "level": "DEV",
+                    "score": 60.0,
+                    "direct_match": True,
+                },
+            ]
+        )
+
+        def discover_fn(graph, query, **kwargs):
+            queries.append(query)
+            return discover(graph, query, **kwargs)
+
+        result = suggest_links(graph, Path("/repo"), discover_fn=discover_fn)
+
+        assert len(queries) == 1
+        assert {s.test_id for s in result} == {"test:0", "test:1", "test:2"}
+
 
 # ===========================================================================
 # _deduplicate_suggestions
@@ -0,0 +1,82 @@
+# Verifies: REQ-d00061-B
+"""Tests for the derived text a node keeps (render.node_text())."""
+
+from __future__ import annotations
+
+import pytest
+
+from elspais.graph.builder import TraceGraph
+from elspais.graph.render import _build_body_text, node_text, reconstruct_body_text
+from elspais.graph.transfer import pack_graph, unpack_graph
+from tests.core.test_mutation_hash_consistency import build_graph_for_hash
+
+
+@pytest.fixture
+def graph() -> TraceGraph:
+    return build_graph_for_hash()
+
+
+def _assert_current(graph: TraceGraph) -> None:
+    req = graph.find_by_id("REQ-p00001")
+    text = node_text(req)
+    assert text.body == _build_body_text(req)
+    assert text.lower_body == text.body.lower()
+    assert text.lower_title == req.get_label().lower()
+
+
+class TestNodeText:
+    def test_REQ_d00061_B_kept_between_reads(self, graph: TraceGraph) -> None:
+        req = graph.find_by_id("REQ-p00001")
+
+        assert node_text(req) is node_text(req)
+        assert "A. The system SHALL validate input." in reconstruct_body_text(req)
+
+    def test_REQ_d00061_B_unrelated_field_keeps_it(self, graph: TraceGraph) -> None:
+        req = graph.find_by_id("REQ-p00001")
+        text = node_text(req)
+
+        graph.change_status("REQ-p00001", "Draft")
+
+        assert node_text(req) is text
+
+    @pytest.mark.parametrize(
+        "mutate",
+        [
+            lambda g: g.update_title("REQ-p00001", "Renamed Requirement"),
+            lambda g: g.update_assertion("REQ-p00001-A", "The system SHALL reject input."),
+            lambda g: g.add_assertion("REQ-p00001", "The system SHALL retry."),
+            lambda g: g.delete_assertion("REQ-p00001-B"),
+            lambda g: g.rename_assertion("REQ-p00001-B", "C"),
+            lambda g: g.add_remainder("REQ-p00001", "Rationale", "Because."),
+        ],
+        ids=["title", "update", "add", "delete", "rename", "remainder"],
+    )
+    def test_REQ_d00061_B_mutation_and_undo_drop_it(self, graph: TraceGraph, mutate) -> None:
+        before = node_text(graph.find_by_id("REQ-p00001"))
+
+        mutate(graph)
+        _assert_current(graph)
+        assert node_text(graph.find_by_id("REQ-p00001")) != before
+
+        graph.undo_last()
+        _assert_current(graph)
+        assert node_text(graph.find_by_id("REQ-p00001")) == before
+
+    def test_REQ_d00061_B_remainder_edit_drops_it(self, graph: TraceGraph) -> None:
+        graph.add_remainder("REQ-p00001", "Rationale", "Because.")
+        remainder = next(
+            n for n in graph.find_by_id("REQ-p00001").iter_children() if n.get_field("text")
+        )
+        _assert_current(graph)
+
+        graph.update_remainder(remainder.id, text="Because of audits.")
+
+        assert "Because of audits." in reconstruct_body_text(graph.find_by_id("REQ-p00001"))
+
+    def test_REQ_d00061_B_not_carried_by_a_packed_graph(self, graph: TraceGraph) -> None:
+        node_text(graph.find_by_id("REQ-p00001"))
+
+        copy = unpack_graph(pack_graph(graph))
+
+        assert copy.find_by_id("REQ-p00001")._text is None
+        _assert_current(copy)
@@ -205,6 +205,41 @@ class TestIterByKind:
         assert len(req_nodes) > 0
         assert all(n.kind == NodeKind.REQUIREMENT for n in req_nodes)
 
+    def test_REQ_d00130_E_kind_index_follows_mutations_and_undo(self) -> None:
+        """The per-kind index matches a scan of all nodes after every change."""
+        graph = build_graph(
+            make_requirement("REQ-p00001", title="One", assertions=[{"label": "A", "text": "x"}]),
+            make_requirement("REQ-p00002", title="Two", start_line=20, end_line=30),
+        )
+
+        def check() -> None:
+            for kind in NodeKind:
+                scanned = [n for n in graph.all_nodes() if n.kind == kind]
+                assert list(graph.iter_by_kind(kind)) == scanned, f"Mismatch for {kind}"
+
+        check()
+        graph.add_requirement("REQ-p00003", "Three", "PRD")
+        check()
+        graph.rename_node("REQ-p00001", "REQ-p00009")
+        check()
+        graph.delete_requirement("REQ-p00002")
+        check()
+        while graph.undo_last() is not None:
+            check()
+        assert {n.id for n in graph.iter_by_kind(NodeKind.REQUIREMENT)} == {
+            "REQ-p00001",
+            "REQ-p00002",
+        }
+
+    def test_REQ_d00130_E_assigned_index_is_bucketed(self) -> None:
+        """A plain dict assigned as the index is adopted with its kinds."""
+        graph = TraceGraph()
+        node = GraphNode(id="REQ-p00001", kind=NodeKind.REQUIREMENT)
+        graph._index = {node.id: node}
+
+        assert list(graph.iter_by_kind(NodeKind.REQUIREMENT)) == [node]
+        assert list(graph.iter_by_kind(NodeKind.FILE)) == []
+
 
 class TestFileNodesExcludedFromDefault:
     """Validates REQ-d00130-F: FILE nodes not in default iter_roots()."""
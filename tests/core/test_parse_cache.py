@@ -0,0 +1,361 @@
+# Verifies: REQ-d00054-A
+"""Tests for the on-disk parse cache ([scanning] cache)."""
+
+import os
+import time
+from pathlib import Path
+
+from elspais.graph.deserializer import dispatch_files
+from elspais.graph.factory import build_graph
+from elspais.graph.GraphNode import NodeKind
+from elspais.graph.parse_cache import ParseCache, ParseMemo, parse_cache_dir
+from elspais.graph.parsers import ParsedContent
+
+_CONFIG = """\
+[project]
+name = "test-parse-cache"
+namespace = "REQ"
+
+[scanning]
+cache = true
+
+[scanning.spec]
+directories = ["spec"]
+
+[scanning.code]
+directories = ["src"]
+"""
+
+_SPEC = """\
+### REQ-p00001: Cached
+
+**Level**: PRD | **Status**: Active
+
+The system SHALL do something testable.
+
+*End* *Cached* | **Hash**: ________
+"""
+
+
+def _counting_dispatch(calls: list[str]):
+    def dispatch(content: str, file_path: str) -> list[ParsedContent]:
+        calls.append(file_path)
+        return [ParsedContent("remainder", 1, 1, content, {"path": file_path})]
+
+    return dispatch
+
+
+class TestParseCache:
+    def test_REQ_d00054_A_hit_skips_dispatch(self, tmp_path: Path) -> None:
+        src = tmp_path / "a.py"
+        src.write_text("x = 1\n", encoding="utf-8")
+        cache = ParseCache(tmp_path / "cache")
+        calls: list[str] = []
+        dispatch = _counting_dispatch(calls)
+
+        first = list(dispatch_files([src], dispatch, cache=cache, cache_scope="s"))
+        second = list(dispatch_files([src], dispatch, cache=cache, cache_scope="s"))
+
+        assert calls == [str(src)]
+        assert [p.parsed_data for p in first[0][1]] == [p.parsed_data for p in second[0][1]]
+        assert second[0][1][0].source_context is second[0][0]
+
+    def test_REQ_d00054_A_content_scope_and_path_each_miss(self, tmp_path: Path) -> None:
+        src = tmp_path / "a.py"
+        other = tmp_path / "b.py"
+        src.write_text("x = 1\n", encoding="utf-8")
+        other.write_text("x = 1\n", encoding="utf-8")
+        cache = ParseCache(tmp_path / "cache")
+        calls: list[str] = []
+        dispatch = _counting_dispatch(calls)
+
+        list(dispatch_files([src], dispatch, cache=cache, cache_scope="s"))
+        list(dispatch_files([src], dispatch, cache=cache, cache_scope="t"))
+        list(dispatch_files([other], dispatch, cache=cache, cache_scope="s"))
+        src.write_text("x = 2\n", encoding="utf-8")
+        list(dispatch_files([src], dispatch, cache=cache, cache_scope="s"))
+
+        assert calls == [str(src), str(src), str(other), str(src)]
+
+    def test_REQ_d00054_A_corrupt_entry_is_a_miss(self, tmp_path: Path) -> None:
+        cache = ParseCache(tmp_path / "cache")
+        key = cache.key("s", "a.py", "x")
+        cache.put(key, [])
+        next((tmp_path / "cache").rglob("*.pickle")).write_bytes(b"not a pickle")
+
+        assert cache.get(key) is None
+
+    def test_REQ_d00054_A_prune_drops_least_recently_used(self, tmp_path: Path) -> None:
+        cache = ParseCache(tmp_path / "cache")
+        keys = [cache.key("s", f"{name}.py", "x" * 1000) for name in "abc"]
+        for age, key in enumerate(keys):
+            cache.put(key, ["y" * 1000])
+            then = time.time_ns() - (3 - age) * 60_000_000_000
+            os.utime(cache._path(key), ns=(then, then))
+        cache.get(keys[0])
+        cache.max_bytes = 2 * cache._path(keys[0]).stat().st_size
+
+        assert cache.prune() == 1
+        assert cache.get(keys[0]) is not None
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[2]) is not None
+
+    def test_REQ_d00054_A_cached_build_matches_uncached(self, tmp_path: Path) -> None:
+        (tmp_path / ".elspais.toml").write_text(_CONFIG, encoding="utf-8")
+        (tmp_path / "spec").mkdir()
+        (tmp_path / "spec" / "reqs.md").write_text(_SPEC, encoding="utf-8")
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "main.py").write_text(
+            "# Implements: REQ-p00001\ndef work(): pass\n", encoding="utf-8"
+        )
+
+        cold = build_graph(repo_root=tmp_path, config_path=tmp_path / ".elspais.toml")
+        assert any(parse_cache_dir(tmp_path).rglob("*.pickle"))
+        warm = build_graph(repo_root=tmp_path, config_path=tmp_path / ".elspais.toml")
+
+        def ids(graph) -> list[tuple[str, list[str]]]:
+            return [(n.id, sorted(c.id for c in n.iter_children())) for n in graph.all_nodes()]
+
+        assert ids(warm) == ids(cold)
+        code = warm.find_by_id("REQ-p00001")
+        assert code is not None
+        assert any(c.kind.value == "code" for c in code.iter_children())
+
+
+def _age(path: Path) -> None:
+    """Backdate ``path`` out of the memo's racy window."""
+    os.utime(path, ns=(time.time_ns() - 60_000_000_000,) * 2)
+
+
+class TestParseMemo:
+    def test_REQ_d00054_A_unchanged_file_is_not_reparsed(self, tmp_path: Path) -> None:
+        src = tmp_path / "a.py"
+        src.write_text("x = 1\n", encoding="utf-8")
+        _age(src)
+        memo = ParseMemo()
+        calls: list[str] = []
+        dispatch = _counting_dispatch(calls)
+
+        list(dispatch_files([src], dispatch, memo=memo, cache_scope="s"))
+        again = list(dispatch_files([src], dispatch, memo=memo, cache_scope="s"))
+
+        assert calls == [str(src)]
+        assert memo.hits == 1
+        assert again[0][1][0].source_context is again[0][0]
+
+    def test_REQ_d00054_A_edited_or_rescoped_file_is_reparsed(self, tmp_path: Path) -> None:
+        src = tmp_path / "a.py"
+        src.write_text("x = 1\n", encoding="utf-8")
+        _age(src)
+        memo = ParseMemo()
+        calls: list[str] = []
+        dispatch = _counting_dispatch(calls)
+
+        list(dispatch_files([src], dispatch, memo=memo, cache_scope="s"))
+        list(dispatch_files([src], dispatch, memo=memo, cache_scope="t"))
+        src.write_text("x = 22\n", encoding="utf-8")
+        _age(src)
+        edited = list(dispatch_files([src], dispatch, memo=memo, cache_scope="s"))
+
+        assert calls == [str(src)] * 3
+        assert edited[0][1][0].raw_text == "x = 22\n"
+
+    def test_REQ_d00054_A_recently_modified_file_is_never_trusted(self, tmp_path: Path) -> None:
+        src = tmp_path / "a.py"
+        src.write_text("x = 1\n", encoding="utf-8")
+        memo = ParseMemo()
+        calls: list[str] = []
+        dispatch = _counting_dispatch(calls)
+
+        list(dispatch_files([src], dispatch, memo=memo, cache_scope="s"))
+        list(dispatch_files([src], dispatch, memo=memo, cache_scope="s"))
+
+        assert calls == [str(src)] * 2
+        assert len(memo) == 0
+
+    def test_REQ_d00054_A_prune_drops_files_no_longer_visited(self, tmp_path: Path) -> None:
+        kept, gone = tmp_path / "a.py", tmp_path / "b.py"
+        for p in (kept, gone):
+            p.write_text("x = 1\n", encoding="utf-8")
+            _age(p)
+        memo = ParseMemo()
+        dispatch = _counting_dispatch([])
+
+        list(dispatch_files([kept, gone], dispatch, memo=memo, cache_scope="s"))
+        assert memo.prune() == 0
+        list(dispatch_files([kept], dispatch, memo=memo, cache_scope="s"))
+
+        assert memo.prune() == 1
+        assert len(memo) == 1
+
+    def test_REQ_d00054_A_prune_drops_member_snapshots_no_longer_used(self) -> None:
+        memo = ParseMemo()
+        memo.put_member("kept", b"a")
+        memo.put_member("gone", b"b")
+        assert memo.prune() == 0
+
+        assert memo.get_member("kept") == b"a"
+        assert memo.prune() == 1
+        assert memo.get_member("gone") is None
+
+    def test_REQ_d00054_A_shared_rebuild_sees_edits(self, tmp_path: Path) -> None:
+        from elspais.mcp.shared_state import SharedServerState, rebuild_shared_graph
+
+        (tmp_path / ".elspais.toml").write_text(_CONFIG, encoding="utf-8")
+        (tmp_path / "spec").mkdir()
+        spec = tmp_path / "spec" / "reqs.md"
+        spec.write_text(_SPEC, encoding="utf-8")
+        (tmp_path / "src").mkdir()
+        code = tmp_path / "src" / "main.py"
+        code.write_text("def work(): pass\n", encoding="utf-8")
+        for p in (spec, code):
+            _age(p)
+        holder = SharedServerState({"working_dir": tmp_path})
+
+        assert rebuild_shared_graph(holder)["success"] is True
+        assert len(holder.parse_memo) == 2
+        code.write_text("# Implements: REQ-p00001\ndef work(): pass\n", encoding="utf-8")
+        _age(code)
+        misses = holder.parse_memo.misses
+        assert rebuild_shared_graph(holder)["success"] is True
+
+        assert holder.parse_memo.misses == misses + 1
+        req = holder["graph"].find_by_id("REQ-p00001")
+        assert any(c.kind.value == "code" for c in req.iter_children())
+
+    def test_REQ_d00054_A_memo_rebuild_keeps_duplicates(self, tmp_path: Path) -> None:
+        (tmp_path / ".elspais.toml").write_text(_CONFIG, encoding="utf-8")
+        (tmp_path / "spec").mkdir()
+        (tmp_path / "src").mkdir()
+        for name in ("a.md", "b.md"):
+            spec = tmp_path / "spec" / name
+            spec.write_text(_SPEC, encoding="utf-8")
+            _age(spec)
+        memo = ParseMemo()
+
+        def built(graph) -> tuple:
+            nodes = [(n.id, n.get_field("is_duplicate")) for n in graph.all_nodes()]
+            return sorted(nodes, key=repr), graph.duplicate_req_ids()
+
+        cold = built(build_graph(repo_root=tmp_path, parse_memo=memo))
+        hits = memo.hits
+        warm = built(build_graph(repo_root=tmp_path, parse_memo=memo))
+
+        assert memo.hits == hits + 2
+        assert cold[1] == {"REQ-p00001": ["spec/a.md", "spec/b.md"]}
+        assert warm == cold
+
+
+_RESULTS_CONFIG = """\
+[project]
+name = "test-result-cache"
+namespace = "REQ"
+
+[scanning]
+cache = {cache}
+
+[scanning.spec]
+directories = ["spec"]
+
+[scanning.test]
+enabled = true
+
+[[scanning.test.targets]]
+name = "unit"
+reporter = "junit"
+results = "results/*.xml"
+"""
+
+
+def _junit_shard(path: Path, name: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        '<?xml version="1.0"?><testsuite name="s" tests="1">'
+        f'<testcase name="{name}" classname="tests.test_a" file="tests/test_a.py" line="4"'
+        ' time="0.1"/></testsuite>\n',
+        encoding="utf-8",
+    )
+    _age(path)
+
+
+def _results_repo(tmp_path: Path, *, cache: bool) -> Path:
+    (tmp_path / ".elspais.toml").write_text(
+        _RESULTS_CONFIG.format(cache=str(cache).lower()), encoding="utf-8"
+    )
+    (tmp_path / "spec").mkdir()
+    for i in range(3):
+        _junit_shard(tmp_path / "results" / f"TEST-{i}.xml", f"test_{i}")
+    return tmp_path
+
+
+def _counting_junit(monkeypatch, calls: list[str]) -> None:
+    from elspais.graph.parsers.results.junit_xml import JUnitXMLParser
+
+    iter_file = JUnitXMLParser.iter_file
+
+    def counting(self, path, source_path):
+        calls.append(Path(source_path).name)
+        return iter_file(self, path, source_path)
+
+    monkeypatch.setattr(JUnitXMLParser, "iter_file", counting)
+
+
+def _results(graph) -> list[tuple]:
+    return sorted(
+        (n.get_field("name"), n.get_field("status"), n.get_field("line"))
+        for n in graph.iter_by_kind(NodeKind.RESULT)
+    )
+
+
+class TestResultShards:
+    def test_REQ_d00054_A_unchanged_shards_are_replayed_from_memo(
+        self, tmp_path: Path, monkeypatch
+    ) -> None:
+        repo = _results_repo(tmp_path, cache=False)
+        calls: list[str] = []
+        _counting_junit(monkeypatch, calls)
+        memo = ParseMemo()
+
+        first = _results(build_graph(repo_root=repo, parse_memo=memo))
+        _junit_shard(repo / "results" / "TEST-1.xml", "test_renamed")
+        second = _results(build_graph(repo_root=repo, parse_memo=memo))
+
+        assert sorted(calls) == ["TEST-0.xml", "TEST-1.xml", "TEST-1.xml", "TEST-2.xml"]
+        # junit lines count from zero; replays must not shift them twice.
+        assert first[0] == ("test_0", "passed", 5)
+        assert second == sorted([first[0], first[2], ("test_renamed", "passed", 5)])
+
+    def test_REQ_d00054_A_unchanged_shards_are_replayed_from_disk(
+        self, tmp_path: Path, monkeypatch
+    ) -> None:
+        repo = _results_repo(tmp_path, cache=True)
+        calls: list[str] = []
+        _counting_junit(monkeypatch, calls)
+
+        first = _results(build_graph(repo_root=repo))
+        second = _results(build_graph(repo_root=repo))
+
+        assert len(calls) == 3
+        assert second == first
+
+    def test_REQ_d00054_A_truncated_shard_keeps_earlier_results_uncached(
+        self, tmp_path: Path, monkeypatch
+    ) -> None:
+        repo = _results_repo(tmp_path, cache=True)
+        shard = repo / "results" / "TEST-1.xml"
+        shard.write_text(
+            '<?xml version="1.0"?><testsuite name="s">'
+            '<testcase name="test_kept" classname="tests.test_a" time="0.1"/>'
+            '<testcase name="test_cut" classname="tests.test_a" ti',
+            encoding="utf-8",
+        )
+        _age(shard)
+        calls: list[str] = []
+        _counting_junit(monkeypatch, calls)
+        memo = ParseMemo()
+
+        for _ in range(2):
+            names = [r[0] for r in _results(build_graph(repo_root=repo, parse_memo=memo))]
+            assert names == ["test_0", "test_2", "test_kept"]
+
+        assert calls.count("TEST-1.xml") == 2
@@ -1,5 +1,9 @@
 """Tests for JUnit XML Parser."""
 
+import xml.etree.ElementTree as ET
+
+import pytest
+
 from elspais.graph.parsers.results.junit_xml import JUnitXMLParser
 
 
@@ -371,3 +375,48 @@ class TestResultsFileProvenance:
         assert results[0]["source_path"] == "e2e/link.spec.ts"
         assert results[0]["result_file"] == "test-results/junit.xml"
         assert results[0]["result_line"] == 3
+
+
+class TestJUnitXMLParserStreaming:
+    """iter_file() streams a report from disk (REQ-d00254-F)."""
+
+    _XML = """<?xml version="1.0" encoding="UTF-8"?>
+<testsuites>
+  <testsuite name="a">
+    <testcase classname="tests.test_a" name="test_one" time="0.1"/>
+    <testcase classname="tests.test_a" name="test_two" time="0.1">
+      <failure message="boom">trace</failure>
+    </testcase>
+  </testsuite>
+  <testsuite name="b">
+    <testcase classname="tests.test_a" name="test_one" time="0.2"/>
+  </testsuite>
+</testsuites>
+"""
+
+    # Verifies: REQ-d00254-F
+    def test_iter_file_matches_parse(self, tmp_path):
+        report = tmp_path / "junit.xml"
+        report.write_text(self._XML, encoding="utf-8")
+        parser = JUnitXMLParser()
+
+        streamed = list(parser.iter_file(report, "results/junit.xml"))
+
+        assert streamed == parser.parse(self._XML, "results/junit.xml")
+        assert [r["status"] for r in streamed] == ["passed", "failed", "passed"]
+
+    # Verifies: REQ-d00254-F
+    def test_repeated_testcase_keeps_its_own_line(self):
+        results = JUnitXMLParser().parse(self._XML, "results/junit.xml")
+
+        assert [r["result_line"] for r in results] == [4, 5, 10]
+
+    # Verifies: REQ-d00254-F
+    def test_truncated_file_yields_records_before_the_break(self, tmp_path):
+        report = tmp_path / "junit.xml"
+        report.write_text(self._XML[: self._XML.index('<testsuite name="b">')], encoding="utf-8")
+        records = JUnitXMLParser().iter_file(report, "results/junit.xml")
+
+        assert [r["name"] for r in (next(records), next(records))] == ["test_one", "test_two"]
+        with pytest.raises(ET.ParseError):
+            next(records)
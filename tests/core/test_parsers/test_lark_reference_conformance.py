@@ -552,3 +552,49 @@ def test_a_continuation_chain_of_three_lines_binds_every_reference(parse_code):
     assert "REQ-d00001" in refs
     assert "REQ-d00002" in refs
     assert "REQ-d00003" in refs
+
+
+class TestReferenceScreen:
+    """Files no reference terminal can match skip the parse, not its result."""
+
+    _PLAIN = (
+        "import os\n\n\n"
+        "def helper(x):\n"
+        "    # joins a path onto x\n"
+        "    return os.path.join(x, 'y')\n"
+        "\n"
+        "class TestThing:\n"
+        "    def test_helper(self):\n"
+        "        assert helper('a')\n"
+    )
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "# Implements: REQ-p00001",
+            "# VERIFIES: REQ-p00001",
+            "// **Refines**: WIDGET-1",
+            "#   REQ-p00001: block ref without a header",
+            "def test_login_REQ_p00001(): pass",
+            "# Verifies: JNY-Login-01",
+        ],
+    )
+    def test_screen_finds_every_reference_form(self, resolver, line):
+        screen = GrammarFactory(resolver).reference_screen()
+
+        assert screen.search(self._PLAIN + line + "\n")
+
+    def test_screen_passes_plain_code(self, resolver):
+        assert not GrammarFactory(resolver).reference_screen().search(self._PLAIN)
+
+    @pytest.mark.parametrize("kind", ["dispatch_code", "dispatch_test"])
+    def test_screened_dispatch_matches_full_parse(self, resolver, kind):
+        screened = FileDispatcher(resolver)
+        full = FileDispatcher(resolver)
+        full._may_reference = lambda content: True
+
+        expected = getattr(full, kind)(self._PLAIN, "demo.py")
+
+        assert getattr(screened, kind)(self._PLAIN, "demo.py") == expected
+        if kind == "dispatch_test":
+            assert any(r.content_type == "test_ref" for r in expected)
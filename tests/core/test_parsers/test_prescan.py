@@ -15,7 +15,9 @@ establish would report coverage the estate has not earned.
 """
 
 from elspais.graph.parsers.prescan import (
+    analyze_python_source,
     ast_prescan,
+    ast_string_literal_lines,
     build_line_context,
     detect_language,
     external_prescan,
@@ -188,6 +190,65 @@ class TestAstPrescan:
         assert all_test_funcs[0][2] == "TestBar"
 
 
+class TestAnalyzePythonSource:
+    """Tests for analyze_python_source: one parse, every per-file fact."""
+
+    _SOURCE = (
+        "from pkg.mod import thing\n"
+        "import os\n"
+        "\n"
+        "class TestThing:\n"
+        "    def test_it(self):\n"
+        '        text = """\n'
+        "        quoted\n"
+        '        """\n'
+    )
+
+    def _lines(self, source):
+        return [(i + 1, line) for i, line in enumerate(source.split("\n"))]
+
+    def test_agrees_with_separate_scans(self):
+        lines = self._lines(self._SOURCE)
+
+        analysis = analyze_python_source(self._SOURCE, lines)
+
+        assert (
+            analysis.line_context,
+            analysis.all_test_funcs,
+            analysis.first_def_line,
+        ) == ast_prescan(self._SOURCE, lines)
+        assert analysis.string_literal_lines == ast_string_literal_lines(self._SOURCE) == {7, 8}
+        assert analysis.imports == ["pkg.mod", "os"]
+
+    def test_parses_once(self, monkeypatch):
+        import ast
+
+        calls = []
+        real_parse = ast.parse
+
+        def counting_parse(*args, **kwargs):
+            calls.append(1)
+            return real_parse(*args, **kwargs)
+
+        monkeypatch.setattr(ast, "parse", counting_parse)
+        analyze_python_source(self._SOURCE, self._lines(self._SOURCE))
+
+        assert len(calls) == 1
+
+    def test_unparseable_source_falls_back_to_text_prescan(self):
+        source = "def test_broken(:\n    pass\n"
+        lines = self._lines(source)
+
+        analysis = analyze_python_source(source, lines)
+
+        assert (
+            analysis.line_context,
+            analysis.all_test_funcs,
+            analysis.first_def_line,
+        ) == text_prescan(lines)
+        assert analysis.string_literal_lines == set()
+
+
 class TestExternalPrescan:
     """Tests for external_prescan utility."""
 
@@ -11,6 +11,8 @@ equivalent data.
 from __future__ import annotations
 
 import importlib.util
+import os
+import sqlite3
 from pathlib import Path
 
 import pytest
@@ -220,3 +222,121 @@ class TestParse:
 
         monkeypatch.setattr(builtins, "__import__", _fake_import)
         assert CoverageSqliteParser().parse("", str(cov_path)) == {}
+
+
+def _unordered(results: dict) -> dict:
+    """``results`` with each line's contexts as a set: neither reader orders them."""
+    return {
+        path: {
+            **data,
+            "contexts": data["contexts"]
+            and {ln: set(ctxs) for ln, ctxs in data["contexts"].items()},
+        }
+        for path, data in results.items()
+    }
+
+
+class TestIterDirect:
+    """The opt-in direct reader answers as parse() does, file by file."""
+
+    def test_matches_parse(self, cov_fixture: tuple[Path, Path]) -> None:
+        _, cov_path = cov_fixture
+        parser = CoverageSqliteParser()
+
+        assert _unordered(dict(parser.iter_direct(str(cov_path)))) == _unordered(
+            parser.parse("", str(cov_path))
+        )
+
+    def test_matches_parse_for_branch_data(self, tmp_path: Path) -> None:
+        """Branch-measured runs keep their lines in the `arc` table; a
+        statement spanning lines is credited once, to its first line."""
+        mod_path = tmp_path / "branchy.py"
+        mod_path.write_text(
+            "def pick(a, b):\n    total = (a +\n             b)\n    if total > 3:\n"
+            "        return total\n    return 0\n",
+            encoding="utf-8",
+        )
+        cov_path = tmp_path / ".coverage"
+        cov = coverage.Coverage(data_file=str(cov_path), branch=True, source=[str(tmp_path)])
+        cov.start()
+        try:
+            spec = importlib.util.spec_from_file_location("cov_sqlite_branchy", str(mod_path))
+            mod = importlib.util.module_from_spec(spec)
+            cov.switch_context("tests/test_b.py::test_pick|run")
+            spec.loader.exec_module(mod)
+            mod.pick(1, 1)
+        finally:
+            cov.stop()
+        cov.save()
+        parser = CoverageSqliteParser()
+
+        direct = dict(parser.iter_direct(str(cov_path)))
+
+        assert _unordered(direct) == _unordered(parser.parse("", str(cov_path)))
+        assert direct[str(mod_path)]["line_coverage"][5] == 0
+
+    def test_unwanted_files_are_not_yielded(self, cov_fixture: tuple[Path, Path]) -> None:
+        mod_path, cov_path = cov_fixture
+        parser = CoverageSqliteParser()
+
+        assert list(parser.iter_direct(str(cov_path), wanted_files=lambda f: False)) == []
+        accepted = dict(parser.iter_direct(str(cov_path), wanted_files=lambda f: True))
+        assert list(accepted) == [str(mod_path)]
+
+    def test_statements_are_reanalysed_only_after_an_edit(
+        self, cov_fixture: tuple[Path, Path], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from elspais.graph.parsers.results import coverage_sqlite
+
+        mod_path, cov_path = cov_fixture
+        analysed: list[str] = []
+        make = coverage_sqlite._python_reporter_factory
+
+        def _counting_factory():
+            reporter_for = make()
+
+            def _reporter(path):
+                analysed.append(path)
+                return reporter_for(path)
+
+            return _reporter
+
+        monkeypatch.setattr(coverage_sqlite, "_python_reporter_factory", _counting_factory)
+        # The file was just written; age it past the racy-signature window.
+        os.utime(mod_path, ns=(0, 0))
+        parser = CoverageSqliteParser()
+
+        first = dict(parser.iter_direct(str(cov_path)))
+        second = dict(parser.iter_direct(str(cov_path)))
+        assert first == second and analysed == [str(mod_path)]
+
+        mod_path.write_text(mod_path.read_text() + "\n\nVALUE = 1\n", encoding="utf-8")
+        os.utime(mod_path, ns=(10**9, 10**9))
+        third = dict(parser.iter_direct(str(cov_path)))
+        assert analysed == [str(mod_path)] * 2
+        assert (
+            third[str(mod_path)]["executable_lines"] == first[str(mod_path)]["executable_lines"] + 1
+        )
+
+    def test_other_schema_versions_use_parse(
+        self, cov_fixture: tuple[Path, Path], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        _, cov_path = cov_fixture
+        con = sqlite3.connect(cov_path)
+        with con:
+            con.execute("UPDATE coverage_schema SET version = 99")
+        con.close()
+        calls: list[str] = []
+        monkeypatch.setattr(
+            CoverageSqliteParser,
+            "parse",
+            lambda self, content, source_path, **kw: calls.append(source_path) or {},
+        )
+
+        assert list(CoverageSqliteParser().iter_direct(str(cov_path))) == []
+        assert calls == [str(cov_path)]
+
+    def test_unreadable_file_yields_nothing(self, tmp_path: Path) -> None:
+        bogus = tmp_path / ".coverage"
+        bogus.write_bytes(_SQLITE_MAGIC + b"not really a coverage db")
+        assert list(CoverageSqliteParser().iter_direct(str(bogus))) == []
@@ -318,6 +318,25 @@ class TestSerializeAdditionalCoverage:
         assert result["metadata"]["node_count"] == 0
         assert result["metadata"]["root_count"] == 0
 
+    # Verifies: REQ-d00064-B
+    def test_serialize_graph_file_coverage_is_json_safe(self, sample_graph):
+        """A FILE's line hits and per-line test contexts survive json.dumps."""
+        import json
+
+        from elspais.graph.coverage_data import LineContexts, LineHits
+
+        file_node = next(iter(sample_graph.nodes_by_kind(NodeKind.FILE)))
+        file_node.set_field("line_hits", LineHits({3: 2, 4: 0}))
+        file_node.set_field(
+            "line_contexts", LineContexts({3: ["t.py::test_b|run", "t.py::test_a|run"]})
+        )
+
+        result = json.loads(json.dumps(serialize_graph(sample_graph)))
+
+        content = result["nodes"][file_node.id]["content"]
+        assert content["line_hits"] == {"3": 2, "4": 0}
+        assert content["line_contexts"] == {"3": ["t.py::test_b|run", "t.py::test_a|run"]}
+
 
 class TestSerializeMetricsFiltering:
     """Validates REQ-d00055-D: Serializer filters non-JSON-serializable metrics.
@@ -199,6 +199,25 @@ class TestAppState:
 
         assert state.is_stale()
 
+    def test_is_stale_ignores_skipped_trees(self, tmp_path):
+        """A tree the build skips is not walked, so its edits are not changes."""
+        from elspais.server.state import AppState
+
+        (tmp_path / ".elspais.toml").write_text(
+            _MINIMAL_CONFIG + '\n[scanning.spec]\nskip_dirs = ["vendor"]\n'
+        )
+        vendored = tmp_path / "spec" / "vendor" / "lib.md"
+        vendored.parent.mkdir(parents=True)
+        vendored.write_text("# Vendored\n")
+
+        state = AppState.from_config(repo_root=tmp_path)
+        state.snapshot_mtimes()
+        vendored.write_text("# Vendored, edited\n")
+        assert not state.is_stale()
+
+        (tmp_path / "spec" / "new.md").write_text("# REQ-002\nNew req\n")
+        assert state.is_stale()
+
     def test_allowed_roots_defaults_to_repo_root(self, tmp_path):
         """AppState.allowed_roots defaults to [repo_root]."""
         from elspais.server.state import AppState
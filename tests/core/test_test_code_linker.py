@@ -250,6 +250,33 @@ class TestLinkTestsToCode:
                 found_edge = True
         assert found_edge
 
+    # Verifies: REQ-o00050-C
+    def test_uses_imports_read_during_the_build(self, tmp_path):
+        """Imports handed over per FILE node are used instead of reading the file."""
+        src_dir = tmp_path / "src" / "elspais"
+        src_dir.mkdir(parents=True)
+        (src_dir / "__init__.py").write_text("")
+        (src_dir / "auth.py").write_text("def authenticate():\n    pass\n")
+        # The test file is never created: its imports come from the table
+
+        graph = TraceGraph(repo_root=tmp_path)
+        code_node = GraphNode(id="code:src/elspais/auth.py:1", kind=NodeKind.CODE)
+        code_node.set_field("function_name", "authenticate")
+        wire_file_parent(code_node, "src/elspais/auth.py", line=1, graph=graph)
+        graph._index[code_node.id] = code_node
+
+        test_node = GraphNode(
+            id="test:tests/test_auth.py::test_authenticate",
+            kind=NodeKind.TEST,
+        )
+        test_node.set_field("function_name", "test_authenticate")
+        test_file = wire_file_parent(test_node, "tests/test_auth.py", line=3, graph=graph)
+        graph._index[test_node.id] = test_node
+
+        result = link_tests_to_code(graph, tmp_path, file_imports={test_file.id: ["elspais.auth"]})
+
+        assert result == 1
+
     # Verifies: REQ-o00050-C
     def test_skips_test_with_existing_code_parent(self, tmp_path):
         """TEST nodes already linked to CODE should not get duplicate edges."""
@@ -130,3 +130,63 @@ class TestTraceGraphClone:
         """Clone preserves repo_root attribute."""
         cloned = simple_graph.clone()
         assert str(cloned.repo_root) == str(simple_graph.repo_root)
+
+
+class TestCloneSharing:
+    """What clone() copies and what it shares."""
+
+    # Verifies: REQ-d00216-A
+    def test_mutable_content_is_copied(self, simple_graph):
+        req = simple_graph.find_by_id("REQ-p00001")
+        req.set_field("keywords", ["alpha"])
+        req.set_field("sections", [{"name": "Rationale", "content": "why"}])
+
+        cloned_req = simple_graph.clone().find_by_id("REQ-p00001")
+        cloned_req.get_field("keywords").append("beta")
+        cloned_req.get_field("sections")[0]["content"] = "changed"
+
+        assert req.get_field("keywords") == ["alpha"]
+        assert req.get_field("sections")[0]["content"] == "why"
+
+    # Verifies: REQ-d00216-B
+    def test_coverage_payloads_are_shared(self, simple_graph):
+        req = simple_graph.find_by_id("REQ-p00001")
+        line_coverage = {1: 1, 2: 0}
+        req.set_field("line_coverage", line_coverage)
+
+        cloned_req = simple_graph.clone().find_by_id("REQ-p00001")
+
+        assert cloned_req.get_field("line_coverage") is line_coverage
+
+    # Verifies: REQ-d00216-C
+    def test_edges_are_new_and_removable(self, simple_graph):
+        req = simple_graph.find_by_id("REQ-p00001")
+        original_edge = next(req.iter_outgoing_edges())
+
+        cloned_req = simple_graph.clone().find_by_id("REQ-p00001")
+        edge = next(cloned_req.iter_outgoing_edges())
+
+        assert edge is not original_edge
+        assert edge.kind is EdgeKind.STRUCTURES
+        assert next(edge.target.iter_incoming_edges()) is edge
+        assert cloned_req.remove_edge(edge)
+        assert list(req.iter_children())
+
+    # Verifies: REQ-d00216-F
+    def test_long_chain_clones_without_recursion(self):
+        graph = TraceGraph(repo_root="/tmp/test")
+        prev = None
+        for i in range(5000):
+            node = GraphNode(id=f"REQ-d{i:05d}", kind=NodeKind.REQUIREMENT)
+            graph._index[node.id] = node
+            if prev is None:
+                graph._roots.append(node)
+            else:
+                prev.link(node, EdgeKind.IMPLEMENTS)
+            prev = node
+
+        cloned = graph.clone()
+
+        last = cloned.find_by_id("REQ-d04999")
+        assert next(last.iter_parents()) is cloned.find_by_id("REQ-d04998")
+        assert cloned.node_count() == 5000
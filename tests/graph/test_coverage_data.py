@@ -0,0 +1,157 @@
+# Verifies: REQ-d00254-B
+# Verifies: REQ-d00254-G
+"""The compact per-file coverage stores read like the dicts they replace.
+
+Ingestion stores ``LineHits`` and ``LineContexts`` on FILE nodes; readers
+that index a line or compare against a dict must see the same answers the
+plain dicts gave, and the counting queries must agree with counting by hand.
+``LineContexts`` also resolves each line's contexts to TEST node ids as it
+is built, once per ingest through a shared ``ContextNormalizer``.
+"""
+
+import copy
+import pickle
+
+from elspais.graph.coverage_data import (
+    ContextNormalizer,
+    LineContexts,
+    LineHits,
+    run_context_test_id,
+)
+
+_HITS = {3: 2, 4: 0, 7: 1, 9: 0}
+_CONTEXTS = {
+    4: ["tests/test_a.py::test_one|run"],
+    2: ["tests/test_a.py::test_one|run", "tests/test_a.py::test_two|setup"],
+    6: ["tests/test_a.py::TestB::test_three[x-1]|run", "tests/test_a.py::test_one|run"],
+    9: [""],
+}
+_ONE = "test:tests/test_a.py::test_one"
+_THREE = "test:tests/test_a.py::TestB::test_three"
+
+
+class TestLineHits:
+    def test_reads_like_the_dict(self):
+        hits = LineHits(_HITS)
+
+        assert hits == _HITS
+        assert list(hits) == [3, 4, 7, 9]
+        assert len(hits) == 4
+        assert hits[3] == 2 and hits.get(5) is None and hits.get(100, 0) == 0
+        assert 4 in hits and 5 not in hits
+
+    def test_counts(self):
+        hits = LineHits(_HITS)
+
+        assert hits.covered_lines == 2
+        assert hits.count_covered(range(1, 20)) == 2
+        assert hits.count_covered([4, 9, 500]) == 0
+        assert hits.executable_in(4, 9) == [4, 7]
+        assert hits.executable_in(5) == [7, 9]
+
+    def test_of_keeps_an_instance(self):
+        hits = LineHits(_HITS)
+
+        assert LineHits.of(hits) is hits
+        assert LineHits.of(_HITS) == hits
+
+    def test_empty(self):
+        hits = LineHits({})
+
+        assert len(hits) == 0 and hits.covered_lines == 0
+        assert hits.executable_in(0) == []
+
+
+class TestRunContextTestId:
+    def test_run_phase_names_its_test(self):
+        assert run_context_test_id("tests/test_a.py::test_one|run") == _ONE
+        assert run_context_test_id("tests/test_a.py::TestB::test_three[x-1]|run") == _THREE
+
+    def test_global_and_fixture_phases_name_nothing(self):
+        assert run_context_test_id("") is None
+        assert run_context_test_id("tests/test_a.py::test_one|setup") is None
+        assert run_context_test_id("tests/test_a.py::test_one|teardown") is None
+
+
+class TestContextNormalizer:
+    def test_each_context_is_resolved_once(self):
+        normalize = ContextNormalizer()
+
+        assert normalize("tests/test_a.py::test_one|run") == _ONE
+        assert normalize("tests/test_a.py::test_one|setup") is None
+        assert normalize._test_ids == {
+            "tests/test_a.py::test_one|run": _ONE,
+            "tests/test_a.py::test_one|setup": None,
+        }
+
+    def test_equal_test_sets_are_shared(self):
+        normalize = ContextNormalizer()
+        first = normalize.tests(["tests/test_a.py::test_one|run"])
+        second = normalize.tests(
+            ["tests/test_a.py::test_two|setup", "tests/test_a.py::test_one|run"]
+        )
+
+        assert first == {_ONE}
+        assert first is second
+        assert normalize.tests([""]) == frozenset()
+
+
+class TestLineContexts:
+    def test_reads_like_the_dict(self):
+        contexts = LineContexts(_CONTEXTS)
+
+        assert contexts == _CONTEXTS
+        assert list(contexts) == [2, 4, 6, 9]
+        assert contexts[2] == _CONTEXTS[2]
+        assert contexts.get(3, []) == []
+
+    def test_context_strings_are_stored_once(self):
+        contexts = LineContexts(_CONTEXTS)
+
+        assert len(contexts.contexts) == 4
+        assert contexts[2][0] is contexts[4][0]
+
+    def test_count_lines_matching_asks_once_per_context(self):
+        asked: list[str] = []
+
+        def accept(ctx: str) -> bool:
+            asked.append(ctx)
+            return ctx.endswith("|run")
+
+        contexts = LineContexts(_CONTEXTS)
+
+        assert contexts.count_lines_matching(range(1, 10), accept) == 3
+        assert sorted(asked) == sorted(contexts.contexts)
+        assert contexts.count_lines_matching([9], accept) == 0
+
+    def test_tests_at(self):
+        contexts = LineContexts(_CONTEXTS)
+
+        assert contexts.tests_at(6) == {_ONE, _THREE}
+        assert contexts.tests_at(2) is contexts.tests_at(4)
+        assert contexts.tests_at(9) == frozenset()
+        assert contexts.tests_at(3) == frozenset()
+
+    def test_files_share_one_normalizer(self):
+        normalize = ContextNormalizer()
+        first = LineContexts(_CONTEXTS, normalize)
+        second = LineContexts({12: ["tests/test_a.py::test_one|run"]}, normalize)
+
+        assert first.tests_at(4) is second.tests_at(12)
+
+    def test_count_lines_tested_by(self):
+        contexts = LineContexts(_CONTEXTS)
+
+        assert contexts.count_lines_tested_by(range(1, 10), {_ONE}) == 3
+        assert contexts.count_lines_tested_by(range(1, 10), {_THREE, "test:other"}) == 1
+        assert contexts.count_lines_tested_by([9, 20], {_ONE}) == 0
+        assert contexts.count_lines_tested_by(range(1, 10), set()) == 0
+
+    def test_copy_and_pickle(self):
+        contexts = LineContexts(_CONTEXTS)
+        hits = LineHits(_HITS)
+
+        restored = pickle.loads(pickle.dumps(contexts))
+        assert restored == _CONTEXTS
+        assert restored.count_lines_tested_by(range(1, 10), {_THREE}) == 1
+        assert copy.deepcopy(hits) == _HITS
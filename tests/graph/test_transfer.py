@@ -0,0 +1,92 @@
+# Verifies: REQ-d00203-A
+"""Tests for pack_graph()/unpack_graph(), the process-transfer format."""
+
+import pickle
+
+import pytest
+
+from elspais.graph import NodeKind
+from elspais.graph.builder import TraceGraph
+from elspais.graph.GraphNode import GraphNode
+from elspais.graph.relations import EdgeKind
+from elspais.graph.transfer import pack_graph, unpack_graph
+
+
+@pytest.fixture
+def graph():
+    graph = TraceGraph(repo_root="/tmp/test")
+    prd = GraphNode(id="REQ-p00001", kind=NodeKind.REQUIREMENT, label="Parent")
+    prd._content = {"level": "PRD", "keywords": ["alpha"]}
+    dev = GraphNode(id="REQ-d00001", kind=NodeKind.REQUIREMENT, label="Child")
+    dev._content = {"level": "DEV"}
+    assertion = GraphNode(id="REQ-p00001-A", kind=NodeKind.ASSERTION, label="Shall")
+    for node in (prd, dev, assertion):
+        graph._index[node.id] = node
+    graph._roots.append(prd)
+    prd.link(assertion, EdgeKind.STRUCTURES)
+    prd.link(dev, EdgeKind.IMPLEMENTS, assertion_targets=["A"])
+    return graph
+
+
+class TestPackGraph:
+    def test_round_trip_keeps_nodes_and_content(self, graph):
+        uuid = graph.find_by_id("REQ-p00001").uuid
+        copy = unpack_graph(pack_graph(graph))
+
+        prd = copy.find_by_id("REQ-p00001")
+        assert copy.node_count() == graph.node_count()
+        assert prd.get_label() == "Parent"
+        assert prd.get_field("keywords") == ["alpha"]
+        assert prd.uuid == uuid
+        assert copy._roots == [prd]
+
+    def test_round_trip_keeps_edges_in_order(self, graph):
+        copy = unpack_graph(pack_graph(graph))
+
+        prd = copy.find_by_id("REQ-p00001")
+        dev = copy.find_by_id("REQ-d00001")
+        assert [c.id for c in prd.iter_children()] == ["REQ-p00001-A", "REQ-d00001"]
+        edge = next(dev.iter_incoming_edges())
+        assert edge.source is prd and edge.kind is EdgeKind.IMPLEMENTS
+        assert edge.assertion_targets == ["A"]
+        assert next(prd.iter_outgoing_edges()).target is copy.find_by_id("REQ-p00001-A")
+
+    def test_round_trip_keeps_file_placement(self, graph):
+        spec = GraphNode(id="file:REQ:spec/a.md", kind=NodeKind.FILE)
+        graph._index[spec.id] = spec
+        spec.link(graph.find_by_id("REQ-p00001"), EdgeKind.CONTAINS)
+
+        copy = unpack_graph(pack_graph(graph))
+
+        copy_spec = copy.find_by_id("file:REQ:spec/a.md")
+        assert copy.find_by_id("REQ-p00001-A").file_node() is copy_spec
+        assert copy.find_by_id("REQ-d00001").file_node() is None
+
+    def test_references_resolve_to_the_unpacked_nodes(self, graph):
+        prd = graph.find_by_id("REQ-p00001")
+        next(prd.iter_outgoing_edges()).metadata["peer"] = graph.find_by_id("REQ-d00001")
+
+        copy = unpack_graph(pack_graph(graph))
+
+        edge = next(copy.find_by_id("REQ-p00001").iter_outgoing_edges())
+        assert edge.metadata["peer"] is copy.find_by_id("REQ-d00001")
+
+    def test_long_chain_packs_without_recursion(self):
+        graph = TraceGraph(repo_root="/tmp/test")
+        prev = None
+        for i in range(5000):
+            node = GraphNode(id=f"REQ-d{i:05d}", kind=NodeKind.REQUIREMENT)
+            graph._index[node.id] = node
+            if prev is None:
+                graph._roots.append(node)
+            else:
+                prev.link(node, EdgeKind.IMPLEMENTS)
+            prev = node
+        with pytest.raises(RecursionError):
+            pickle.dumps(graph)
+
+        copy = unpack_graph(pack_graph(graph))
+
+        last = copy.find_by_id("REQ-d04999")
+        assert next(last.iter_parents()) is copy.find_by_id("REQ-d04998")
+        assert copy.node_count() == 5000
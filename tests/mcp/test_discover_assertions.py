@@ -4,7 +4,9 @@
 Validates REQ-o00065: Suggestion engine — assertion-level search and discovery.
 """
 
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -20,9 +22,30 @@ from elspais.mcp.server import _discover_assertions
 # ─────────────────────────────────────────────────────────────────────────────
 
 
-def _make_req(req_id: str, label: str, level: str, status: str = "Active") -> GraphNode:
+class _ReqNode(GraphNode):
+    """A requirement that can also hold edges outside its tree links.
+
+    GraphNode keeps every edge in its child and parent maps, so an edge
+    made with link() always makes its target a tree child.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._loose_out: list[Edge] = []
+        self._loose_in: list[Edge] = []
+
+    def iter_outgoing_edges(self) -> Iterator[Edge]:
+        yield from super().iter_outgoing_edges()
+        yield from self._loose_out
+
+    def iter_incoming_edges(self) -> Iterator[Edge]:
+        yield from super().iter_incoming_edges()
+        yield from self._loose_in
+
+
+def _make_req(req_id: str, label: str, level: str, status: str = "Active") -> _ReqNode:
     """Create a REQUIREMENT node with standard content fields."""
-    node = GraphNode(id=req_id, kind=NodeKind.REQUIREMENT, label=label)
+    node = _ReqNode(id=req_id, kind=NodeKind.REQUIREMENT, label=label)
     node._content = {"level": level, "status": status, "hash": f"h_{req_id}"}
     return node
 
@@ -34,12 +57,12 @@ def _make_assertion(assertion_id: str, label_field: str, text: str) -> GraphNode
     return node
 
 
-def _add_implements_edge(child: GraphNode, parent: GraphNode) -> None:
+def _add_implements_edge(child: _ReqNode, parent: _ReqNode) -> None:
     """Set up both tree structure and implements edge."""
     parent.link(child, EdgeKind.STRUCTURES)
     edge = Edge(source=child, target=parent, kind=EdgeKind.IMPLEMENTS)
-    child._outgoing_edges.append(edge)
-    parent._incoming_edges.append(edge)
+    child._loose_out.append(edge)
+    parent._loose_in.append(edge)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
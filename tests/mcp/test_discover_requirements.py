@@ -9,7 +9,9 @@ Validates REQ-d00079-A, REQ-d00079-B, REQ-d00079-C, REQ-d00079-D:
   DEV-level specification for _discover_requirements helper and MCP wrapper.
 """
 
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -22,9 +24,30 @@ from elspais.graph.relations import Edge, EdgeKind
 # ─────────────────────────────────────────────────────────────────────────────
 
 
-def _make_req(req_id: str, label: str, level: str, status: str = "Active") -> GraphNode:
+class _ReqNode(GraphNode):
+    """A requirement that can also hold edges outside its tree links.
+
+    GraphNode keeps every edge in its child and parent maps, so an edge
+    made with link() always makes its target a tree child.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._loose_out: list[Edge] = []
+        self._loose_in: list[Edge] = []
+
+    def iter_outgoing_edges(self) -> Iterator[Edge]:
+        yield from super().iter_outgoing_edges()
+        yield from self._loose_out
+
+    def iter_incoming_edges(self) -> Iterator[Edge]:
+        yield from super().iter_incoming_edges()
+        yield from self._loose_in
+
+
+def _make_req(req_id: str, label: str, level: str, status: str = "Active") -> _ReqNode:
     """Create a REQUIREMENT node with standard content fields."""
-    node = GraphNode(id=req_id, kind=NodeKind.REQUIREMENT, label=label)
+    node = _ReqNode(id=req_id, kind=NodeKind.REQUIREMENT, label=label)
     node._content = {"level": level, "status": status, "hash": f"h_{req_id}"}
     return node
 
@@ -36,17 +59,17 @@ def _make_assertion(assertion_id: str, label_field: str, text: str) -> GraphNode
     return node
 
 
-def _add_implements_edge(child: GraphNode, parent: GraphNode) -> None:
+def _add_implements_edge(child: _ReqNode, parent: _ReqNode) -> None:
     """Set up both tree structure and implements edge.
 
-    Uses add_child() for tree traversal (iter_children/iter_parents) and
-    manually creates an outgoing edge from child to parent for
+    Uses link() for tree traversal (iter_children/iter_parents) and
+    records an outgoing edge from child to parent, outside the tree, for
     _minimize_requirement_set() which walks iter_outgoing_edges().
     """
     parent.link(child, EdgeKind.STRUCTURES)
     edge = Edge(source=child, target=parent, kind=EdgeKind.IMPLEMENTS)
-    child._outgoing_edges.append(edge)
-    parent._incoming_edges.append(edge)
+    child._loose_out.append(edge)
+    parent._loose_in.append(edge)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
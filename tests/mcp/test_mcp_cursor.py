@@ -223,7 +223,7 @@ class TestOpenCursor:
         assert result["remaining"] == result["total"] - 1
 
     def test_REQ_o00068_D_new_cursor_replaces_previous(self, cursor_state):
-        """REQ-o00068-D: Open two cursors sequentially, verify second replaces first."""
+        """REQ-o00068-D: Open two cursors sequentially, verify the second is the default."""
         from elspais.mcp.server import _open_cursor
 
         _open_cursor(
@@ -618,3 +618,178 @@ class TestCursorFullWorkflow:
 
         # We should have collected total - 1 items via next (first was in open)
         assert len(collected_items) == total - 1
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Tests for lazy, revision-bound cursors - REQ-d00076-A, REQ-d00076-E
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class TestLazyCursor:
+    """Validates REQ-d00076-A, REQ-d00076-E: Items serialized per page, stale cursors refused."""
+
+    def test_REQ_d00076_E_only_the_read_items_are_serialized(self, cursor_state, monkeypatch):
+        """REQ-d00076-E: Opening serializes the first item, each next() its own page."""
+        import elspais.mcp.server as server
+
+        summarized: list[str] = []
+        summarize = server._compute_coverage_summary
+
+        def counting(node):
+            summarized.append(node.id)
+            return summarize(node)
+
+        monkeypatch.setattr(server, "_compute_coverage_summary", counting)
+
+        opened = server._open_cursor(
+            cursor_state, query="subtree", params={"root_id": "REQ-p00001"}, batch_size=0
+        )
+        assert summarized == ["REQ-p00001"]
+        assert opened["total"] == len(
+            server._materialize_cursor_items(
+                "subtree", {"root_id": "REQ-p00001"}, 0, cursor_state["graph"]
+            )
+        )
+
+        summarized.clear()
+        result = server._cursor_next(cursor_state, count=1)
+        assert summarized == [result["items"][0]["id"]]
+
+    def test_REQ_d00076_A_pages_match_the_materialized_items(self, cursor_state):
+        """REQ-d00076-A: Reading a cursor to the end yields the materialized items."""
+        from elspais.mcp.server import _cursor_next, _materialize_cursor_items, _open_cursor
+
+        for batch_size in (-1, 0, 1):
+            opened = _open_cursor(
+                cursor_state,
+                query="subtree",
+                params={"root_id": "REQ-p00001"},
+                batch_size=batch_size,
+            )
+            read = [opened["current"], *_cursor_next(cursor_state, count=100)["items"]]
+
+            assert read == _materialize_cursor_items(
+                "subtree", {"root_id": "REQ-p00001"}, batch_size, cursor_state["graph"]
+            )
+
+    def test_REQ_d00076_A_mutation_makes_the_cursor_stale(self, cursor_state):
+        """REQ-d00076-A: A cursor opened before a mutation is refused and closed."""
+        from elspais.mcp.server import _cursor_info, _cursor_next, _open_cursor
+
+        _open_cursor(cursor_state, query="subtree", params={"root_id": "REQ-p00001"}, batch_size=0)
+        cursor_state["graph"].update_title("REQ-o00010", "Operations Security")
+
+        result = _cursor_next(cursor_state, count=1)
+
+        assert result["success"] is False
+        assert result["stale"] is True
+        assert "cursor" not in cursor_state
+        assert "no active cursor" in _cursor_info(cursor_state)["error"].lower()
+
+    def test_REQ_d00076_A_replaced_graph_makes_the_cursor_stale(self, cursor_state):
+        """REQ-d00076-A: A cursor over a graph since replaced by a reload is refused."""
+        from elspais.graph.builder import TraceGraph
+        from elspais.mcp.server import _cursor_info, _open_cursor
+
+        _open_cursor(cursor_state, query="subtree", params={"root_id": "REQ-p00001"}, batch_size=0)
+        cursor_state["graph"] = TraceGraph(repo_root=Path("/test/repo"))
+
+        assert _cursor_info(cursor_state)["stale"] is True
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Tests for CursorRegistry - REQ-o00068-D, REQ-d00076-C
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _subtree(state, root_id: str = "REQ-p00001") -> dict:
+    from elspais.mcp.server import _open_cursor
+
+    return _open_cursor(state, query="subtree", params={"root_id": root_id}, batch_size=0)
+
+
+class TestCursorRegistry:
+    """Validates REQ-o00068-D, REQ-d00076-C: Named cursors with bounded lifetime."""
+
+    def test_REQ_o00068_D_cursors_page_independently(self, cursor_state):
+        """REQ-o00068-D: Two open cursors each keep their own position."""
+        from elspais.mcp.server import _cursor_info, _cursor_next
+
+        first = _subtree(cursor_state)
+        second = _subtree(cursor_state, "REQ-o00010")
+        assert first["cursor_id"] != second["cursor_id"]
+
+        paged = _cursor_next(cursor_state, count=1, cursor_id=first["cursor_id"])
+
+        assert paged["cursor_id"] == first["cursor_id"]
+        assert paged["items"][0]["id"] == "REQ-o00010"
+        assert _cursor_info(cursor_state, cursor_id=first["cursor_id"])["position"] == 2
+        assert _cursor_info(cursor_state, cursor_id=second["cursor_id"])["position"] == 1
+        # Without an id, the cursor opened last is read
+        assert _cursor_info(cursor_state)["cursor_id"] == second["cursor_id"]
+
+    def test_REQ_o00068_D_least_recently_used_is_evicted(self, cursor_state):
+        """REQ-o00068-D: Opening past max_open evicts the cursor read least recently."""
+        from elspais.mcp.server import CursorRegistry, _cursor_info
+
+        cursor_state["cursors"] = CursorRegistry(max_open=2)
+        first = _subtree(cursor_state)["cursor_id"]
+        second = _subtree(cursor_state)["cursor_id"]
+        _cursor_info(cursor_state, cursor_id=first)
+
+        third = _subtree(cursor_state)["cursor_id"]
+
+        assert _cursor_info(cursor_state, cursor_id=first)["success"] is True
+        assert _cursor_info(cursor_state, cursor_id=third)["success"] is True
+        evicted = _cursor_info(cursor_state, cursor_id=second)
+        assert evicted["success"] is False
+        assert second in evicted["error"]
+
+    def test_REQ_o00068_D_idle_cursor_expires(self, cursor_state):
+        """REQ-o00068-D: A cursor unread for longer than ttl is dropped."""
+        from elspais.mcp.server import CursorRegistry, _cursor_info
+
+        clock = _Clock()
+        cursor_state["cursors"] = CursorRegistry(ttl=60, clock=clock)
+        _subtree(cursor_state)
+
+        clock.now = 59
+        assert _cursor_info(cursor_state)["success"] is True
+        clock.now = 118
+        assert _cursor_info(cursor_state)["success"] is True
+        clock.now = 179
+        result = _cursor_info(cursor_state)
+
+        assert "no active cursor" in result["error"].lower()
+        assert "cursor" not in cursor_state
+
+    def test_REQ_d00076_C_held_items_are_bounded(self, cursor_state):
+        """REQ-d00076-C: Cursors past max_items held together are evicted, the new one kept."""
+        from elspais.mcp.server import CursorRegistry, _cursor_info
+
+        total = _subtree(cursor_state)["total"]
+        cursor_state["cursors"] = CursorRegistry(max_items=total)
+        first = _subtree(cursor_state)["cursor_id"]
+        second = _subtree(cursor_state)["cursor_id"]
+
+        info = _cursor_info(cursor_state, cursor_id=second)
+
+        assert info["open_cursors"] == 1
+        assert info["held_items"] == total
+        assert _cursor_info(cursor_state, cursor_id=first)["success"] is False
+
+    def test_REQ_d00076_C_limits_come_from_config(self):
+        """REQ-d00076-C: The [cursors] config section sets the registry's limits."""
+        from elspais.mcp.server import CursorRegistry
+
+        registry = CursorRegistry.from_config({"cursors": {"max_open": 3, "ttl": 0}})
+
+        assert (registry.max_open, registry.ttl, registry.max_items) == (3, 0, 1_000_000)
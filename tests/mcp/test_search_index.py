@@ -0,0 +1,170 @@
+# Validates REQ-d00061-A, REQ-d00061-L
+"""Tests for the inverted search index behind the MCP search tools."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from elspais.graph import GraphNode, NodeKind
+from elspais.graph.builder import TraceGraph
+from elspais.graph.relations import EdgeKind
+from elspais.mcp.search import parse_query, score_node
+from elspais.mcp.search_index import SearchIndex, search_index
+from elspais.mcp.server import _search
+from tests.core.graph_test_helpers import grammar_for
+
+
+def _make_req(
+    req_id: str, title: str, body: str = "", keywords: list[str] | None = None
+) -> GraphNode:
+    node = GraphNode(req_id, NodeKind.REQUIREMENT, title)
+    node._content = {"level": "DEV", "status": "Active", "hash": f"h_{req_id}"}
+    if body:
+        remainder = GraphNode(f"{req_id}::body", NodeKind.REMAINDER, "")
+        remainder.set_field("text", body)
+        edge = node.link(remainder, EdgeKind.STRUCTURES)
+        edge.metadata["render_order"] = 0.0
+    if keywords:
+        node.set_field("keywords", keywords)
+    return node
+
+
+@pytest.fixture
+def graph() -> TraceGraph:
+    login = _make_req(
+        "REQ-d00001",
+        "User Login",
+        body="Users authenticate with a password.\nSessions expire.",
+        keywords=["login", "session", "password policy"],
+    )
+    export = _make_req(
+        "REQ-d00002",
+        "Data Export",
+        body="Exports run nightly in CSV format.",
+        keywords=["export", "csv"],
+    )
+    audit = _make_req("REQ-d00003", "Audit Trail", keywords=["audit"])
+    assertion = GraphNode("REQ-d00003-A", NodeKind.ASSERTION, "SHALL log every login attempt")
+    audit.link(assertion, EdgeKind.STRUCTURES)
+
+    g = TraceGraph(repo_root=Path("/test/repo"), _resolver=grammar_for("REQ"))
+    g._roots = [login, export, audit]
+    g._index = {n.id: n for n in (login, export, audit, assertion)}
+    return g
+
+
+_QUERIES = [
+    "login",
+    "LOGIN",
+    "d00002",
+    "export OR audit",
+    "user password",
+    "=login",
+    "=log",
+    "-export",
+    "login -audit",
+    '"password policy"',
+    '"run nightly"',
+    '"runs nightly"',
+    "(csv OR session) expire",
+    "nothing-matches-this",
+    "ssw",
+]
+
+
+class TestSearchIndex:
+    @pytest.mark.parametrize("field", ["all", "id", "title", "keywords", "body"])
+    @pytest.mark.parametrize("query", _QUERIES)
+    def test_REQ_d00061_L_scores_as_score_node(
+        self, graph: TraceGraph, query: str, field: str
+    ) -> None:
+        parsed = parse_query(query)
+        score = search_index(graph).scorer(parsed, field)
+
+        for node in graph.all_nodes():
+            if node.kind in (NodeKind.REQUIREMENT, NodeKind.ASSERTION):
+                assert score(node) == score_node(node, parsed, field), node.id
+
+    def test_REQ_d00061_A_candidates_are_the_requirements_that_match(
+        self, graph: TraceGraph
+    ) -> None:
+        index = search_index(graph)
+
+        assert [n.id for n in index.query(parse_query("nightly")).requirements()] == ["REQ-d00002"]
+        assert index.query(parse_query("attempt"), "title").requirements() == []
+        assert [
+            n.id for n in index.query(parse_query("attempt"), "title").requirements(assertions=True)
+        ] == ["REQ-d00003"]
+
+    def test_REQ_d00061_A_unindexed_node_is_scored_directly(self) -> None:
+        node = _make_req("REQ-d00009", "Late Arrival")
+        score = SearchIndex([]).scorer(parse_query("arrival"))
+
+        assert score(node) == score_node(node, parse_query("arrival"))
+        assert score(node) > 0
+
+    def test_REQ_d00061_A_index_is_kept_between_searches(self, graph: TraceGraph) -> None:
+        index = search_index(graph)
+
+        assert [r["id"] for r in _search(graph, "password")] == ["REQ-d00001"]
+        assert [r["id"] for r in _search(graph, "export")] == ["REQ-d00002"]
+        assert search_index(graph) is index
+
+    def test_REQ_d00061_A_edited_title_is_searched(self, graph: TraceGraph) -> None:
+        assert _search(graph, "retention") == []
+
+        graph.update_title("REQ-d00003", "Audit Retention")
+
+        assert [r["id"] for r in _search(graph, "retention")] == ["REQ-d00003"]
+
+    def test_REQ_d00061_A_edit_reindexes_only_the_requirement_it_names(
+        self, graph: TraceGraph
+    ) -> None:
+        index = search_index(graph)
+        login = index._fields[index._rows[graph.find_by_id("REQ-d00001")]]
+
+        graph.update_assertion("REQ-d00003-A", "SHALL log every export")
+
+        assert search_index(graph) is index
+        assert index._fields[index._rows[graph.find_by_id("REQ-d00001")]] is login
+        assert [r["id"] for r in _search(graph, "every export")] == ["REQ-d00003"]
+
+    @pytest.mark.parametrize(
+        "edit",
+        [
+            lambda g: g.add_requirement("REQ-d00004", "Nightly Login Report", "DEV"),
+            lambda g: g.delete_requirement("REQ-d00003"),
+            lambda g: g.rename_node("REQ-d00001", "REQ-d00009"),
+            lambda g: g.add_assertion("REQ-d00002", "SHALL export every session"),
+            lambda g: g.update_title("REQ-d00002", "Session Export"),
+        ],
+    )
+    def test_REQ_d00061_L_refreshed_index_scores_as_a_fresh_one(
+        self, graph: TraceGraph, edit: Callable[[TraceGraph], object]
+    ) -> None:
+        index = search_index(graph)
+
+        for undo in (False, True):
+            if undo:
+                graph.undo_last()
+            else:
+                edit(graph)
+            assert search_index(graph) is index
+            fresh = SearchIndex(
+                [
+                    *graph.nodes_by_kind(NodeKind.REQUIREMENT),
+                    *graph.nodes_by_kind(NodeKind.ASSERTION),
+                ]
+            )
+            assert len(index) == len(fresh)
+            for query in _QUERIES:
+                parsed = parse_query(query)
+                refreshed, rebuilt = index.query(parsed), fresh.query(parsed)
+                assert refreshed.requirements(assertions=True) == rebuilt.requirements(
+                    assertions=True
+                ), query
+                for node in graph.all_nodes():
+                    assert refreshed.score(node) == rebuilt.score(node), (query, node.id)
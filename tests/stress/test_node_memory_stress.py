@@ -0,0 +1,72 @@
+# Verifies: REQ-d00127-A
+"""Memory footprint of a federation-sized node population.
+
+Builds 200k nodes shaped like a federated repo -- each FILE holds a
+REQUIREMENT with two ASSERTIONs and a spread of CODE / TEST / RESULT /
+REMAINDER leaves -- and measures the bytes traced per node, ids and edges
+included. The slotted, lazily-allocated layout with dict adjacency sits
+near 590 bytes/node on CPython 3.11, where the dataclass layout with
+plain lists measured near 890.
+
+Scale with ``ELSPAIS_STRESS_SCALE`` like the rest of the stress tier.
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+import tracemalloc
+
+import pytest
+
+from elspais.graph import GraphNode, NodeKind
+from elspais.graph.relations import EdgeKind
+
+pytestmark = [pytest.mark.stress]
+
+SCALE = float(os.environ.get("ELSPAIS_STRESS_SCALE", "1.0"))
+NODE_COUNT = max(1_000, int(200_000 * SCALE))
+# Headroom over the measured figure for interpreter and allocator drift,
+# still well under the dataclass layout it replaced.
+BYTES_PER_NODE_BUDGET = 650
+
+_LEAF_KINDS = (
+    NodeKind.CODE,
+    NodeKind.TEST,
+    NodeKind.RESULT,
+    NodeKind.REMAINDER,
+    NodeKind.CODE,
+    NodeKind.TEST,
+)
+
+
+def _build_population(count: int) -> list[GraphNode]:
+    nodes: list[GraphNode] = []
+    i = 0
+    while len(nodes) < count:
+        file_node = GraphNode(id=f"file:ns:src/mod{i}.py", kind=NodeKind.FILE)
+        req = GraphNode(id=f"REQ-d{i:05d}", kind=NodeKind.REQUIREMENT, label="Requirement")
+        file_node.link(req, EdgeKind.CONTAINS)
+        nodes += [file_node, req]
+        for label in "AB":
+            assertion = GraphNode(id=f"REQ-d{i:05d}-{label}", kind=NodeKind.ASSERTION)
+            req.link(assertion, EdgeKind.STRUCTURES)
+            nodes.append(assertion)
+        for n, kind in enumerate(_LEAF_KINDS):
+            nodes.append(GraphNode(id=f"{kind.value}:ns:src/mod{i}.py:{n}", kind=kind))
+        i += 1
+    return nodes
+
+
+def test_bytes_per_node_within_budget():
+    gc.collect()
+    tracemalloc.start()
+    try:
+        nodes = _build_population(NODE_COUNT)
+        traced, _peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    per_node = traced / len(nodes)
+    print(f"\n{len(nodes)} nodes: {per_node:.0f} bytes/node")
+    assert per_node < BYTES_PER_NODE_BUDGET